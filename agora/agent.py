@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Optional, Iterator
+from typing import Optional, Iterator, AsyncIterator
 
 from agora.providers.base import LLMProvider
+from agora.transcript import Transcript
 
 
 class Agent:
@@ -15,52 +16,76 @@ class Agent:
         self.role = role
         self.color = color
         self.provider = provider or LLMProvider.resolve("anthropic")
+        # Token usage of this agent's most recent turn (see LLMProvider.last_usage)
+        self.last_usage: Optional[dict] = None
 
     def respond(self, topic: str, round_num: int, total_rounds: int, history: list[dict]) -> str:
         """Generate a response given the debate history."""
-        system = self._system_prompt(round_num, total_rounds)
-        messages = self._build_messages(topic, round_num, history)
-        return self.provider.complete(system, messages)
+        messages = self._build_messages(topic, round_num, total_rounds, history)
+        LLMProvider.reset_usage()
+        text = self.provider.complete(self._system_prompt(), messages)
+        self.last_usage = LLMProvider.last_usage()
+        return text
 
     def respond_stream(self, topic: str, round_num: int, total_rounds: int, history: list[dict]) -> Iterator[str]:
         """Generate a streaming response. Yields text chunks."""
-        system = self._system_prompt(round_num, total_rounds)
-        messages = self._build_messages(topic, round_num, history)
-        return self.provider.stream(system, messages)
+        messages = self._build_messages(topic, round_num, total_rounds, history)
+        LLMProvider.reset_usage()
+        yield from self.provider.stream(self._system_prompt(), messages)
+        self.last_usage = LLMProvider.last_usage()
 
-    def _system_prompt(self, round_num: int, total_rounds: int) -> str:
+    async def arespond(self, topic: str, round_num: int, total_rounds: int, history: list[dict]) -> str:
+        """Async variant of ``respond``."""
+        messages = self._build_messages(topic, round_num, total_rounds, history)
+        LLMProvider.reset_usage()
+        text = await self.provider.acomplete(self._system_prompt(), messages)
+        self.last_usage = LLMProvider.last_usage()
+        return text
+
+    async def arespond_stream(self, topic: str, round_num: int, total_rounds: int, history: list[dict]) -> AsyncIterator[str]:
+        """Async variant of ``respond_stream``. Yields text chunks."""
+        messages = self._build_messages(topic, round_num, total_rounds, history)
+        LLMProvider.reset_usage()
+        async for chunk in self.provider.astream(self._system_prompt(), messages):
+            yield chunk
+        self.last_usage = LLMProvider.last_usage()
+
+    def _system_prompt(self) -> str:
+        # Kept identical across rounds so providers can cache it; the round
+        # number lives in the final user block instead.
         return (
             f"You are '{self.name}' in a structured debate.\n"
             f"Your persona: {self.role}\n\n"
             f"Rules:\n"
-            f"- This is round {round_num} of {total_rounds}.\n"
             f"- Be concise but substantive (2-4 paragraphs max).\n"
             f"- You may challenge, agree with, or build on what others said.\n"
             f"- Stay in character at all times.\n"
             f"- Refer to other agents by name when responding to their points."
         )
 
-    def _build_messages(self, topic: str, round_num: int, history: list[dict]) -> list[dict]:
-        """Build the message list from debate history."""
+    def _build_messages(self, topic: str, round_num: int, total_rounds: int, history: list[dict]) -> list[dict]:
+        """Build the message list from debate history.
+
+        The transcript is sent as one text block per turn, so each prompt is
+        the previous prompt's blocks plus the new turns. The last transcript
+        block carries a ``cache`` marker: everything up to it is a stable
+        prefix that cache-aware providers can reuse on the next turn.
+        """
         if not history:
             return [{
                 "role": "user",
-                "content": f"The debate topic is: \"{topic}\"\n\nYou are the first to speak in round 1. Present your opening position.",
+                "content": (
+                    f"The debate topic is: \"{topic}\"\n\n"
+                    f"This is round 1 of {total_rounds}. You are the first to speak in round 1. Present your opening position."
+                ),
             }]
 
-        transcript = self._format_history(history)
-        return [{
-            "role": "user",
-            "content": (
-                f"The debate topic is: \"{topic}\"\n\n"
-                f"Here is the debate so far:\n\n{transcript}\n\n"
-                f"It is now round {round_num}. Respond to the other agents' arguments."
-            ),
-        }]
-
-    @staticmethod
-    def _format_history(history: list[dict]) -> str:
-        lines = []
-        for entry in history:
-            lines.append(f"[Round {entry['round']}] {entry['agent']}:\n{entry['text']}\n")
-        return "\n".join(lines)
+        transcript = Transcript.of(history)
+        blocks = [{"type": "text", "text": f"The debate topic is: \"{topic}\"\n\nHere is the debate so far:\n\n"}]
+        blocks.extend({"type": "text", "text": segment} for segment in transcript.prompt_segments())
+        blocks[-1]["cache"] = True
+        blocks.append({
+            "type": "text",
+            "text": f"It is now round {round_num} of {total_rounds}. Respond to the other agents' arguments.",
+        })
+        return [{"role": "user", "content": blocks}]
@@ -0,0 +1,165 @@
+"""Run many debates from a topic file with a bounded worker pool."""
+
+from __future__ import annotations
+
+import csv
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from agora.debate import debate_fingerprint, run_debate
+from agora.personas import resolve_participants
+from agora.providers.base import LLMProvider, parse_backend
+
+
+def load_jobs(path: str) -> list[dict]:
+    """Read debate jobs from a JSONL or CSV file.
+
+    Every job needs a ``topic``; ``preset``, ``agents`` and ``rounds`` are
+    optional per-topic overrides.
+    """
+    file = Path(path)
+    with open(file, encoding="utf-8", newline="") as f:
+        if file.suffix.lower() == ".csv":
+            rows = [dict(row) for row in csv.DictReader(f)]
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+
+    jobs = []
+    for i, row in enumerate(rows, start=1):
+        topic = (row.get("topic") or "").strip()
+        if not topic:
+            raise ValueError(f"{file.name}: entry {i} has no topic")
+        jobs.append({
+            "topic": topic,
+            "preset": row.get("preset") or None,
+            "agents": str(row["agents"]) if row.get("agents") else None,
+            "rounds": int(row["rounds"]) if row.get("rounds") else None,
+        })
+    return jobs
+
+
+def run_batch(
+    jobs: list[dict],
+    agents: str = "3",
+    rounds: int = 3,
+    preset: Optional[str] = None,
+    model: Optional[str] = None,
+    provider_name: str = "anthropic",
+    output_dir: str = "reports",
+    workers: int = 4,
+    parallel: bool = False,
+    cache: Optional[str] = None,
+    fallback: Optional[list[str]] = None,
+    hedge_after: Optional[float] = None,
+    moderator: Optional[str] = None,
+    reuse: bool = False,
+    on_result: Optional[Callable[[dict], None]] = None,
+) -> str:
+    """Run every job concurrently and return the path to the summary index.
+
+    All debates share one provider instance and render nothing. A failing
+    topic is recorded in the index instead of aborting the batch.
+    ``on_result`` is called with each job's result as it finishes.
+    ``moderator`` ("provider[:model]") overrides every preset's moderator.
+    With ``reuse`` topics that already ran (see ``run_debate``) return their
+    archived report, and repeats of a topic within the batch run only once.
+    """
+    llm = LLMProvider.resolve(provider_name, model=model, cache=cache, fallback=fallback, hedge_after=hedge_after)
+    # Fingerprint -> the report of the first job with it, for reuse
+    debates: dict[str, Future] = {}
+    lock = threading.Lock()
+
+    def run_job(job: dict) -> dict:
+        started = time.monotonic()
+        result = {"topic": job["topic"], "status": "ok", "report": None, "error": None}
+        try:
+            agent_configs, moderator_config = resolve_participants(
+                job.get("preset") or preset, job.get("agents") or agents, allow_paths=True
+            )
+            if moderator:
+                moderator_config = dict(zip(("provider", "model"), parse_backend(moderator)))
+            settings = dict(
+                rounds=job.get("rounds") or rounds,
+                model=model,
+                provider_name=provider_name,
+                parallel=parallel,
+                moderator_config=moderator_config,
+            )
+
+            def debate() -> str:
+                return run_debate(
+                    job["topic"], agent_configs, output_dir=output_dir, stream=False, provider=llm,
+                    display="none", reuse=reuse, **settings,
+                )
+
+            if reuse:
+                fingerprint = debate_fingerprint(job["topic"], agent_configs, **settings)
+                result["report"] = _run_once(debates, lock, fingerprint, debate)
+            else:
+                result["report"] = debate()
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = f"{type(e).__name__}: {e}"
+        result["seconds"] = round(time.monotonic() - started, 2)
+        return result
+
+    results = [None] * len(jobs)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(run_job, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if on_result:
+                on_result(future.result())
+
+    return _save_index(results, provider_name, llm.display_name, output_dir)
+
+
+def _run_once(results: dict[str, Future], lock: threading.Lock, key: str, fn: Callable[[], str]) -> str:
+    """``fn()``, unless a job with the same ``key`` ran or is running; then wait for and return its result."""
+    with lock:
+        future = results.get(key)
+        first = future is None
+        if first:
+            future = results[key] = Future()
+    if first:
+        try:
+            future.set_result(fn())
+        except Exception as e:
+            future.set_exception(e)
+    return future.result()
+
+
+def _save_index(results: list[dict], provider_name: str, model_label: str, output_dir: str) -> str:
+    """Write a Markdown summary plus a JSON copy for scripts. Returns the Markdown path."""
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = out / f"batch_{timestamp}.md"
+    failed = sum(1 for r in results if r["status"] != "ok")
+
+    lines = [
+        "# Batch Summary",
+        "",
+        f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        f"**Provider:** {provider_name}/{model_label}",
+        f"**Debates:** {len(results)} ({len(results) - failed} ok, {failed} failed)",
+        "",
+        "| # | Topic | Status | Seconds | Report / Error |",
+        "|---|-------|--------|---------|----------------|",
+    ]
+    for i, r in enumerate(results, start=1):
+        detail = Path(r["report"]).name if r["report"] else r["error"]
+        topic = r["topic"].replace("|", "\\|")
+        detail = (detail or "").replace("|", "\\|").replace("\n", " ")
+        lines.append(f"| {i} | {topic} | {r['status']} | {r['seconds']} | {detail} |")
+    lines.append("")
+
+    path.write_text("\n".join(lines), encoding="utf-8")
+    path.with_suffix(".json").write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return str(path)
@@ -0,0 +1,286 @@
+"""Benchmarks for agora itself, driven by the offline mock provider (no API calls).
+
+Every benchmark returns a JSON-serializable dict; ``run_benchmarks`` collects
+them with enough context (versions, NumPy, settings) to compare runs over time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import itertools
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Optional
+
+# CLI invocations timed by the startup benchmark; "python" alone is the bare
+# interpreter, so the difference is what agora adds
+STARTUP_COMMANDS = {
+    "python": None,
+    "agora --help": ["--help"],
+    "agora presets": ["presets"],
+    "agora providers": ["providers"],
+    "agora run --help": ["run", "--help"],
+}
+
+# Mock responses used throughout: ~150 tokens, no delays or failures unless given
+MOCK_SETTINGS = {"tokens": 150, "ttft": 0.0, "chunk_rate": 0.0, "latency": 0.0, "error_rate": 0.0, "stream_error_rate": 0.0}
+
+# 512 made-up six-letter words for synthetic turns, so keyword overlap varies
+_SYLLABLES = ("ka", "lo", "mi", "ne", "ru", "ta", "ve", "zo")
+_VOCABULARY = ["".join(parts) for parts in itertools.product(_SYLLABLES, repeat=3)]
+
+
+def bench_startup(repeat: int = 10) -> dict:
+    """Wall time of fresh ``python -m agora ...`` processes, in milliseconds.
+
+    Every command runs ``repeat`` times; ``overhead_ms`` is the median minus
+    the bare interpreter's median.
+    """
+    results = {}
+    for label, args in STARTUP_COMMANDS.items():
+        command = [sys.executable, "-c", "pass"] if args is None else [sys.executable, "-m", "agora", *args]
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            timings.append((time.perf_counter() - started) * 1000)
+        results[label] = {
+            "min_ms": round(min(timings), 1),
+            "median_ms": round(statistics.median(timings), 1),
+        }
+    baseline = results["python"]["median_ms"]
+    for stats in results.values():
+        stats["overhead_ms"] = round(stats["median_ms"] - baseline, 1)
+    return {"repeat": repeat, "commands": results}
+
+
+def bench_turns(rounds: int = 3, agents: int = 4, repeat: int = 3) -> dict:
+    """Orchestration cost per turn of a whole ``run_debate`` with instant responses.
+
+    ``provider_ms_per_call`` is what generating the mock text alone costs;
+    ``overhead_ms_per_turn`` is everything else (prompt building, consensus,
+    checkpoints, renderer hooks, the report) spread over the calls.
+    """
+    from agora.debate import run_debate
+    from agora.personas import make_neutral_agents
+    from agora.providers.mock import MockProvider
+
+    provider = MockProvider(**MOCK_SETTINGS)
+    configs = make_neutral_agents(agents)
+    calls = rounds * agents + 1  # plus the moderator's synthesis
+    modes = {
+        "sequential": {"stream": False},
+        "streaming": {"stream": True},
+        "parallel": {"stream": False, "parallel": True},
+        "checkpointed": {"stream": False, "checkpoint": True},
+    }
+    results = {}
+    for mode, options in modes.items():
+        def debate() -> None:
+            with tempfile.TemporaryDirectory() as tmp:
+                run_debate(
+                    "Should cities ban cars from their centers?", configs, rounds=rounds, provider=provider,
+                    provider_name="mock", output_dir=tmp, stream=options["stream"],
+                    parallel=options.get("parallel", False), display="none", archive=False,
+                    checkpoint=f"{tmp}/checkpoint.json" if options.get("checkpoint") else None,
+                )
+
+        timing = _time(debate, repeat)
+        results[mode] = {"ms_per_debate": timing["median_ms"], "ms_per_turn": round(timing["median_ms"] / calls, 3)}
+
+    prompt = [{"role": "user", "content": "Should cities ban cars from their centers? " * 20}]
+    provider_ms = _time(lambda: provider.complete("system", prompt), repeat=50)["median_ms"]
+    for stats in results.values():
+        stats["overhead_ms_per_turn"] = round(stats["ms_per_turn"] - provider_ms, 3)
+    return {"rounds": rounds, "agents": agents, "provider_ms_per_call": provider_ms, "modes": results}
+
+
+def bench_transcript(sizes: tuple = ((3, 4), (10, 8), (30, 16)), repeat: int = 20) -> dict:
+    """``Agent._build_messages`` for the last turn of debates of growing size (rounds x agents)."""
+    from agora.agent import Agent
+    from agora.providers.mock import MockProvider
+    from agora.transcript import Transcript
+
+    agent = Agent("Bench", "A benchmark participant.", provider=MockProvider(**MOCK_SETTINGS))
+    results = {}
+    for rounds, agents in sizes:
+        entries = _synthetic_history(rounds, agents)
+        history = Transcript(entries)
+        results[f"{rounds}x{agents}"] = {
+            "turns": len(entries),
+            "transcript_ms": _time(lambda: agent._build_messages("Topic", rounds, rounds, history), repeat)["median_ms"],
+            # A plain list is wrapped in a new Transcript on every call
+            "plain_list_ms": _time(lambda: agent._build_messages("Topic", rounds, rounds, entries), repeat)["median_ms"],
+        }
+    return {"sizes": results}
+
+
+def bench_consensus(panels: tuple = (4, 16, 64, 256), repeat: int = 5) -> dict:
+    """Keyword consensus for one round of ``panels`` agents: indexing the turns, then scoring."""
+    from agora.consensus import ConsensusEngine, np
+    from agora.debate import calculate_consensus
+
+    results = {}
+    for agents in panels:
+        history = _synthetic_history(1, agents)
+        engine = ConsensusEngine.from_history(history)
+        results[str(agents)] = {
+            "index_ms": _time(lambda: ConsensusEngine.from_history(history), repeat)["median_ms"],
+            "score_ms": _time(lambda: engine.score(1), repeat)["median_ms"],
+            "calculate_consensus_ms": _time(lambda: calculate_consensus(history, 1), repeat)["median_ms"],
+        }
+    return {"numpy": np is not None, "panels": results}
+
+
+def bench_render(chunks: int = 2000, chunks_per_refresh: int = 6) -> dict:
+    """CPU time per streamed chunk for each output backend.
+
+    The Rich panel is redrawn every ``chunks_per_refresh`` chunks, as at
+    ~50 chunks/s with Rich's 8 refreshes a second; all output goes to memory.
+    """
+    from rich.console import Console
+
+    from agora.renderer import JsonRenderer, PlainRenderer, Renderer, StreamingPanel
+
+    rng = random.Random(0)
+    chunk_list = [rng.choice(_VOCABULARY) + ("\n\n" if i % 60 == 59 else " ") for i in range(chunks)]
+    results = {}
+
+    console = Console(file=io.StringIO(), force_terminal=True, width=100)
+    panel = StreamingPanel("Bench", "cyan")
+    started = time.process_time()
+    for i, chunk in enumerate(chunk_list):
+        panel.append(chunk)
+        if i % chunks_per_refresh == 0:
+            console.print(panel)
+    console.print(panel.final())
+    results["rich"] = _per_chunk(time.process_time() - started, chunks)
+
+    views = {"plain": PlainRenderer(io.StringIO()), "json": JsonRenderer(io.StringIO()), "none": Renderer()}
+    for name, view in views.items():
+        started = time.process_time()
+        for chunk in chunk_list:
+            view.turn_chunk("Bench", 1, chunk)
+        view.agent_response("Bench", "".join(chunk_list))
+        results[name] = _per_chunk(time.process_time() - started, chunks)
+    return {"chunks": chunks, "chunks_per_refresh": chunks_per_refresh, "backends": results}
+
+
+def bench_concurrency(
+    concurrency: tuple = (1, 8, 32), rounds: int = 2, agents: int = 3, ttft: float = 0.05, chunk_rate: float = 500.0,
+) -> dict:
+    """End-to-end debates per second when many run at once.
+
+    Responses take ``ttft`` seconds plus 150 tokens at ``chunk_rate``, so
+    the numbers show how well overlapping debates hide API latency, both
+    with asyncio (``arun_debate`` on one loop) and with a thread per debate.
+    """
+    from agora.debate import arun_debate, run_debate
+    from agora.personas import make_neutral_agents
+    from agora.providers.mock import MockProvider
+
+    provider = MockProvider(**{**MOCK_SETTINGS, "ttft": ttft, "chunk_rate": chunk_rate})
+    configs = make_neutral_agents(agents)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        options = dict(
+            rounds=rounds, provider=provider, provider_name="mock", output_dir=tmp, display="none", archive=False,
+        )
+
+        async def debates(count: int) -> None:
+            await asyncio.gather(*(arun_debate(f"Topic {i}", configs, **options) for i in range(count)))
+
+        for count in concurrency:
+            started = time.perf_counter()
+            asyncio.run(debates(count))
+            async_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=count) as pool:
+                list(pool.map(lambda i: run_debate(f"Topic {i}", configs, **options), range(count)))
+            thread_seconds = time.perf_counter() - started
+
+            results[str(count)] = {
+                "asyncio_debates_per_second": round(count / async_seconds, 2),
+                "threads_debates_per_second": round(count / thread_seconds, 2),
+            }
+    return {"rounds": rounds, "agents": agents, "ttft": ttft, "chunk_rate": chunk_rate, "concurrency": results}
+
+
+BENCHMARKS: dict[str, Callable[..., dict]] = {
+    "startup": bench_startup,
+    "turns": bench_turns,
+    "transcript": bench_transcript,
+    "consensus": bench_consensus,
+    "render": bench_render,
+    "concurrency": bench_concurrency,
+}
+
+# Smaller settings for a fast smoke run, e.g. on every CI build
+QUICK = {
+    "startup": {"repeat": 3},
+    "turns": {"repeat": 1},
+    "transcript": {"sizes": ((3, 4), (10, 8)), "repeat": 5},
+    "consensus": {"panels": (4, 16, 64), "repeat": 3},
+    "render": {"chunks": 500},
+    "concurrency": {"concurrency": (1, 8)},
+}
+
+
+def run_benchmarks(names: Optional[list[str]] = None, quick: bool = False) -> dict:
+    """Run the benchmarks called ``names`` (default: all) and return one JSON-ready result."""
+    from agora import __version__
+
+    names = names or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark '{name}'. Available: {', '.join(BENCHMARKS)}")
+    results = {}
+    for name in names:
+        started = time.perf_counter()
+        results[name] = BENCHMARKS[name](**(QUICK[name] if quick else {}))
+        results[name]["seconds"] = round(time.perf_counter() - started, 2)
+    return {
+        "agora": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def _time(fn: Callable[[], object], repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {"min_ms": round(min(timings), 3), "median_ms": round(statistics.median(timings), 3)}
+
+
+def _per_chunk(cpu_seconds: float, chunks: int) -> dict:
+    return {"cpu_ms": round(cpu_seconds * 1000, 2), "cpu_us_per_chunk": round(cpu_seconds * 1_000_000 / chunks, 2)}
+
+
+def _synthetic_history(rounds: int, agents: int, words: int = 150) -> list[dict]:
+    """History entries of ``words`` random vocabulary words each, the same on every call."""
+    rng = random.Random(0)
+    return [
+        {"round": r, "agent": f"Agent {a + 1}", "text": " ".join(rng.choices(_VOCABULARY, k=words)) + "."}
+        for r in range(1, rounds + 1)
+        for a in range(agents)
+    ]
+
+
+if __name__ == "__main__":
+    print(json.dumps(run_benchmarks(sys.argv[1:] or None), indent=2))
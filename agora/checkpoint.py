@@ -0,0 +1,71 @@
+"""Debate state saved after every turn so an interrupted debate can be resumed."""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+VERSION = 1
+
+
+def save_checkpoint(
+    path: str,
+    config: dict,
+    history,
+    scores: list[float],
+    moderator_calls: list[dict],
+    stop_reason: Optional[str],
+    elapsed: float,
+    report: Optional[str] = None,
+) -> None:
+    """Atomically write the debate's arguments and progress to ``path``.
+
+    ``history`` is the debate's ``Transcript``; its entries and round
+    summaries are stored so resuming needs no extra LLM calls. A checkpoint
+    with a ``report`` belongs to a finished debate.
+    """
+    state = {
+        "version": VERSION,
+        "status": "done" if report else "running",
+        "updated": datetime.now().isoformat(timespec="seconds"),
+        "config": config,
+        "history": list(history.entries),
+        "summaries": history.summaries,
+        "scores": scores,
+        "stop_reason": stop_reason,
+        "moderator_calls": moderator_calls,
+        "elapsed": round(elapsed, 3),
+        "report": report,
+    }
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename, so a crash mid-write never leaves a truncated checkpoint
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_text(json.dumps(state, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, target)
+
+
+def load_checkpoint(path: str) -> dict:
+    """Read a checkpoint written by ``save_checkpoint``."""
+    state = json.loads(Path(path).read_text(encoding="utf-8"))
+    if state.get("version") != VERSION:
+        raise ValueError(f"{path} is not an agora checkpoint (version {state.get('version')!r})")
+    # JSON object keys are strings
+    state["summaries"] = {int(r): summary for r, summary in state["summaries"].items()}
+    return state
+
+
+def discard_checkpoint(path: str) -> None:
+    """Delete a finished debate's checkpoint, and its directory if that is now empty.
+
+    The report and the archive hold everything a finished checkpoint did.
+    """
+    try:
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+    except OSError:
+        # Not written (e.g. a reused report) or the directory holds other checkpoints
+        pass
@@ -4,34 +4,46 @@ from __future__ import annotations
 
 import os
 import sys
+from contextlib import contextmanager
 from typing import Optional
 
 import click
-from dotenv import load_dotenv
 from rich.console import Console
 
-from agora.personas import list_presets, load_preset, make_neutral_agents, parse_agent_spec
-from agora.debate import run_debate
+# Everything else is imported inside the commands that need it: scripts call
+# cheap subcommands like `agora presets` often, and the debate engine, YAML
+# and the provider SDKs would otherwise dominate their startup time.
 
 console = Console()
 
+REPLAY_MISS_HINT = "Re-record the debate with --cache auto."
+
 PROVIDER_HELP = """LLM provider to use:
   anthropic  — Claude (default). Needs ANTHROPIC_API_KEY
   openai     — GPT. Needs OPENAI_API_KEY
   gemini     — Google Gemini. Needs GOOGLE_API_KEY
-  grok       — xAI Grok. Needs XAI_API_KEY"""
+  grok       — xAI Grok. Needs XAI_API_KEY
+  mock       — Offline synthetic text for benchmarks (AGORA_MOCK_* settings)"""
+
+CACHE_HELP = """Record and replay LLM responses (~/.cache/agora/responses.sqlite):
+  auto    replay when recorded, otherwise call the API and record
+  record  always call the API and overwrite recordings
+  replay  only replay; fail on requests that were never recorded"""
 
 MODEL_HELP = """Model to use (provider-specific):
   Anthropic: haiku, sonnet (default), opus
   OpenAI: gpt4o (default), gpt4o-mini, o1, o3-mini
   Gemini: flash (default), pro, thinking
-  Grok: grok (default), grok-mini"""
+  Grok: grok (default), grok-mini
+  Mock: any name (seeds the generated text)"""
 
 
 @click.group()
 @click.version_option(package_name="agora-debate")
 def cli():
     """agora - Multi-agent debate framework powered by AI."""
+    from dotenv import load_dotenv
+
     load_dotenv()
 
 
@@ -39,27 +51,35 @@ def cli():
 @click.option("--topic", required=True, help="The debate topic or question.")
 @click.option("--agents", default="3", help="Comma-separated agent names or a number for neutral agents.")
 @click.option("--rounds", default=3, type=int, help="Number of debate rounds.")
-@click.option("--preset", default=None, help="Use a built-in persona preset (e.g. investor_panel).")
+@click.option("--preset", default=None, help="Use a persona preset (e.g. investor_panel, see agora presets) or a preset YAML file.")
 @click.option("--provider", default="anthropic", help=PROVIDER_HELP)
 @click.option("--model", default=None, help=MODEL_HELP)
 @click.option("--output", default="reports", help="Directory to save the report.")
 @click.option("--no-stream", is_flag=True, help="Disable streaming output.")
-def run(topic: str, agents: str, rounds: int, preset: Optional[str], provider: str, model: Optional[str], output: str, no_stream: bool):
+@click.option("--parallel", is_flag=True, help="Let all agents in a round respond simultaneously.")
+@click.option("--history-window", default=None, type=click.IntRange(min=0), help="Keep only the last N rounds verbatim; summarize older ones.")
+@click.option("--token-budget", default=None, type=click.IntRange(min=1), help="Summarize old rounds until the transcript fits this many tokens.")
+@click.option("--consensus", "consensus_method", default="keyword", type=click.Choice(["keyword", "semantic"]), help="How to score agreement each round: word overlap or embedding similarity.")
+@click.option("--cache", default=None, type=click.Choice(["auto", "record", "replay"]), help=CACHE_HELP)
+@click.option("--fallback", default=None, help="Comma-separated provider[:model] backends to fail over to when a call errors, e.g. openai:gpt4o,gemini:flash. Slow backends are only skipped with --hedge-after.")
+@click.option("--hedge-after", default=None, type=click.FloatRange(min=0), help="Also send a turn to the next backend if it has not started answering after this many seconds.")
+@click.option("--moderator", "moderator_backend", default=None, help="provider[:model] for the moderator (default: the preset's, else --provider).")
+@click.option("--stop-at", default=None, type=click.FloatRange(0, 1), help="End early once the consensus score reaches this value (0-1).")
+@click.option("--stop-epsilon", default=None, type=click.FloatRange(min=0), help="End early once consensus changes less than this for --stop-patience rounds in a row.")
+@click.option("--stop-patience", default=2, type=click.IntRange(min=1), help="Rounds of stalled consensus before --stop-epsilon ends the debate.")
+@click.option("--format", "output_format", default="rich", type=click.Choice(["rich", "plain", "json", "none"]), help="Output style: rich terminal UI, plain text, JSON-lines events, or nothing.")
+@click.option("--checkpoint", default=None, type=click.Path(dir_okay=False), help="Save progress to this file after every turn and keep it (default: a file in <output>/checkpoints/, deleted once the report is saved).")
+@click.option("--no-archive", is_flag=True, help="Do not add the finished debate to the searchable archive (agora search).")
+@click.option("--reuse", is_flag=True, help="Return the report of an identical earlier debate (same topic, agents, rounds, provider and model), or continue its unfinished checkpoint, instead of running it again.")
+def run(topic: str, agents: str, rounds: int, preset: Optional[str], provider: str, model: Optional[str], output: str, no_stream: bool, parallel: bool, history_window: Optional[int], token_budget: Optional[int], consensus_method: str, cache: Optional[str], fallback: Optional[str], hedge_after: Optional[float], moderator_backend: Optional[str], stop_at: Optional[float], stop_epsilon: Optional[float], stop_patience: int, output_format: str, checkpoint: Optional[str], no_archive: bool, reuse: bool):
     """Run a multi-agent debate on a topic."""
-    # Validate provider early with helpful error
-    try:
-        from agora.providers.base import LLMProvider
-        LLMProvider.resolve(provider, model=model)
-    except EnvironmentError as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
-        sys.exit(1)
-    except ValueError as e:
-        console.print(f"[bold red]Error:[/bold red] {e}")
-        sys.exit(1)
-    except ImportError as e:
-        console.print(f"[bold red]Missing dependency:[/bold red] {e}")
-        console.print("Install it with: pip install <package>")
-        sys.exit(1)
+    from agora.checkpoint import discard_checkpoint
+    from agora.debate import default_checkpoint_path, run_debate
+    from agora.personas import load_preset, make_neutral_agents, parse_agent_spec
+    from agora.providers.base import parse_backend
+
+    fallbacks = _parse_fallback(fallback)
+    _validate_provider(provider, fallbacks)
 
     # Warnings
     if rounds > 10:
@@ -70,12 +90,14 @@ def run(topic: str, agents: str, rounds: int, preset: Optional[str], provider: s
     # Resolve agent configs
     if preset:
         try:
-            data = load_preset(preset)
-        except FileNotFoundError as e:
+            data = load_preset(preset, allow_paths=True)
+        except (FileNotFoundError, ValueError) as e:
             console.print(f"[bold red]Error:[/bold red] {e}")
             sys.exit(1)
         agent_configs = data["agents"]
+        moderator_config = data.get("moderator")
     else:
+        moderator_config = None
         parsed = parse_agent_spec(agents)
         if parsed is None:
             count = int(agents)
@@ -91,29 +113,300 @@ def run(topic: str, agents: str, rounds: int, preset: Optional[str], provider: s
                     sys.exit(0)
             agent_configs = parsed
 
-    run_debate(
-        topic,
-        agent_configs,
+    if moderator_backend:
+        moderator_config = dict(zip(("provider", "model"), parse_backend(moderator_backend)))
+    for name in _participant_providers(agent_configs, moderator_config):
+        _validate_provider(name)
+
+    keep_checkpoint = checkpoint is not None
+    checkpoint = checkpoint or default_checkpoint_path(output, topic)
+    with _resume_hint(checkpoint, output_format):
+        run_debate(
+            topic,
+            agent_configs,
+            rounds=rounds,
+            model=model,
+            provider_name=provider,
+            output_dir=output,
+            stream=not no_stream,
+            parallel=parallel,
+            history_window=history_window,
+            token_budget=token_budget,
+            consensus_method=consensus_method,
+            cache=cache,
+            fallback=fallbacks,
+            hedge_after=hedge_after,
+            moderator_config=moderator_config,
+            stop_threshold=stop_at,
+            stop_epsilon=stop_epsilon,
+            stop_patience=stop_patience,
+            display=output_format,
+            checkpoint=checkpoint,
+            archive=not no_archive,
+            reuse=reuse,
+        )
+    if not keep_checkpoint:
+        discard_checkpoint(checkpoint)
+
+
+@cli.command()
+@click.argument("checkpoint", type=click.Path(exists=True, dir_okay=False))
+@click.option("--format", "output_format", default="rich", type=click.Choice(["rich", "plain", "json", "none"]), help="Output style: rich terminal UI, plain text, JSON-lines events, or nothing.")
+def resume(checkpoint: str, output_format: str):
+    """Continue an interrupted debate from its checkpoint file."""
+    from agora.checkpoint import load_checkpoint
+    from agora.debate import resume_debate
+
+    try:
+        state = load_checkpoint(checkpoint)
+    except (ValueError, KeyError) as e:
+        console.print(f"[bold red]Error:[/bold red] Could not read {checkpoint}: {e}")
+        sys.exit(1)
+
+    if state["report"]:
+        console.print(f"Debate already finished. Report: [underline]{state['report']}[/underline]")
+        return
+
+    config = state["config"]
+    _validate_provider(config["provider_name"], config.get("fallback"))
+    for name in _participant_providers(config["agent_configs"], config.get("moderator_config")):
+        _validate_provider(name)
+    with _resume_hint(checkpoint, output_format):
+        resume_debate(checkpoint, display=output_format)
+
+
+@cli.command()
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--workers", default=4, type=click.IntRange(min=1), help="Number of debates to run at the same time.")
+@click.option("--agents", default="3", help="Default agents for topics without a preset or agents column.")
+@click.option("--rounds", default=3, type=int, help="Default number of rounds per debate.")
+@click.option("--preset", default=None, help="Default persona preset for topics without one.")
+@click.option("--provider", default="anthropic", help=PROVIDER_HELP)
+@click.option("--model", default=None, help=MODEL_HELP)
+@click.option("--output", default="reports", help="Directory to save the reports and summary index.")
+@click.option("--parallel", is_flag=True, help="Let all agents in a round respond simultaneously.")
+@click.option("--cache", default=None, type=click.Choice(["auto", "record", "replay"]), help=CACHE_HELP)
+@click.option("--fallback", default=None, help="Comma-separated provider[:model] backends to fail over to when a call errors, e.g. openai:gpt4o,gemini:flash. Slow backends are only skipped with --hedge-after.")
+@click.option("--hedge-after", default=None, type=click.FloatRange(min=0), help="Also send a turn to the next backend if it has not started answering after this many seconds.")
+@click.option("--moderator", "moderator_backend", default=None, help="provider[:model] for the moderator (default: the preset's, else --provider).")
+@click.option("--reuse", is_flag=True, help="Return the report of an identical earlier debate (same topic, agents, rounds, provider and model) instead of running it again; repeated topics in the file run once.")
+def batch(file: str, workers: int, agents: str, rounds: int, preset: Optional[str], provider: str, model: Optional[str], output: str, parallel: bool, cache: Optional[str], fallback: Optional[str], hedge_after: Optional[float], moderator_backend: Optional[str], reuse: bool):
+    """Run one debate per topic in a JSONL or CSV file.
+
+    Each entry needs a "topic" and may override "preset", "agents" and "rounds".
+    """
+    from agora.batch import load_jobs, run_batch
+
+    fallbacks = _parse_fallback(fallback)
+    _validate_provider(provider, fallbacks)
+    try:
+        jobs = load_jobs(file)
+    except (ValueError, KeyError) as e:
+        console.print(f"[bold red]Error:[/bold red] Could not read {file}: {e}")
+        sys.exit(1)
+
+    console.print(f"[bold]Running {len(jobs)} debates with {workers} workers...[/bold]")
+
+    misses = []
+
+    def report(result: dict) -> None:
+        if result["status"] == "ok":
+            console.print(f"  [green]✓[/green] {result['topic']} [dim]({result['seconds']}s)[/dim]")
+        else:
+            console.print(f"  [red]✗[/red] {result['topic']}: {result['error']}")
+            if result["error"].startswith("CacheMiss"):
+                misses.append(result["topic"])
+
+    index_path = run_batch(
+        jobs,
+        agents=agents,
         rounds=rounds,
+        preset=preset,
         model=model,
         provider_name=provider,
         output_dir=output,
-        stream=not no_stream,
+        workers=workers,
+        parallel=parallel,
+        cache=cache,
+        fallback=fallbacks,
+        hedge_after=hedge_after,
+        moderator=moderator_backend,
+        reuse=reuse,
+        on_result=report,
     )
+    console.print(f"\n  [bold green]✓[/bold green] Summary saved to: [underline]{index_path}[/underline]\n")
+    if misses:
+        console.print(f"[bold red]Error:[/bold red] {len(misses)} debates had no recorded responses. {REPLAY_MISS_HINT}")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", help="Interface to listen on.")
+@click.option("--port", default=8000, type=int, help="Port to listen on.")
+@click.option("--workers", default=4, type=click.IntRange(min=1), help="Debates that run at the same time.")
+@click.option("--queue-size", default=100, type=click.IntRange(min=1), help="Debates that may wait for a worker before requests are rejected.")
+@click.option("--provider", default="anthropic", help=PROVIDER_HELP)
+@click.option("--model", default=None, help=MODEL_HELP)
+@click.option("--output", default="reports", help="Directory to save the reports.")
+@click.option("--cache", default=None, type=click.Choice(["auto", "record", "replay"]), help=CACHE_HELP)
+@click.option("--fallback", default=None, help="Comma-separated provider[:model] backends to fail over to when a call errors, e.g. openai:gpt4o,gemini:flash. Slow backends are only skipped with --hedge-after.")
+@click.option("--hedge-after", default=None, type=click.FloatRange(min=0), help="Also send a turn to the next backend if it has not started answering after this many seconds.")
+@click.option("--reuse", is_flag=True, help="Answer requests for an identical earlier debate with its report (requests can also set \"reuse\").")
+def serve(host: str, port: int, workers: int, queue_size: int, provider: str, model: Optional[str], output: str, cache: Optional[str], fallback: Optional[str], hedge_after: Optional[float], reuse: bool):
+    """Serve debates over HTTP, streaming turns as Server-Sent Events.
+
+    POST /debates with {"topic": ..., "preset": ...} to start one, then follow
+    GET /debates/{id}/events. See agora.server for all endpoints.
+    """
+    from agora.server import serve as run_server
+
+    fallbacks = _parse_fallback(fallback)
+    _validate_provider(provider, fallbacks)
+
+    def ready(address: tuple) -> None:
+        console.print(f"[bold]agora[/bold] serving on http://{address[0]}:{address[1]} "
+                      f"({workers} workers, queue of {queue_size}). Ctrl-C to stop.")
+
+    try:
+        run_server(
+            host,
+            port,
+            workers=workers,
+            queue_size=queue_size,
+            on_ready=ready,
+            provider_name=provider,
+            model=model,
+            output_dir=output,
+            cache=cache,
+            fallback=fallbacks,
+            hedge_after=hedge_after,
+            reuse=reuse,
+        )
+    except OSError as e:
+        console.print(f"[bold red]Error:[/bold red] Could not listen on {host}:{port}: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        console.print("\n[dim]Server stopped. Unfinished debates can be continued with agora resume.[/dim]")
+
+
+@cli.command()
+@click.argument("query", required=False)
+@click.option("--agent", default=None, help="Only debates this agent took part in.")
+@click.option("--min-consensus", default=None, type=click.FloatRange(0, 1), help="Only debates that ended with at least this consensus.")
+@click.option("--max-consensus", default=None, type=click.FloatRange(0, 1), help="Only debates that ended with at most this consensus.")
+@click.option("--since", default=None, type=click.DateTime(), help="Only debates from this date on (YYYY-MM-DD).")
+@click.option("--limit", default=20, type=click.IntRange(min=1), help="Maximum number of debates to list.")
+@click.option("--format", "output_format", default="table", type=click.Choice(["table", "json"]), help="Output style: a table or JSON.")
+@click.option("--db", default=None, type=click.Path(dir_okay=False), help="Archive database (default: $AGORA_DB or ~/.local/share/agora/debates.sqlite).")
+def search(query: Optional[str], agent: Optional[str], min_consensus: Optional[float], max_consensus: Optional[float], since, limit: int, output_format: str, db: Optional[str]):
+    """Search archived debates by what was said in them.
+
+    QUERY supports words, "exact phrases", AND/OR/NOT and prefix*; without
+    it the newest debates matching the filters are listed.
+    """
+    import json
+    import re
+
+    from rich.markup import escape
+    from rich.table import Table
+
+    from agora.store import DebateStore
+
+    store = DebateStore(db)
+    try:
+        results = store.search(
+            query, agent=agent, min_consensus=min_consensus, max_consensus=max_consensus,
+            since=since.isoformat() if since else None, limit=limit,
+        )
+    finally:
+        store.close()
+
+    if output_format == "json":
+        click.echo(json.dumps(results, indent=2))
+        return
+    if not results:
+        console.print("[dim]No matching debates.[/dim]")
+        return
+    table = Table(show_lines=bool(query))
+    table.add_column("ID", style="cyan", justify="right")
+    table.add_column("Date", style="dim")
+    table.add_column("Topic", style="bold")
+    table.add_column("Agents")
+    table.add_column("Consensus", justify="right")
+    if query:
+        table.add_column("Match")
+    for debate in results:
+        consensus = debate["final_consensus"]
+        row = [
+            str(debate["id"]), debate["created"][:16].replace("T", " "), debate["topic"], ", ".join(debate["agents"]),
+            f"{consensus:.0%}" if consensus is not None else "-",
+        ]
+        if query:
+            row.append(re.sub(r"\*\*(.+?)\*\*", r"[bold yellow]\1[/bold yellow]", escape(debate["snippet"] or "")))
+        table.add_row(*row)
+    console.print(table)
+
+
+@cli.command()
+@click.argument("debate_id", type=int)
+@click.option("--format", "output_format", default="rich", type=click.Choice(["rich", "markdown", "json"]), help="Output style: rendered Markdown, raw Markdown, or JSON.")
+@click.option("--export", default=None, type=click.Path(dir_okay=False), help="Write the debate to this file instead (Markdown, or JSON with --format json).")
+@click.option("--db", default=None, type=click.Path(dir_okay=False), help="Archive database (default: $AGORA_DB or ~/.local/share/agora/debates.sqlite).")
+def show(debate_id: int, output_format: str, export: Optional[str], db: Optional[str]):
+    """Show an archived debate, e.g. one found with agora search."""
+    import json
+    from datetime import datetime
+
+    from agora.debate import format_report
+    from agora.store import DebateStore
+
+    store = DebateStore(db)
+    try:
+        debate = store.get(debate_id)
+    finally:
+        store.close()
+    if debate is None:
+        console.print(f"[bold red]Error:[/bold red] No archived debate with id {debate_id}.")
+        sys.exit(1)
+
+    if output_format == "json":
+        text = json.dumps(debate, indent=2)
+    else:
+        text = format_report(
+            debate["topic"], debate["agent_configs"], debate["rounds"], debate["provider"], debate["turns"],
+            debate["synthesis"], scores=debate["scores"], stop_reason=debate["stop_reason"],
+            metrics=debate["metrics"], date=datetime.fromisoformat(debate["created"]),
+        )
+
+    if export:
+        with open(export, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        console.print(f"  [bold green]✓[/bold green] Debate saved to: [underline]{export}[/underline]")
+    elif output_format == "rich":
+        from rich.markdown import Markdown
+
+        console.print(Markdown(text))
+    else:
+        click.echo(text)
 
 
 @cli.command(name="presets")
 def list_presets_cmd():
-    """List available persona presets."""
-    presets = list_presets()
-    if not presets:
+    """List available persona presets (built-in and your own, see AGORA_PERSONAS_PATH)."""
+    from pathlib import Path
+
+    from agora.personas import PERSONAS_DIR, get_registry
+
+    # Only each file's header lines are read, not the whole YAML
+    headers = get_registry().headers()
+    if not headers:
         console.print("[dim]No presets found.[/dim]")
         return
     console.print("[bold]Available presets:[/bold]")
-    for name in presets:
-        data = load_preset(name)
-        agents_str = ", ".join(a["name"] for a in data.get("agents", []))
-        console.print(f"  [cyan]{name}[/cyan] - {data.get('name', name)} ({agents_str})")
+    for header in headers:
+        agents_str = ", ".join(header["agents"])
+        source = "" if Path(header["path"]).parent == PERSONAS_DIR else f" [dim]{header['path']}[/dim]"
+        console.print(f"  [cyan]{header['preset']}[/cyan] - {header['name']} ({agents_str}){source}")
 
 
 @cli.command(name="providers")
@@ -125,15 +418,104 @@ def list_providers_cmd():
         ("openai", "OPENAI_API_KEY", "GPT", "gpt4o*, gpt4o-mini, o1, o3-mini"),
         ("gemini", "GOOGLE_API_KEY", "Gemini", "flash*, pro, thinking"),
         ("grok", "XAI_API_KEY", "Grok", "grok*, grok-mini"),
+        ("mock", None, "Mock", "mock*, or any name"),
     ]
     for name, env_var, display, models in providers:
-        has_key = bool(os.environ.get(env_var))
+        has_key = env_var is None or bool(os.environ.get(env_var))
         status = "[green]ready[/green]" if has_key else f"[red]needs {env_var}[/red]"
         console.print(f"  [cyan]{name:12s}[/cyan] {display:8s} {status}")
         console.print(f"               Models: {models}  (* = default)")
         console.print()
 
 
+@cli.command()
+@click.argument("names", nargs=-1)
+@click.option("--quick", is_flag=True, help="Smaller sizes and fewer repeats, for a fast smoke run.")
+@click.option("--output", default=None, type=click.Path(dir_okay=False), help="Write the JSON results to this file instead of stdout.")
+def bench(names: tuple, quick: bool, output: Optional[str]):
+    """Benchmark agora itself with the offline mock provider and print JSON.
+
+    NAMES picks benchmarks (default: all): startup, turns, transcript,
+    consensus, render, concurrency.
+    """
+    import json
+
+    from agora.bench import run_benchmarks
+
+    try:
+        results = run_benchmarks(list(names) or None, quick=quick)
+    except ValueError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+    text = json.dumps(results, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        console.print(f"  [bold green]✓[/bold green] Results saved to: [underline]{output}[/underline]")
+    else:
+        click.echo(text)
+
+
+@contextmanager
+def _resume_hint(checkpoint: str, output_format: str = "rich"):
+    """On an error or Ctrl-C, tell the user how to pick the debate up again.
+
+    With ``--format json`` or ``none`` stdout is for machines, so the hint goes to stderr.
+    A ``--cache replay`` miss would happen again on resume, so it ends with an error instead.
+    """
+    from agora.providers.cache import CacheMiss
+
+    out = console if output_format in ("rich", "plain") else Console(stderr=True)
+    try:
+        yield
+    except CacheMiss as e:
+        out.print(f"[bold red]Error:[/bold red] {e} {REPLAY_MISS_HINT}", soft_wrap=True)
+        sys.exit(1)
+    except BaseException:
+        if os.path.exists(checkpoint):
+            out.print(
+                f"\n[bold yellow]Debate interrupted.[/bold yellow] Continue it with: agora resume {checkpoint}",
+                soft_wrap=True,
+            )
+        raise
+
+
+def _participant_providers(agent_configs: list[dict], moderator_config: Optional[dict]) -> list[str]:
+    """Providers that agents or the moderator pick for themselves."""
+    configs = list(agent_configs) + [moderator_config or {}]
+    return list(dict.fromkeys(cfg["provider"] for cfg in configs if cfg.get("provider")))
+
+
+def _parse_fallback(fallback: Optional[str]) -> Optional[list[str]]:
+    """Split --fallback into its provider[:model] specs."""
+    if not fallback:
+        return None
+    return [spec.strip() for spec in fallback.split(",") if spec.strip()]
+
+
+def _validate_provider(provider: str, fallback: Optional[list[str]] = None) -> None:
+    """Check provider names, API keys and SDKs up front so configuration errors exit with a helpful message.
+
+    No client is built here; ``run_debate`` resolves the (shared) provider instances.
+    """
+    from agora.providers.base import LLMProvider, parse_backend
+
+    try:
+        for name in [provider] + [parse_backend(spec)[0] for spec in fallback or []]:
+            LLMProvider.check_credentials(name)
+    except EnvironmentError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    except ValueError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+    except ImportError as e:
+        console.print(f"[bold red]Missing dependency:[/bold red] {e}")
+        console.print("Install it with: pip install <package>")
+        sys.exit(1)
+
+
 def main():
     cli()
 
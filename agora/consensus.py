@@ -0,0 +1,187 @@
+"""Consensus scoring based on keyword overlap between agents' turns."""
+
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional: pip install agora-debate[fast]
+    np = None
+
+
+STOPWORDS = frozenset({
+    "this", "that", "with", "from", "have", "been", "will", "would",
+    "could", "should", "also", "about", "into", "than", "them", "then",
+    "their", "there", "these", "those", "what", "when", "where", "which",
+    "while", "more", "some", "such", "each", "make", "like", "just",
+    "over", "very", "much", "many", "most", "other", "being", "does",
+})
+
+_WORD_RE = re.compile(r"\b[a-zA-Z]{4,}\b")
+
+
+def extract_keywords(text: str) -> set[str]:
+    """Lower-cased words of 4+ letters, minus common stopwords."""
+    return set(_WORD_RE.findall(text.lower())) - STOPWORDS
+
+
+class ConsensusEngine:
+    """Scores agreement within each round as pairwise keyword Jaccard similarity.
+
+    Every turn is tokenized once when added and stored as a sorted list of
+    term ids. Scoring a round builds the turns' term-incidence matrix and
+    gets all pairwise intersections from a single matrix product (with NumPy
+    installed; otherwise a pure-Python loop gives identical numbers).
+    """
+
+    label = "keyword"
+
+    def __init__(self):
+        self._vocab: dict[str, int] = {}
+        self._turns: dict[int, list[list[int]]] = {}
+        self._agents: dict[int, list[str]] = {}
+
+    @classmethod
+    def from_history(cls, history, round_num: Optional[int] = None) -> "ConsensusEngine":
+        """Build an engine from history entries, optionally just one round's."""
+        engine = cls()
+        for entry in history:
+            if round_num is None or entry["round"] == round_num:
+                engine.add(entry["round"], entry["text"], entry.get("agent"))
+        return engine
+
+    def add(self, round_num: int, text: str, agent: Optional[str] = None) -> None:
+        """Tokenize and index one turn."""
+        ids = sorted(self._vocab.setdefault(word, len(self._vocab)) for word in extract_keywords(text))
+        self._turns.setdefault(round_num, []).append(ids)
+        labels = self._agents.setdefault(round_num, [])
+        labels.append(agent or f"Turn {len(labels) + 1}")
+
+    def agents(self, round_num: int) -> list[str]:
+        """Row/column labels of ``similarity_matrix``."""
+        return list(self._agents.get(round_num, []))
+
+    def similarity_matrix(self, round_num: int) -> list[list[float]]:
+        """Pairwise Jaccard similarity of all turns in a round (0.5 where both are empty)."""
+        turns = self._turns.get(round_num, [])
+        if np is not None:
+            return self._matrix_numpy(turns).tolist()
+        return self._matrix_python(turns)
+
+    def score(self, round_num: int) -> float:
+        """Mean pairwise similarity of a round. Returns 0-1."""
+        turns = self._turns.get(round_num, [])
+        n = len(turns)
+        if n < 2:
+            return 1.0
+        if not any(turns):
+            return 0.5
+        if np is not None:
+            matrix = self._matrix_numpy(turns)
+            return float(matrix[np.triu_indices(n, k=1)].mean())
+        matrix = self._matrix_python(turns)
+        pairs = [matrix[i][j] for i in range(n) for j in range(i + 1, n)]
+        return sum(pairs) / len(pairs)
+
+    @staticmethod
+    def _matrix_numpy(turns: list[list[int]]):
+        n = len(turns)
+        lengths = np.fromiter((len(t) for t in turns), dtype=np.int64, count=n)
+        term_ids = np.fromiter((i for t in turns for i in t), dtype=np.int64, count=int(lengths.sum()))
+        # Re-number this round's terms 0..k-1 so the incidence matrix stays small
+        local_ids = np.unique(term_ids, return_inverse=True)[1].reshape(-1)
+        incidence = np.zeros((n, int(local_ids.max(initial=-1)) + 1), dtype=np.float32)
+        incidence[np.repeat(np.arange(n), lengths), local_ids] = 1.0
+
+        intersection = incidence @ incidence.T
+        union = lengths[:, None] + lengths[None, :] - intersection
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(union > 0, intersection / union, 0.5)
+
+    @staticmethod
+    def _matrix_python(turns: list[list[int]]) -> list[list[float]]:
+        sets = [set(t) for t in turns]
+        matrix = [[0.0] * len(sets) for _ in sets]
+        for i, a in enumerate(sets):
+            for j in range(i, len(sets)):
+                b = sets[j]
+                union = len(a | b)
+                matrix[i][j] = matrix[j][i] = len(a & b) / union if union else 0.5
+        return matrix
+
+
+class SemanticConsensus:
+    """Scores agreement as pairwise cosine similarity of turn embeddings.
+
+    Catches paraphrased agreement that keyword overlap misses. Each round is
+    embedded in one batch the first time it is scored; embeddings are cached
+    on disk by text hash, so re-scoring saved debates is nearly free. Uses a
+    local sentence-transformers model when installed and a hashing
+    bag-of-words embedding otherwise; ``label`` says which.
+    """
+
+    def __init__(self, embedder=None, cache=None):
+        from agora.embeddings import EmbeddingCache, HashingEmbedder, get_embedder
+        self.embedder = embedder or get_embedder()
+        self.label = "semantic (hashing fallback)" if isinstance(self.embedder, HashingEmbedder) else "semantic"
+        self.cache = cache if cache is not None else EmbeddingCache()
+        self._texts: dict[int, list[str]] = {}
+        self._agents: dict[int, list[str]] = {}
+        self._vectors: dict[int, list[list[float]]] = {}
+
+    @classmethod
+    def from_history(cls, history, round_num: Optional[int] = None, **kwargs) -> "SemanticConsensus":
+        """Build an engine from history entries, optionally just one round's."""
+        engine = cls(**kwargs)
+        for entry in history:
+            if round_num is None or entry["round"] == round_num:
+                engine.add(entry["round"], entry["text"], entry.get("agent"))
+        return engine
+
+    def add(self, round_num: int, text: str, agent: Optional[str] = None) -> None:
+        """Queue one turn for embedding."""
+        self._texts.setdefault(round_num, []).append(text)
+        labels = self._agents.setdefault(round_num, [])
+        labels.append(agent or f"Turn {len(labels) + 1}")
+        self._vectors.pop(round_num, None)
+
+    def agents(self, round_num: int) -> list[str]:
+        """Row/column labels of ``similarity_matrix``."""
+        return list(self._agents.get(round_num, []))
+
+    def similarity_matrix(self, round_num: int) -> list[list[float]]:
+        """Pairwise cosine similarity of all turns in a round, clipped to 0-1."""
+        vectors = self._round_vectors(round_num)
+        if np is not None and vectors:
+            m = np.asarray(vectors, dtype=np.float32)
+            return np.clip(m @ m.T, 0.0, 1.0).tolist()
+        return [[max(0.0, min(1.0, sum(x * y for x, y in zip(a, b)))) for b in vectors] for a in vectors]
+
+    def score(self, round_num: int) -> float:
+        """Mean pairwise similarity of a round. Returns 0-1."""
+        n = len(self._texts.get(round_num, []))
+        if n < 2:
+            return 1.0
+        matrix = self.similarity_matrix(round_num)
+        pairs = [matrix[i][j] for i in range(n) for j in range(i + 1, n)]
+        return sum(pairs) / len(pairs)
+
+    def _round_vectors(self, round_num: int) -> list[list[float]]:
+        if round_num not in self._vectors:
+            from agora.embeddings import embed_texts
+            self._vectors[round_num] = embed_texts(self._texts.get(round_num, []), self.embedder, self.cache)
+        return self._vectors[round_num]
+
+
+CONSENSUS_METHODS = ("keyword", "semantic")
+
+
+def make_consensus(method: str = "keyword"):
+    """Create the consensus engine for ``method`` ("keyword" or "semantic")."""
+    if method == "keyword":
+        return ConsensusEngine()
+    if method == "semantic":
+        return SemanticConsensus()
+    raise ValueError(f"Unknown consensus method '{method}'. Available: {', '.join(CONSENSUS_METHODS)}")
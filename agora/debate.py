@@ -2,50 +2,54 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from agora.agent import Agent
+from agora.checkpoint import load_checkpoint, save_checkpoint
+from agora.consensus import ConsensusEngine, make_consensus
+from agora.metrics import build_metrics, format_metrics
 from agora.moderator import Moderator
 from agora.providers.base import LLMProvider
+from agora.providers.pool import ProviderPool
+from agora.transcript import Transcript, estimate_tokens
 from agora import renderer
 
+# run_debate arguments stored in checkpoints: everything needed to continue a debate
+CHECKPOINT_FIELDS = (
+    "topic", "agent_configs", "rounds", "model", "provider_name", "output_dir", "stream", "parallel",
+    "history_window", "token_budget", "consensus_method", "cache", "fallback", "hedge_after",
+    "moderator_config", "stop_threshold", "stop_epsilon", "stop_patience", "archive", "reuse",
+)
+
+# run_debate arguments besides the topic that change what is said in a debate
+FINGERPRINT_FIELDS = (
+    "agent_configs", "rounds", "model", "provider_name", "parallel", "history_window", "token_budget",
+    "consensus_method", "moderator_config", "stop_threshold", "stop_epsilon", "stop_patience",
+)
+
+# Part of every fingerprint; bump it when the agent or moderator prompts
+# change, so debates run with the old prompts are not reused
+PROMPT_VERSION = 1
+
 
 def calculate_consensus(history: list[dict], round_num: int) -> float:
-    """Calculate consensus score using keyword overlap. Returns 0-1."""
-    round_texts = [e["text"] for e in history if e["round"] == round_num]
-    if len(round_texts) < 2:
-        return 1.0
-
-    def extract_keywords(text: str) -> set:
-        words = re.findall(r"\b[a-zA-Z]{4,}\b", text.lower())
-        stop = {
-            "this", "that", "with", "from", "have", "been", "will", "would",
-            "could", "should", "also", "about", "into", "than", "them", "then",
-            "their", "there", "these", "those", "what", "when", "where", "which",
-            "while", "more", "some", "such", "each", "make", "like", "just",
-            "over", "very", "much", "many", "most", "other", "being", "does",
-        }
-        return set(w for w in words if w not in stop)
-
-    keyword_sets = [extract_keywords(t) for t in round_texts]
-    if not any(keyword_sets):
-        return 0.5
-
-    similarities = []
-    for i in range(len(keyword_sets)):
-        for j in range(i + 1, len(keyword_sets)):
-            a, b = keyword_sets[i], keyword_sets[j]
-            if not a and not b:
-                similarities.append(0.5)
-            else:
-                intersection = a & b
-                union = a | b
-                similarities.append(len(intersection) / len(union) if union else 0.5)
+    """Calculate consensus score using keyword overlap. Returns 0-1.
 
-    return sum(similarities) / len(similarities) if similarities else 0.5
+    Convenience wrapper that tokenizes the round from scratch; debates keep
+    a ``ConsensusEngine`` that indexes each turn once as it is added.
+    """
+    round_entries = history.round(round_num) if isinstance(history, Transcript) else history
+    return ConsensusEngine.from_history(round_entries, round_num).score(round_num)
 
 
 def run_debate(
@@ -56,90 +60,598 @@ def run_debate(
     provider_name: str = "anthropic",
     output_dir: str = "reports",
     stream: bool = True,
+    parallel: bool = False,
+    provider: Optional[LLMProvider] = None,
+    history_window: Optional[int] = None,
+    token_budget: Optional[int] = None,
+    consensus_method: str = "keyword",
+    cache: Optional[str] = None,
+    fallback: Optional[list[str]] = None,
+    hedge_after: Optional[float] = None,
+    moderator_config: Optional[dict] = None,
+    stop_threshold: Optional[float] = None,
+    stop_epsilon: Optional[float] = None,
+    stop_patience: int = 2,
+    display: Union[str, renderer.Renderer] = "rich",
+    checkpoint: Optional[str] = None,
+    archive: bool = True,
+    reuse: bool = False,
 ) -> str:
-    """Run a full debate and return the path to the saved report."""
-    # Resolve provider
-    llm = LLMProvider.resolve(provider_name, model=model)
-    provider_label = f"{provider_name}/{llm.display_name}"
+    """Run a full debate and return the path to the saved report.
+
+    With ``parallel=True`` every agent in a round responds simultaneously,
+    seeing only the turns from previous rounds. Pass ``provider`` to reuse an
+    already constructed backend instead of resolving ``provider_name``.
+
+    ``history_window`` keeps only the last N completed rounds verbatim in the
+    agents' prompts; older rounds are replaced by a moderator summary that is
+    written once and shared by all agents. ``token_budget`` additionally
+    summarizes the oldest rounds until the transcript fits the (estimated)
+    number of tokens.
+
+    ``consensus_method`` is "keyword" (word overlap) or "semantic"
+    (embedding similarity, see ``agora.consensus.SemanticConsensus``).
+
+    ``cache`` ("auto", "record" or "replay") records and replays provider
+    responses, see ``agora.providers.cache.CachingProvider``.
+
+    ``fallback`` lists "provider[:model]" backends to fail over to when the
+    provider errors; ``hedge_after`` also sends a turn that has not started
+    answering within that many seconds to the next backend (see
+    ``agora.providers.fallback.FallbackProvider``).
+
+    Agent configs and ``moderator_config`` may name their own ``provider``
+    and ``model``; participants without one use the debate's provider.
+    Participants on the same backend share one provider instance.
+
+    The debate ends before ``rounds`` when the consensus score reaches
+    ``stop_threshold`` or has moved less than ``stop_epsilon`` in each of
+    the last ``stop_patience`` rounds; the reason is noted in the report.
+
+    ``display`` selects the output backend: "rich" (terminal UI), "plain",
+    "json" (JSON-lines events on stdout), "none", or a ``Renderer``.
+
+    ``checkpoint`` is a JSON file the debate state is saved to after every
+    turn. If it already holds an unfinished run of this debate, the debate
+    continues after its last completed turn (see ``resume_debate``).
+
+    With ``archive`` the finished debate is also added to the searchable
+    debate archive (see ``agora.store.DebateStore``). With ``reuse`` a
+    debate whose fingerprint (see ``debate_fingerprint``) matches an archived
+    one returns that report instead of running again; failing that, it
+    continues from the newest unfinished checkpoint of an identical run.
+    """
+    config = {name: value for name, value in locals().items() if name in CHECKPOINT_FIELDS}
+    view = renderer.get_renderer(display)
+    with _reporting_errors(view, checkpoint):
+        saved, reused, forked, fingerprint = _begin(config, checkpoint)
+        if saved and saved["report"]:
+            return saved["report"]
+        if reused:
+            view.reused(reused, "report")
+            return reused
+        debate = _Debate(config, saved, fingerprint, provider, view, checkpoint)
+        debate.start(forked)
+        history, moderator = debate.history, debate.moderator
+
+        for round_num in debate.remaining_rounds():
+            view.round_header(round_num, rounds)
+
+            while (old_round := debate.round_to_summarize(round_num)) is not None:
+                debate.add_summary(old_round, moderator.summarize_round(topic, old_round, history.round(old_round)))
+                debate.save()
+
+            pending = debate.pending(round_num)
+            if parallel and pending:
+                texts = _run_parallel_round(view, pending, topic, round_num, rounds, history, stream)
+                for agent, text in zip(pending, texts):
+                    debate.add_turn(round_num, agent, text)
+                    debate.save()
+            else:
+                for agent in pending:
+                    if stream:
+                        text = view.agent_response_stream(
+                            agent, topic, round_num, rounds, history
+                        )
+                    else:
+                        view.thinking(agent.name, round_num)
+                        text = agent.respond(topic, round_num, rounds, history)
+                        view.agent_response(agent.name, text, agent.color)
+
+                    debate.add_turn(round_num, agent, text)
+                    debate.save()
+
+            stop = debate.end_round(round_num, debate.consensus.score(round_num))
+            debate.save()
+            if stop:
+                break
+
+        # Moderator synthesis
+        view.thinking("Moderator")
+        debate.add_synthesis(moderator.synthesize(topic, history, debate.agent_names))
+        report_path = debate.finish()
+        view.saved(report_path)
+
+        return report_path
+
+
+async def arun_debate(
+    topic: str,
+    agent_configs: list[dict],
+    rounds: int = 3,
+    model: Optional[str] = None,
+    provider_name: str = "anthropic",
+    output_dir: str = "reports",
+    stream: bool = True,
+    parallel: bool = False,
+    provider: Optional[LLMProvider] = None,
+    history_window: Optional[int] = None,
+    token_budget: Optional[int] = None,
+    consensus_method: str = "keyword",
+    cache: Optional[str] = None,
+    fallback: Optional[list[str]] = None,
+    hedge_after: Optional[float] = None,
+    moderator_config: Optional[dict] = None,
+    stop_threshold: Optional[float] = None,
+    stop_epsilon: Optional[float] = None,
+    stop_patience: int = 2,
+    display: Union[str, renderer.Renderer] = "rich",
+    checkpoint: Optional[str] = None,
+    archive: bool = True,
+    reuse: bool = False,
+) -> str:
+    """Async variant of ``run_debate`` using the providers' native async clients.
+
+    Many debates can run concurrently on one event loop. Returns the path
+    to the saved report.
+    """
+    config = {name: value for name, value in locals().items() if name in CHECKPOINT_FIELDS}
+    view = renderer.get_renderer(display)
+    with _reporting_errors(view, checkpoint):
+        saved, reused, forked, fingerprint = await asyncio.to_thread(_begin, config, checkpoint)
+        if saved and saved["report"]:
+            return saved["report"]
+        if reused:
+            view.reused(reused, "report")
+            return reused
+        # Resolving providers, loading an embedding model and writing checkpoints block; run them off the loop
+        debate = await asyncio.to_thread(_Debate, config, saved, fingerprint, provider, view, checkpoint)
+        debate.start(forked)
+        history, moderator = debate.history, debate.moderator
+
+        for round_num in debate.remaining_rounds():
+            view.round_header(round_num, rounds)
+
+            while (old_round := debate.round_to_summarize(round_num)) is not None:
+                debate.add_summary(old_round, await moderator.asummarize_round(topic, old_round, history.round(old_round)))
+                await asyncio.to_thread(debate.save)
+
+            pending = debate.pending(round_num)
+            if parallel and pending:
+                for agent in pending:
+                    view.thinking(agent.name, round_num)
+                texts = await asyncio.gather(*(
+                    _acollect(view, agent, topic, round_num, rounds, history, stream) for agent in pending
+                ))
+                for agent, text in zip(pending, texts):
+                    view.agent_response(agent.name, text, agent.color)
+                    debate.add_turn(round_num, agent, text)
+                    await asyncio.to_thread(debate.save)
+            else:
+                for agent in pending:
+                    if stream:
+                        text = await view.aagent_response_stream(
+                            agent, topic, round_num, rounds, history
+                        )
+                    else:
+                        view.thinking(agent.name, round_num)
+                        text = await agent.arespond(topic, round_num, rounds, history)
+                        view.agent_response(agent.name, text, agent.color)
+
+                    debate.add_turn(round_num, agent, text)
+                    await asyncio.to_thread(debate.save)
+
+            stop = debate.end_round(round_num, await asyncio.to_thread(debate.consensus.score, round_num))
+            await asyncio.to_thread(debate.save)
+            if stop:
+                break
+
+        view.thinking("Moderator")
+        debate.add_synthesis(await moderator.asynthesize(topic, history, debate.agent_names))
+        report_path = await asyncio.to_thread(debate.finish)
+        view.saved(report_path)
+
+        return report_path
+
+
+def resume_debate(
+    checkpoint: str,
+    provider: Optional[LLMProvider] = None,
+    display: Union[str, renderer.Renderer] = "rich",
+) -> str:
+    """Continue the debate saved in ``checkpoint`` after its last completed turn.
+
+    Returns the report path; a finished debate returns its existing report.
+    """
+    state = load_checkpoint(checkpoint)
+    if state["report"]:
+        return state["report"]
+    return run_debate(**state["config"], provider=provider, display=display, checkpoint=checkpoint)
+
+
+def default_checkpoint_path(output_dir: str, topic: str) -> str:
+    """Where the CLI keeps the checkpoint of a new debate."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return str(Path(output_dir) / "checkpoints" / f"debate_{_slug(topic)}_{timestamp}.json")
+
+
+def normalize_topic(topic: str) -> str:
+    """The topic lower-cased, with whitespace collapsed and trailing punctuation dropped."""
+    return " ".join(topic.casefold().split()).rstrip(".?! ")
+
+
+def debate_fingerprint(
+    topic: str,
+    agent_configs: list[dict],
+    rounds: int = 3,
+    model: Optional[str] = None,
+    provider_name: str = "anthropic",
+    parallel: bool = False,
+    history_window: Optional[int] = None,
+    token_budget: Optional[int] = None,
+    consensus_method: str = "keyword",
+    moderator_config: Optional[dict] = None,
+    stop_threshold: Optional[float] = None,
+    stop_epsilon: Optional[float] = None,
+    stop_patience: int = 2,
+) -> str:
+    """Hash identifying debates that would say the same thing.
+
+    Covers the normalized topic, the ``run_debate`` arguments in
+    ``FINGERPRINT_FIELDS`` (defaults as in ``run_debate``) and
+    ``PROMPT_VERSION``; output, streaming, caching and failover settings
+    do not change a debate's content and are left out.
+    """
+    key = dict(locals(), topic=normalize_topic(topic), prompt_version=PROMPT_VERSION)
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _begin(config: dict, checkpoint: Optional[str]) -> tuple[Optional[dict], Optional[str], Optional[str], str]:
+    """Where a debate starts: ``(saved state, reused report, forked checkpoint, fingerprint)``.
+
+    The saved state comes from ``checkpoint`` or, with ``reuse``, from the
+    checkpoint of an identical unfinished run (``forked``); ``reused`` is
+    the report of an identical finished debate (see ``run_debate``).
+    """
+    saved = _load_saved(checkpoint, config)
+    fingerprint = debate_fingerprint(config["topic"], **{name: config[name] for name in FINGERPRINT_FIELDS})
+    if saved and saved["report"]:
+        return saved, None, None, fingerprint
+    forked = None
+    if config["reuse"] and saved is None:
+        reused, forked, saved = _find_reusable(fingerprint, checkpoint)
+        if reused:
+            return None, reused, None, fingerprint
+    if config["archive"] and checkpoint:
+        _remember_checkpoint(checkpoint, fingerprint)
+    return saved, None, forked, fingerprint
+
+
+@contextmanager
+def _reporting_errors(view: renderer.Renderer, checkpoint: Optional[str]):
+    """Tell ``view`` about a debate failing or being interrupted before it propagates."""
+    try:
+        yield
+    except (Exception, KeyboardInterrupt) as e:
+        view.error(e, checkpoint if checkpoint and os.path.exists(checkpoint) else None)
+        raise
+
+
+class _Debate:
+    """State and bookkeeping shared by ``run_debate`` and ``arun_debate``.
+
+    The two only differ in how they get turns, summaries and the synthesis
+    from the agents and the moderator; recording them, checkpoints, the stop
+    rules and the report live here.
+    """
+
+    def __init__(
+        self,
+        config: dict,
+        saved: Optional[dict],
+        fingerprint: str,
+        provider: Optional[LLMProvider],
+        view: renderer.Renderer,
+        checkpoint: Optional[str],
+    ):
+        self.config = config
+        self.fingerprint = fingerprint
+        self.checkpoint = checkpoint
+        self.started = time.monotonic()
+        self.topic = config["topic"]
+        self.rounds = config["rounds"]
+
+        llm = provider or LLMProvider.resolve(
+            config["provider_name"], model=config["model"], cache=config["cache"], fallback=config["fallback"],
+            hedge_after=config["hedge_after"],
+        )
+        pool = ProviderPool(
+            llm, config["provider_name"], config["model"], cache=config["cache"], fallback=config["fallback"],
+            hedge_after=config["hedge_after"],
+        )
+        self.provider_label = _provider_label(pool, config["agent_configs"], config["moderator_config"])
+        self.view = view
+        self.agents = _make_agents(config["agent_configs"], pool)
+        self.agent_names = [a.name for a in self.agents]
+
+        self.history, self.scores, self.moderator_calls, self.stop_reason, self.elapsed = _restore(saved)
+        self.consensus = make_consensus(config["consensus_method"])
+        for entry in self.history:
+            self.consensus.add(entry["round"], entry["text"], entry["agent"])
+        self.moderator = Moderator(provider=pool.get(**_backend(config["moderator_config"])))
+        self.synthesis = ""
+
+    def start(self, forked: Optional[str] = None) -> None:
+        self.view.header(self.topic, self.agent_names, self.rounds, self.provider_label)
+        if forked:
+            self.view.reused(forked, "checkpoint")
+
+    def save(self, report: Optional[str] = None) -> None:
+        if self.checkpoint:
+            save_checkpoint(
+                self.checkpoint, self.config, self.history, self.scores, self.moderator_calls, self.stop_reason,
+                self.elapsed + time.monotonic() - self.started, report,
+            )
+
+    def remaining_rounds(self) -> range:
+        first_round = self.rounds + 1 if self.stop_reason else len(self.scores) + 1
+        return range(first_round, self.rounds + 1)
+
+    def round_to_summarize(self, round_num: int) -> Optional[int]:
+        return _next_round_to_summarize(
+            self.history, round_num, self.config["history_window"], self.config["token_budget"]
+        )
 
-    agents = [
+    def add_summary(self, old_round: int, summary: str) -> None:
+        self.history.summarize(old_round, summary)
+        self.moderator_calls.append({"task": f"summary of round {old_round}", "usage": self.moderator.last_usage})
+        self.view.round_summarized(old_round)
+
+    def pending(self, round_num: int) -> list[Agent]:
+        """Agents yet to speak this round; some may have before the debate was interrupted."""
+        spoken = {entry["agent"] for entry in self.history.round(round_num)}
+        return [agent for agent in self.agents if agent.name not in spoken]
+
+    def add_turn(self, round_num: int, agent: Agent, text: str) -> None:
+        _record_turn(self.view, self.history, self.consensus, round_num, agent, text)
+
+    def end_round(self, round_num: int, score: float) -> bool:
+        """Record the round's consensus score; True if the debate should stop early."""
+        self.view.consensus_meter(score, round_num, self.consensus.label)
+        self.scores.append(score)
+        self.stop_reason = _stop_reason(
+            self.scores, self.config["stop_threshold"], self.config["stop_epsilon"], self.config["stop_patience"]
+        )
+        if round_num == self.rounds:
+            self.stop_reason = None
+        if self.stop_reason:
+            self.view.early_stop(self.stop_reason)
+        return bool(self.stop_reason)
+
+    def add_synthesis(self, synthesis: str) -> None:
+        self.synthesis = synthesis
+        self.moderator_calls.append({"task": "synthesis", "usage": self.moderator.last_usage})
+        self.view.moderator_synthesis(synthesis)
+
+    def finish(self) -> str:
+        """Save the report (and archive the debate); returns the report path."""
+        config = self.config
+        metrics = build_metrics(self.history, self.moderator_calls, self.elapsed + time.monotonic() - self.started)
+        report_path = _save_report(
+            self.topic, config["agent_configs"], self.rounds, self.provider_label, self.history, self.synthesis,
+            config["output_dir"], scores=self.scores, stop_reason=self.stop_reason, metrics=metrics,
+        )
+        if config["archive"]:
+            _archive(
+                self.topic, config["agent_configs"], self.rounds, self.provider_label, self.history, self.synthesis,
+                self.scores, self.stop_reason, metrics, report_path, self.fingerprint,
+            )
+        self.save(report_path)
+        return report_path
+
+
+def _find_reusable(fingerprint: str, checkpoint: Optional[str]) -> tuple[Optional[str], Optional[str], Optional[dict]]:
+    """An earlier run of the debate ``fingerprint`` to reuse.
+
+    Returns ``(report, None, None)`` if one finished, else ``(None, path,
+    state)`` for the newest unfinished checkpoint other than ``checkpoint``,
+    else all None.
+    """
+    from agora.store import DebateStore
+
+    with closing(DebateStore()) as store:
+        report = store.find_report(fingerprint)
+        paths = [] if report else store.find_checkpoints(fingerprint)
+    if report:
+        return report, None, None
+    own = Path(checkpoint).resolve() if checkpoint else None
+    for path in paths:
+        if Path(path) == own:
+            continue
+        try:
+            state = load_checkpoint(path)
+        except (OSError, ValueError):
+            continue
+        if not state["report"]:
+            return None, path, state
+        if Path(state["report"]).exists():
+            return state["report"], None, None
+    return None, None, None
+
+
+def _remember_checkpoint(checkpoint: str, fingerprint: str) -> None:
+    from agora.store import DebateStore
+
+    with closing(DebateStore()) as store:
+        store.add_checkpoint(checkpoint, fingerprint)
+
+
+def _load_saved(checkpoint: Optional[str], config: dict) -> Optional[dict]:
+    """The state in ``checkpoint`` if it exists; it must be a run of the same debate."""
+    if not checkpoint or not Path(checkpoint).exists():
+        return None
+    saved = load_checkpoint(checkpoint)
+    for name in ("topic", "agent_configs", "rounds"):
+        if saved["config"].get(name) != config[name]:
+            raise ValueError(f"Checkpoint {checkpoint} belongs to a different debate ({name} differs)")
+    return saved
+
+
+def _restore(saved: Optional[dict]) -> tuple[Transcript, list[float], list[dict], Optional[str], float]:
+    """History, scores, moderator calls, stop reason and elapsed seconds to start from."""
+    if saved is None:
+        return Transcript(), [], [], None, 0.0
+    history = Transcript(saved["history"])
+    for round_num, summary in saved["summaries"].items():
+        history.summarize(round_num, summary)
+    return history, saved["scores"], saved["moderator_calls"], saved["stop_reason"], saved["elapsed"]
+
+
+def _make_agents(agent_configs: list[dict], pool: ProviderPool) -> list[Agent]:
+    return [
         Agent(
             name=cfg["name"],
             role=cfg["role"],
             color=cfg.get("color", "white"),
-            provider=llm,
+            provider=pool.get(**_backend(cfg)),
         )
         for cfg in agent_configs
     ]
-    agent_names = [a.name for a in agents]
 
-    renderer.print_header(topic, agent_names, rounds, provider_label)
 
-    history = []
+def _backend(config: Optional[dict]) -> dict:
+    """The ``provider``/``model`` a participant's config asks for."""
+    config = config or {}
+    return {"provider": config.get("provider"), "model": config.get("model")}
 
-    for round_num in range(1, rounds + 1):
-        renderer.print_round_header(round_num, rounds)
 
-        for agent in agents:
-            if stream:
-                text = renderer.print_agent_response_stream(
-                    agent, topic, round_num, rounds, history
-                )
-            else:
-                renderer.print_thinking(agent.name)
-                text = agent.respond(topic, round_num, rounds, history)
-                renderer.print_agent_response(agent.name, text, agent.color)
+def _provider_label(pool: ProviderPool, agent_configs: list[dict], moderator_config: Optional[dict]) -> str:
+    """Every backend taking part, e.g. "anthropic/sonnet, openai/gpt4o-mini"."""
+    configs = list(agent_configs) + [moderator_config]
+    return ", ".join(dict.fromkeys(pool.label(**_backend(cfg)) for cfg in configs))
 
-            history.append({
-                "round": round_num,
-                "agent": agent.name,
-                "text": text,
-            })
 
-        score = calculate_consensus(history, round_num)
-        renderer.print_consensus_meter(score, round_num)
+def _next_round_to_summarize(
+    history: Transcript,
+    round_num: int,
+    history_window: Optional[int],
+    token_budget: Optional[int],
+) -> Optional[int]:
+    """Pick the oldest completed round that should be summarized before ``round_num``, if any."""
+    pending = [r for r in history.rounds() if r < round_num and r not in history.summaries]
+    if not pending:
+        return None
+    if history_window is not None and pending[0] < round_num - history_window:
+        return pending[0]
+    if token_budget is not None and estimate_tokens(history.prompt_text()) > token_budget:
+        return pending[0]
+    return None
 
-    # Moderator synthesis
-    renderer.print_thinking("Moderator")
-    moderator = Moderator(provider=llm)
-    synthesis = moderator.synthesize(topic, history, agent_names)
-    renderer.print_moderator_synthesis(synthesis)
 
-    report_path = _save_report(topic, agent_configs, rounds, provider_label, history, synthesis, output_dir)
-    renderer.print_saved(report_path)
+def _stop_reason(
+    scores: list[float],
+    stop_threshold: Optional[float],
+    stop_epsilon: Optional[float],
+    stop_patience: int,
+) -> Optional[str]:
+    """Explain why the debate should stop after the latest round, or return None."""
+    if stop_threshold is not None and scores[-1] >= stop_threshold:
+        return f"consensus {scores[-1]:.0%} reached the {stop_threshold:.0%} threshold"
+    if stop_epsilon is not None and stop_patience > 0 and len(scores) > stop_patience:
+        recent = scores[-(stop_patience + 1):]
+        if all(abs(b - a) < stop_epsilon for a, b in zip(recent, recent[1:])):
+            return f"consensus stalled (changed less than {stop_epsilon:.0%} over {stop_patience} rounds)"
+    return None
 
-    return report_path
 
+def _record_turn(view: renderer.Renderer, history: Transcript, consensus, round_num: int, agent: Agent, text: str) -> None:
+    history.append({
+        "round": round_num,
+        "agent": agent.name,
+        "text": text,
+        "usage": agent.last_usage,
+    })
+    consensus.add(round_num, text, agent.name)
+    view.turn_end(agent.name, round_num, text, agent.last_usage)
 
-def _save_report(
+
+async def _acollect(
+    view: renderer.Renderer,
+    agent: Agent,
+    topic: str,
+    round_num: int,
+    rounds: int,
+    history: list[dict],
+    stream: bool,
+) -> str:
+    """Fetch one agent's full response, reporting chunks but not rendering the panel."""
+    if not stream:
+        return await agent.arespond(topic, round_num, rounds, history)
+    chunks = []
+    async for chunk in agent.arespond_stream(topic, round_num, rounds, history):
+        chunks.append(chunk)
+        view.turn_chunk(agent.name, round_num, chunk)
+    return "".join(chunks)
+
+
+def _run_parallel_round(
+    view: renderer.Renderer,
+    agents: list[Agent],
+    topic: str,
+    round_num: int,
+    rounds: int,
+    history: list[dict],
+    stream: bool,
+) -> list[str]:
+    """Let all agents answer the same history concurrently. Returns texts in agent order."""
+    if stream:
+        return view.round_responses_stream(agents, topic, round_num, rounds, history)
+
+    for agent in agents:
+        view.thinking(agent.name, round_num)
+    with ThreadPoolExecutor(max_workers=len(agents)) as pool:
+        texts = list(pool.map(lambda a: a.respond(topic, round_num, rounds, history), agents))
+    for agent, text in zip(agents, texts):
+        view.agent_response(agent.name, text, agent.color)
+    return texts
+
+
+def format_report(
     topic: str,
     agent_configs: list[dict],
     rounds: int,
     provider_label: str,
     history: list[dict],
     synthesis: str,
-    output_dir: str,
+    scores: Optional[list[float]] = None,
+    stop_reason: Optional[str] = None,
+    metrics: Optional[dict] = None,
+    date: Optional[datetime] = None,
 ) -> str:
-    """Save the debate as a Markdown report."""
-    out = Path(output_dir)
-    out.mkdir(parents=True, exist_ok=True)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    slug = re.sub(r"[^\w]+", "_", topic.lower())[:40].strip("_")
-    filename = f"debate_{slug}_{timestamp}.md"
-    path = out / filename
-
+    """The debate as a Markdown report (``date`` defaults to now)."""
     lines = [
         f"# Debate: {topic}",
         "",
-        f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        f"**Date:** {(date or datetime.now()).strftime('%Y-%m-%d %H:%M')}",
         f"**Rounds:** {rounds}",
         f"**Provider:** {provider_label}",
-        f"**Agents:** {', '.join(a['name'] for a in agent_configs)}",
-        "",
-        "---",
-        "",
+        f"**Agents:** {', '.join(_agent_label(a) for a in agent_configs)}",
     ]
+    if scores:
+        lines.append(f"**Consensus:** {', '.join(f'R{i} {score:.0%}' for i, score in enumerate(scores, start=1))}")
+    if stop_reason:
+        lines.append(f"**Stopped early:** after round {len(scores)} of {rounds}: {stop_reason}")
+    lines += ["", "---", ""]
 
     for entry in history:
         lines.append(f"## [Round {entry['round']}] {entry['agent']}")
@@ -154,5 +666,81 @@ def _save_report(
     lines.append(synthesis)
     lines.append("")
 
-    path.write_text("\n".join(lines), encoding="utf-8")
+    if metrics:
+        lines += ["---", ""] + format_metrics(metrics)
+    return "\n".join(lines)
+
+
+def _save_report(
+    topic: str,
+    agent_configs: list[dict],
+    rounds: int,
+    provider_label: str,
+    history: list[dict],
+    synthesis: str,
+    output_dir: str,
+    scores: Optional[list[float]] = None,
+    stop_reason: Optional[str] = None,
+    metrics: Optional[dict] = None,
+) -> str:
+    """Save the debate as a Markdown report.
+
+    With ``metrics`` (see ``agora.metrics.build_metrics``) a metrics section
+    is appended and the raw numbers are written next to the report as
+    ``<report>.metrics.json``.
+    """
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    slug = _slug(topic)
+    filename = f"debate_{slug}_{timestamp}.md"
+    path = out / filename
+    # Debates finishing in the same second (e.g. in a batch) must not overwrite each other
+    suffix = 1
+    while True:
+        try:
+            path.open("x").close()
+            break
+        except FileExistsError:
+            suffix += 1
+            path = out / f"debate_{slug}_{timestamp}_{suffix}.md"
+
+    if metrics:
+        path.with_suffix(".metrics.json").write_text(json.dumps(metrics, indent=2), encoding="utf-8")
+    report = format_report(topic, agent_configs, rounds, provider_label, history, synthesis, scores, stop_reason, metrics)
+    path.write_text(report, encoding="utf-8")
     return str(path)
+
+
+def _archive(
+    topic: str,
+    agent_configs: list[dict],
+    rounds: int,
+    provider_label: str,
+    history: Transcript,
+    synthesis: str,
+    scores: list[float],
+    stop_reason: Optional[str],
+    metrics: dict,
+    report_path: str,
+    fingerprint: Optional[str] = None,
+) -> None:
+    from agora.store import DebateStore
+
+    with closing(DebateStore()) as store:
+        store.add(
+            topic, agent_configs, rounds, provider_label, history, synthesis, scores,
+            stop_reason=stop_reason, metrics=metrics, report=str(Path(report_path).resolve()), fingerprint=fingerprint,
+        )
+
+
+def _agent_label(config: dict) -> str:
+    if not (config.get("provider") or config.get("model")):
+        return config["name"]
+    backend = "/".join(part for part in (config.get("provider"), config.get("model")) if part)
+    return f"{config['name']} ({backend})"
+
+
+def _slug(topic: str) -> str:
+    return re.sub(r"[^\w]+", "_", topic.lower())[:40].strip("_")
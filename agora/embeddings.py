@@ -0,0 +1,138 @@
+"""Text embeddings for semantic consensus, with an on-disk cache."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from agora.consensus import STOPWORDS
+
+CACHE_DIR = Path(os.environ.get("AGORA_CACHE_DIR", Path.home() / ".cache" / "agora"))
+
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+_TOKEN_RE = re.compile(r"\b[a-zA-Z]{3,}\b")
+
+
+class HashingEmbedder:
+    """Dependency-free fallback: hashed bag of words and word stems.
+
+    Words and their 5-letter prefixes are hashed into a fixed number of
+    signed buckets with sublinear term frequency, then L2-normalized. The
+    vectors depend only on the text, so they can be cached like model output.
+    """
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed_one(text) for text in texts]
+
+    def _embed_one(self, text: str) -> list[float]:
+        words = [w for w in _TOKEN_RE.findall(text.lower()) if w not in STOPWORDS]
+        features = Counter(words)
+        features.update(w[:5] for w in words if len(w) > 5)
+
+        vector = [0.0] * self.dim
+        for feature, count in features.items():
+            h = zlib.crc32(feature.encode("utf-8"))
+            sign = 1.0 if h & 0x80000000 else -1.0
+            vector[h % self.dim] += sign * (1.0 + math.log(count))
+        norm = math.sqrt(sum(v * v for v in vector))
+        return [v / norm for v in vector] if norm else vector
+
+
+class SentenceTransformerEmbedder:
+    """Small local sentence-embedding model (needs ``sentence-transformers``)."""
+
+    def __init__(self, model: str = DEFAULT_MODEL):
+        from sentence_transformers import SentenceTransformer
+        self.model = SentenceTransformer(model, device="cpu")
+        self.name = f"st-{model}"
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        vectors = self.model.encode(texts, batch_size=32, normalize_embeddings=True, show_progress_bar=False)
+        return [list(map(float, v)) for v in vectors]
+
+
+_embedders: dict[str, object] = {}
+_embedders_lock = threading.Lock()
+
+
+def get_embedder(model: Optional[str] = None):
+    """The process-wide embedder for ``model``.
+
+    A sentence-transformers model if it is installed and loads (the first
+    load may need to download it), else the hashing fallback.
+    """
+    model = model or DEFAULT_MODEL
+    with _embedders_lock:
+        if model not in _embedders:
+            try:
+                _embedders[model] = SentenceTransformerEmbedder(model)
+            except (ImportError, OSError):
+                _embedders[model] = HashingEmbedder()
+        return _embedders[model]
+
+
+class EmbeddingCache:
+    """SQLite store of embeddings keyed by embedder name and text hash."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else CACHE_DIR / "embeddings.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+
+    @staticmethod
+    def key(embedder_name: str, text: str) -> str:
+        return hashlib.sha256(f"{embedder_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        if not keys:
+            return {}
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, array("f", vector).tobytes()) for key, vector in items.items()],
+            )
+
+
+def embed_texts(texts: list[str], embedder, cache: Optional[EmbeddingCache] = None) -> list[list[float]]:
+    """Embed ``texts`` in one batch, computing only those missing from ``cache``."""
+    if cache is None:
+        return embedder.embed(texts)
+
+    keys = [EmbeddingCache.key(embedder.name, t) for t in texts]
+    cached = cache.get_many(list(set(keys)))
+    missing = {k: t for k, t in zip(keys, texts) if k not in cached}
+    if missing:
+        computed = dict(zip(missing, embedder.embed(list(missing.values()))))
+        cache.put_many(computed)
+        cached.update(computed)
+    return [cached[k] for k in keys]
@@ -0,0 +1,96 @@
+"""Per-turn latency, token and cost metrics of a finished debate."""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+TOKEN_FIELDS = ("input_tokens", "output_tokens", "cache_read_tokens", "cache_write_tokens")
+
+
+def build_metrics(history: Iterable[dict], moderator_calls: list[dict], wall_seconds: float) -> dict:
+    """Aggregate the ``usage`` of every turn and moderator call.
+
+    ``moderator_calls`` holds ``{"task": ..., "usage": ...}`` dicts. Turns a
+    provider reported nothing for count as calls without tokens or timings.
+    """
+    turns = [
+        {"round": entry["round"], "agent": entry["agent"], **_usage(entry.get("usage"))}
+        for entry in history
+    ]
+    calls = [{"task": call["task"], **_usage(call.get("usage"))} for call in moderator_calls]
+
+    agents = {}
+    for turn in turns:
+        agents.setdefault(turn["agent"], []).append(turn)
+
+    return {
+        "wall_seconds": round(wall_seconds, 3),
+        "turns": turns,
+        "agents": {name: _aggregate(agent_turns) for name, agent_turns in agents.items()},
+        "moderator": {**_aggregate(calls), "tasks": calls},
+        "totals": _aggregate(turns + calls),
+    }
+
+
+def format_metrics(metrics: dict) -> list[str]:
+    """Markdown lines for the report's metrics section."""
+    totals = metrics["totals"]
+    lines = [
+        "# Metrics",
+        "",
+        f"**Wall time:** {metrics['wall_seconds']:.1f}s",
+        f"**Calls:** {totals['calls']} ({totals['retries']} retries)",
+        f"**Tokens:** {totals['input_tokens']:,} in ({totals['cache_read_tokens']:,} cached), "
+        f"{totals['output_tokens']:,} out",
+        f"**Estimated cost:** {_money(totals['cost_usd'])}",
+        "",
+        "| Participant | Calls | Tokens in | Tokens out | Mean TTFT | Mean latency | Max latency | Cost |",
+        "|-------------|-------|-----------|------------|-----------|--------------|-------------|------|",
+    ]
+    rows = dict(metrics["agents"])
+    if metrics["moderator"]["calls"]:
+        rows["Moderator"] = metrics["moderator"]
+    for name, stats in rows.items():
+        name = name.replace("|", "\\|")
+        lines.append(
+            f"| {name} | {stats['calls']} | {stats['input_tokens']:,} | {stats['output_tokens']:,} | "
+            f"{_seconds(stats['mean_ttft'])} | {_seconds(stats['mean_latency'])} | "
+            f"{_seconds(stats['max_latency'])} | {_money(stats['cost_usd'])} |"
+        )
+    lines.append("")
+    return lines
+
+
+def _usage(usage: Optional[dict]) -> dict:
+    usage = usage or {}
+    return {
+        **{field: usage.get(field) or 0 for field in TOKEN_FIELDS},
+        "ttft": usage.get("ttft"),
+        "latency": usage.get("latency"),
+        "retries": usage.get("retries") or 0,
+        "cost_usd": usage.get("cost_usd"),
+    }
+
+
+def _aggregate(calls: list[dict]) -> dict:
+    latencies = [c["latency"] for c in calls if c["latency"] is not None]
+    ttfts = [c["ttft"] for c in calls if c["ttft"] is not None]
+    costs = [c["cost_usd"] for c in calls if c["cost_usd"] is not None]
+    return {
+        "calls": len(calls),
+        **{field: sum(c[field] for c in calls) for field in TOKEN_FIELDS},
+        "retries": sum(c["retries"] for c in calls),
+        "mean_ttft": round(sum(ttfts) / len(ttfts), 3) if ttfts else None,
+        "mean_latency": round(sum(latencies) / len(latencies), 3) if latencies else None,
+        "max_latency": max(latencies) if latencies else None,
+        # A sum over the priced calls only; None when no call had a known price
+        "cost_usd": round(sum(costs), 6) if costs else None,
+    }
+
+
+def _seconds(value: Optional[float]) -> str:
+    return f"{value:.2f}s" if value is not None else "n/a"
+
+
+def _money(value: Optional[float]) -> str:
+    return f"${value:.4f}" if value is not None else "n/a"
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Optional
 
 from agora.providers.base import LLMProvider
+from agora.transcript import Transcript, format_turn
 
 
 class Moderator:
@@ -12,10 +13,59 @@ class Moderator:
 
     def __init__(self, provider: Optional[LLMProvider] = None):
         self.provider = provider or LLMProvider.resolve("anthropic")
+        # Usage of the most recent summary or synthesis (see LLMProvider.last_usage)
+        self.last_usage: Optional[dict] = None
 
     def synthesize(self, topic: str, history: list[dict], agent_names: list[str]) -> str:
         """Read the full debate transcript and produce a synthesis."""
-        transcript = self._format_transcript(history)
+        system, messages = self._build_prompt(topic, history, agent_names)
+        LLMProvider.reset_usage()
+        text = self.provider.complete(system, messages, max_tokens=2048)
+        self.last_usage = LLMProvider.last_usage()
+        return text
+
+    async def asynthesize(self, topic: str, history: list[dict], agent_names: list[str]) -> str:
+        """Async variant of ``synthesize``."""
+        system, messages = self._build_prompt(topic, history, agent_names)
+        LLMProvider.reset_usage()
+        text = await self.provider.acomplete(system, messages, max_tokens=2048)
+        self.last_usage = LLMProvider.last_usage()
+        return text
+
+    def summarize_round(self, topic: str, round_num: int, entries: list[dict]) -> str:
+        """Condense one round into a short summary that replaces it in later prompts."""
+        system, messages = self._build_summary_prompt(topic, round_num, entries)
+        LLMProvider.reset_usage()
+        text = self.provider.complete(system, messages, max_tokens=400)
+        self.last_usage = LLMProvider.last_usage()
+        return text
+
+    async def asummarize_round(self, topic: str, round_num: int, entries: list[dict]) -> str:
+        """Async variant of ``summarize_round``."""
+        system, messages = self._build_summary_prompt(topic, round_num, entries)
+        LLMProvider.reset_usage()
+        text = await self.provider.acomplete(system, messages, max_tokens=400)
+        self.last_usage = LLMProvider.last_usage()
+        return text
+
+    @staticmethod
+    def _build_summary_prompt(topic: str, round_num: int, entries: list[dict]) -> tuple[str, list[dict]]:
+        system = (
+            "You are a neutral debate moderator keeping minutes.\n"
+            "Summarize a debate round faithfully and compactly. Do not add opinions."
+        )
+        turns = "".join(format_turn(entry) for entry in entries)
+        user_prompt = (
+            f"The debate topic is: \"{topic}\"\n\n"
+            f"Here is round {round_num}:\n\n{turns}"
+            f"Summarize this round in at most 150 words. For each participant, by name, "
+            f"give their position and strongest argument in one or two sentences, then note "
+            f"where they agreed or clashed."
+        )
+        return system, [{"role": "user", "content": user_prompt}]
+
+    def _build_prompt(self, topic: str, history: list[dict], agent_names: list[str]) -> tuple[str, list[dict]]:
+        transcript = Transcript.of(history).prompt_text()
 
         system = (
             "You are a neutral, highly analytical debate moderator.\n"
@@ -26,7 +76,7 @@ class Moderator:
         user_prompt = (
             f"The debate topic was: \"{topic}\"\n"
             f"Participants: {', '.join(agent_names)}\n\n"
-            f"Full transcript:\n\n{transcript}\n\n"
+            f"Full transcript:\n\n{transcript}\n"
             f"Please provide your synthesis in EXACTLY this format:\n\n"
             f"## Key Arguments FOR\n"
             f"- (list the strongest arguments in favor)\n\n"
@@ -41,11 +91,4 @@ class Moderator:
             f"followed by a brief justification)"
         )
 
-        return self.provider.complete(system, [{"role": "user", "content": user_prompt}], max_tokens=2048)
-
-    @staticmethod
-    def _format_transcript(history: list[dict]) -> str:
-        lines = []
-        for entry in history:
-            lines.append(f"[Round {entry['round']}] {entry['agent']}:\n{entry['text']}\n")
-        return "\n".join(lines)
+        return system, [{"role": "user", "content": user_prompt}]
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import os
+import re
+import threading
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 
 PERSONAS_DIR = Path(__file__).resolve().parent.parent / "personas"
 
+# Your own presets; AGORA_PERSONAS_PATH (os.pathsep-separated) adds more directories
+USER_PERSONAS_DIR = Path.home() / ".config" / "agora" / "personas"
+
 # Fallback colors assigned to agents in order
 AGENT_COLORS = [
     "cyan",
@@ -23,34 +26,194 @@ AGENT_COLORS = [
     "bright_magenta",
 ]
 
+# Top-level "name:" and every "- name:" line, read by the header-only listing
+_TITLE_RE = re.compile(r"^name:\s*(.+?)\s*$")
+_AGENT_NAME_RE = re.compile(r"^\s*-\s*name:\s*(.+?)\s*$")
+
+
+class PresetRegistry:
+    """Presets found in ``dirs``, scanned once and parsed on first use.
+
+    When two directories hold a preset of the same name, the earlier one
+    wins. Parsed presets are cached with their file's modification time: an
+    edited file is re-read and validated on its next ``get``, everything
+    else is a dictionary lookup. ``refresh`` picks up added or removed files.
+    """
+
+    def __init__(self, dirs: Optional[list] = None):
+        self.dirs = [Path(d) for d in dirs] if dirs is not None else preset_dirs()
+        self._paths: Optional[dict[str, Path]] = None
+        self._cache: dict[Path, tuple[int, dict]] = {}
+        self._lock = threading.Lock()
+
+    def paths(self) -> dict[str, Path]:
+        """Preset name -> YAML file, sorted by name."""
+        with self._lock:
+            if self._paths is None:
+                found = {}
+                for directory in reversed(self.dirs):
+                    if directory.is_dir():
+                        found.update((path.stem, path) for path in (*directory.glob("*.yaml"), *directory.glob("*.yml")))
+                self._paths = dict(sorted(found.items()))
+            return self._paths
+
+    def names(self) -> list[str]:
+        return list(self.paths())
+
+    def get(self, name: str) -> dict:
+        """The validated preset ``name``; raises FileNotFoundError or ValueError.
+
+        The result is shared with other callers and must not be modified.
+        """
+        path = self.paths().get(name)
+        if path is None:
+            raise FileNotFoundError(f"Preset '{name}' not found. Available: {', '.join(self.paths())}")
+        return self.load_file(path)
+
+    def load_file(self, path: Path) -> dict:
+        """The validated preset in ``path``, parsed again only if the file changed."""
+        path = Path(path)
+        mtime = path.stat().st_mtime_ns
+        cached = self._cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        data = parse_preset(path)
+        with self._lock:
+            self._cache[path] = (mtime, data)
+        return data
+
+    def headers(self) -> list[dict]:
+        """``preset``, ``name``, ``agents`` and ``path`` of every preset, without parsing the YAML.
+
+        Presets are scanned line by line for their title and agent names;
+        a file this finds no agents in is parsed in full (and listed without
+        agents if it is invalid).
+        """
+        headers = []
+        for preset, path in self.paths().items():
+            title, agents = preset, []
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if match := _TITLE_RE.match(line):
+                        title = _unquote(match.group(1))
+                    elif match := _AGENT_NAME_RE.match(line):
+                        agents.append(_unquote(match.group(1)))
+            if not agents:
+                try:
+                    data = self.load_file(path)
+                    title, agents = data.get("name", preset), [a["name"] for a in data["agents"]]
+                except ValueError:
+                    pass
+            headers.append({"preset": preset, "name": title, "agents": agents, "path": str(path)})
+        return headers
+
+    def refresh(self) -> None:
+        """Scan the directories again and forget every parsed preset."""
+        with self._lock:
+            self._paths = None
+            self._cache.clear()
+
+
+_registry: Optional[PresetRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def preset_dirs() -> list[Path]:
+    """Directories searched for presets, first match wins.
+
+    ``AGORA_PERSONAS_PATH`` entries first, then ``USER_PERSONAS_DIR``, then
+    the built-in ``PERSONAS_DIR``.
+    """
+    extra = [Path(d).expanduser() for d in os.environ.get("AGORA_PERSONAS_PATH", "").split(os.pathsep) if d]
+    return extra + [USER_PERSONAS_DIR, PERSONAS_DIR]
+
+
+def get_registry() -> PresetRegistry:
+    """The process-wide registry over ``preset_dirs()``."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = PresetRegistry()
+        return _registry
+
 
 def list_presets() -> list[str]:
     """Return available preset names (YAML filenames without extension)."""
-    if not PERSONAS_DIR.is_dir():
-        return []
-    return sorted(p.stem for p in PERSONAS_DIR.glob("*.yaml"))
+    return get_registry().names()
 
 
-def load_preset(name: str) -> dict:
-    """Load a persona preset by name.
+def load_preset(name: str, allow_paths: bool = False) -> dict:
+    """Load a persona preset by name or, with ``allow_paths``, from a path to a YAML file.
 
     Returns dict with keys: name (str), agents (list of {name, role}).
+    Agents may set ``provider`` and ``model``; an optional ``moderator``
+    mapping does the same for the moderator. Raises FileNotFoundError for
+    unknown presets and ValueError for invalid ones. Only local callers such
+    as the CLI should allow paths; the server must not read arbitrary files.
     """
-    path = PERSONAS_DIR / f"{name}.yaml"
-    if not path.exists():
-        raise FileNotFoundError(
-            f"Preset '{name}' not found. Available: {', '.join(list_presets())}"
-        )
-    with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    registry = get_registry()
+    if allow_paths and name.endswith((".yaml", ".yml")) and Path(name).is_file():
+        data = registry.load_file(Path(name))
+    else:
+        data = registry.get(name)
+    # Copies, so callers cannot change the cached preset
+    copy = {**data, "agents": [dict(agent) for agent in data["agents"]]}
+    if data.get("moderator"):
+        copy["moderator"] = dict(data["moderator"])
+    return copy
+
+
+def parse_preset(path: Path) -> dict:
+    """Read and validate a preset file; raises ValueError naming the problem."""
+    import yaml
+
+    from agora.providers.base import PROVIDERS
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Preset {path} is not valid YAML: {e}") from None
 
-    # Assign colors to agents
-    for i, agent in enumerate(data.get("agents", [])):
-        agent.setdefault("color", AGENT_COLORS[i % len(AGENT_COLORS)])
+    def check(condition: bool, problem: str) -> None:
+        if not condition:
+            raise ValueError(f"Preset {path}: {problem}")
 
+    check(isinstance(data, dict), "must be a mapping with 'name' and 'agents'")
+    check(isinstance(data.get("name", ""), str), "'name' must be text")
+    agents = data.get("agents")
+    check(isinstance(agents, list) and agents, "'agents' must be a non-empty list")
+    backends = [(f"agent {i}", agent) for i, agent in enumerate(agents, start=1)]
+    if data.get("moderator") is not None:
+        check(isinstance(data["moderator"], dict), "'moderator' must be a mapping with 'provider' and/or 'model'")
+        backends.append(("moderator", data["moderator"]))
+    names = set()
+    for i, agent in enumerate(agents, start=1):
+        check(isinstance(agent, dict), f"agent {i} must be a mapping with 'name' and 'role'")
+        for key in ("name", "role"):
+            check(isinstance(agent.get(key), str) and agent[key].strip(), f"agent {i} needs a '{key}'")
+        check(agent["name"] not in names, f"agent name '{agent['name']}' is used twice")
+        names.add(agent["name"])
+        agent.setdefault("color", AGENT_COLORS[(i - 1) % len(AGENT_COLORS)])
+    for label, config in backends:
+        for key in ("provider", "model", "color"):
+            check(config.get(key) is None or isinstance(config[key], str), f"{label}: '{key}' must be text")
+        check(
+            config.get("provider") in (None, *PROVIDERS),
+            f"{label}: unknown provider '{config.get('provider')}' (available: {', '.join(PROVIDERS)})",
+        )
     return data
 
 
+def _unquote(value: str) -> str:
+    """A YAML scalar from a header line: quotes removed, but no other YAML features."""
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"')
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        return value[1:-1].replace("''", "'")
+    return value.split(" #")[0].rstrip()
+
+
 def make_neutral_agents(count: int) -> list[dict]:
     """Create N neutral agents with generic analytical perspectives."""
     perspectives = [
@@ -78,6 +241,8 @@ def parse_agent_spec(spec: str) -> Optional[list[dict]]:
 
     If spec is a number, returns None (caller should use make_neutral_agents).
     If spec is comma-separated names, returns agent dicts with generic roles.
+    A name may pick its own backend as ``name@provider[:model]``, e.g.
+    "Bull@openai:gpt4o-mini,Bear@anthropic:opus".
     """
     spec = spec.strip()
     if spec.isdigit():
@@ -85,10 +250,34 @@ def parse_agent_spec(spec: str) -> Optional[list[dict]]:
 
     names = [n.strip() for n in spec.split(",") if n.strip()]
     agents = []
-    for i, name in enumerate(names):
-        agents.append({
+    for i, entry in enumerate(names):
+        name, _, backend = entry.partition("@")
+        name = name.strip()
+        agent = {
             "name": name,
             "role": f"You are '{name}'. Embody this persona fully and argue from that perspective.",
             "color": AGENT_COLORS[i % len(AGENT_COLORS)],
-        })
+        }
+        if backend.strip():
+            from agora.providers.base import parse_backend
+            agent["provider"], agent["model"] = parse_backend(backend)
+        agents.append(agent)
     return agents
+
+
+def resolve_participants(
+    preset: Optional[str], agents: str, allow_paths: bool = False
+) -> tuple[list[dict], Optional[dict]]:
+    """Agent configs and moderator config from a preset name or an --agents spec.
+
+    Without a preset, ``agents`` is a number of neutral agents or a list of
+    names (see ``parse_agent_spec``) and the moderator config is None.
+    ``allow_paths`` is passed to ``load_preset``.
+    """
+    if preset:
+        data = load_preset(preset, allow_paths=allow_paths)
+        return data["agents"], data.get("moderator")
+    parsed = parse_agent_spec(agents)
+    if parsed is None:
+        return make_neutral_agents(int(agents)), None
+    return parsed, None
@@ -1,11 +1,13 @@
 """Anthropic (Claude) provider."""
 
 from __future__ import annotations
-import os
 import time
-from typing import Optional, Iterator
+from typing import Optional, Iterator, AsyncIterator
 
-from agora.providers.base import LLMProvider
+from agora.providers.base import LLMProvider, require_api_key
+from agora.providers.ratelimit import (
+    acall_with_retry, astream_with_retry, call_with_retry, estimate_request_tokens, get_limiter, stream_with_retry,
+)
 
 MODELS = {
     "haiku": "claude-3-5-haiku-20241022",
@@ -15,42 +17,137 @@ MODELS = {
 
 DEFAULT_MODEL = "sonnet"
 
+# USD per million (input, output) tokens
+PRICES = {
+    "claude-3-5-haiku-20241022": (0.80, 4.00),
+    "claude-sonnet-4-20250514": (3.00, 15.00),
+    "claude-opus-4-0-20250514": (15.00, 75.00),
+}
+
 
 class AnthropicProvider(LLMProvider):
     """Claude via Anthropic API."""
 
     def __init__(self, model: Optional[str] = None):
         import anthropic
-        key = os.environ.get("ANTHROPIC_API_KEY")
-        if not key:
-            raise EnvironmentError("ANTHROPIC_API_KEY not set. Get one at https://console.anthropic.com/")
-        self.client = anthropic.Anthropic(api_key=key)
+        key = require_api_key("anthropic")
+        # Retries are handled by agora.providers.ratelimit, shared across all calls
+        self.client = anthropic.Anthropic(api_key=key, max_retries=0)
+        self._new_async_client = lambda: anthropic.AsyncAnthropic(api_key=key, max_retries=0)
+        self.limiter = get_limiter("anthropic")
         model_name = model or DEFAULT_MODEL
         self.model = MODELS.get(model_name.lower(), model_name)
         self.display_name = model_name
 
+    @property
+    def async_client(self):
+        return self._loop_client(self._new_async_client)
+
     def complete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
-        for attempt in range(3):
-            try:
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=max_tokens,
-                    system=system,
-                    messages=messages,
-                )
-                return response.content[0].text
-            except Exception as e:
-                if attempt < 2 and ("rate" in str(e).lower() or "overloaded" in str(e).lower()):
-                    time.sleep(2 ** attempt)
-                else:
-                    raise
+        started = time.monotonic()
+
+        def call(attempt: int) -> str:
+            response = self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                system=self._system_blocks(system),
+                messages=self._with_breakpoints(messages),
+            )
+            self._record(response.usage, started, retries=attempt)
+            return response.content[0].text
+
+        return call_with_retry(self.limiter, estimate_request_tokens(system, messages), call)
 
     def stream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> Iterator[str]:
-        with self.client.messages.stream(
-            model=self.model,
-            max_tokens=max_tokens,
-            system=system,
-            messages=messages,
-        ) as stream:
-            for text in stream.text_stream:
-                yield text
+        started = time.monotonic()
+
+        def attempt_stream(attempt: int) -> Iterator[str]:
+            first_token = None
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                system=self._system_blocks(system),
+                messages=self._with_breakpoints(messages),
+            ) as stream:
+                for text in stream.text_stream:
+                    first_token = first_token or time.monotonic()
+                    yield text
+                self._record(stream.get_final_message().usage, started, first_token, retries=attempt)
+
+        yield from stream_with_retry(self.limiter, estimate_request_tokens(system, messages), attempt_stream)
+
+    async def acomplete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
+        started = time.monotonic()
+
+        async def call(attempt: int) -> str:
+            response = await self.async_client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                system=self._system_blocks(system),
+                messages=self._with_breakpoints(messages),
+            )
+            self._record(response.usage, started, retries=attempt)
+            return response.content[0].text
+
+        return await acall_with_retry(self.limiter, estimate_request_tokens(system, messages), call)
+
+    async def astream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> AsyncIterator[str]:
+        started = time.monotonic()
+
+        async def attempt_stream(attempt: int) -> AsyncIterator[str]:
+            first_token = None
+            async with self.async_client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                system=self._system_blocks(system),
+                messages=self._with_breakpoints(messages),
+            ) as stream:
+                async for text in stream.text_stream:
+                    first_token = first_token or time.monotonic()
+                    yield text
+                self._record((await stream.get_final_message()).usage, started, first_token, retries=attempt)
+
+        async for text in astream_with_retry(self.limiter, estimate_request_tokens(system, messages), attempt_stream):
+            yield text
+
+    @staticmethod
+    def _system_blocks(system: str) -> list[dict]:
+        """The system prompt is identical on every turn of an agent, so cache it."""
+        return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
+    @staticmethod
+    def _with_breakpoints(messages: list[dict]) -> list[dict]:
+        """Turn the agents' neutral ``cache`` markers into cache-control breakpoints."""
+        prepared = []
+        for msg in messages:
+            content = msg["content"]
+            if isinstance(content, list):
+                blocks = []
+                for block in content:
+                    converted = {"type": "text", "text": block["text"]}
+                    if block.get("cache"):
+                        converted["cache_control"] = {"type": "ephemeral"}
+                    blocks.append(converted)
+                content = blocks
+            prepared.append({"role": msg["role"], "content": content})
+        return prepared
+
+    def _record(self, usage, started: float, first_token: Optional[float] = None, retries: int = 0) -> None:
+        # Anthropic reports cached prompt tokens separately from input_tokens
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        input_tokens = usage.input_tokens + cache_read + cache_write
+        self._record_usage(
+            input_tokens=input_tokens,
+            output_tokens=usage.output_tokens,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
+            started=started,
+            first_token=first_token,
+            retries=retries,
+            # Cache reads bill at 10% of the input price, 5-minute cache writes at 125%
+            cost_usd=self._estimate_cost(
+                PRICES.get(self.model), input_tokens, usage.output_tokens,
+                cache_read, cache_write, cache_read_factor=0.1, cache_write_factor=1.25,
+            ),
+        )
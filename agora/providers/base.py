@@ -1,8 +1,67 @@
 """Base class for LLM providers."""
 
 from __future__ import annotations
+import asyncio
+import contextvars
+import hashlib
+import importlib
+import importlib.util
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Iterator
+from typing import Callable, Optional, Iterator, AsyncIterator, TypeVar
+
+T = TypeVar("T")
+
+# Usage of the most recent call, tracked per thread / asyncio task so that
+# concurrent agents sharing one provider instance do not see each other's numbers.
+_last_usage: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar("agora_last_usage", default=None)
+
+
+# Per provider: environment variable with the API key, where to get a key, SDK module
+API_KEYS = {
+    "anthropic": ("ANTHROPIC_API_KEY", "https://console.anthropic.com/", "anthropic"),
+    "openai": ("OPENAI_API_KEY", "https://platform.openai.com/api-keys", "openai"),
+    "gemini": ("GOOGLE_API_KEY", "https://aistudio.google.com/apikey", "google.generativeai"),
+    "grok": ("XAI_API_KEY", "https://console.x.ai/", "openai"),
+}
+
+# Per provider: module and class, imported only when that provider is resolved
+PROVIDERS = {
+    "anthropic": ("agora.providers.anthropic", "AnthropicProvider"),
+    "openai": ("agora.providers.openai", "OpenAIProvider"),
+    "gemini": ("agora.providers.gemini", "GeminiProvider"),
+    "grok": ("agora.providers.grok", "GrokProvider"),
+    # Offline synthetic responses, configured by AGORA_MOCK_* (see agora.providers.mock)
+    "mock": ("agora.providers.mock", "MockProvider"),
+}
+
+# Provider instances (and with them SDK clients and their connection pools)
+# shared process-wide, keyed by (provider, model, API key hash, cache mode).
+_registry: dict[tuple, "LLMProvider"] = {}
+_registry_lock = threading.RLock()
+
+
+def require_api_key(provider: str) -> str:
+    """The provider's API key from the environment. Raises EnvironmentError if unset."""
+    env_var, signup_url, _ = API_KEYS[provider]
+    key = os.environ.get(env_var)
+    if not key:
+        raise EnvironmentError(f"{env_var} not set. Get one at {signup_url}")
+    return key
+
+
+def default_model(provider: str) -> str:
+    """The model ``provider`` uses when none is given."""
+    module_name, _ = PROVIDERS[provider.lower()]
+    return importlib.import_module(module_name).DEFAULT_MODEL
+
+
+def parse_backend(spec: str) -> tuple[str, Optional[str]]:
+    """Split a "provider[:model]" spec, e.g. "openai:gpt4o-mini"."""
+    name, _, model = spec.strip().partition(":")
+    return name.strip().lower(), model.strip() or None
 
 
 class LLMProvider(ABC):
@@ -18,23 +77,201 @@ class LLMProvider(ABC):
         """Stream a completion. Yields text chunks."""
         ...
 
+    async def acomplete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
+        """Generate a completion without blocking the event loop.
+
+        The default runs ``complete`` in a worker thread; providers with an
+        async SDK client override this.
+        """
+        ctx = contextvars.copy_context()
+        text = await asyncio.to_thread(ctx.run, self.complete, system, messages, max_tokens)
+        _last_usage.set(ctx.get(_last_usage))
+        return text
+
+    async def astream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> AsyncIterator[str]:
+        """Stream a completion without blocking the event loop. Yields text chunks.
+
+        The default pulls chunks from ``stream`` in a worker thread; providers
+        with an async SDK client override this.
+        """
+        ctx = contextvars.copy_context()
+        iterator = iter(self.stream(system, messages, max_tokens))
+        done = object()
+        while True:
+            chunk = await asyncio.to_thread(ctx.run, next, iterator, done)
+            if chunk is done:
+                break
+            yield chunk
+        _last_usage.set(ctx.get(_last_usage))
+
+    @staticmethod
+    def last_usage() -> Optional[dict]:
+        """Usage metadata of the last call made from the current thread or task.
+
+        Keys: ``input_tokens`` (all prompt tokens, cached or not),
+        ``output_tokens``, ``cache_read_tokens``, ``cache_write_tokens``,
+        ``ttft`` (seconds to the first chunk), ``latency`` (seconds for the
+        whole call), ``retries`` and ``cost_usd`` (estimated from list
+        prices; None for unknown models). ``None`` if the provider reported
+        nothing.
+        """
+        return _last_usage.get()
+
     @staticmethod
-    def resolve(provider: str, model: Optional[str] = None) -> "LLMProvider":
-        """Factory: resolve provider name to instance."""
-        from agora.providers.anthropic import AnthropicProvider
-        from agora.providers.openai import OpenAIProvider
-        from agora.providers.gemini import GeminiProvider
-        from agora.providers.grok import GrokProvider
-
-        providers = {
-            "anthropic": AnthropicProvider,
-            "openai": OpenAIProvider,
-            "gemini": GeminiProvider,
-            "grok": GrokProvider,
-        }
+    def reset_usage() -> None:
+        """Forget the last call's usage, so a call that reports none is not charged for it."""
+        _last_usage.set(None)
 
+    @staticmethod
+    def _record_usage(
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        started: Optional[float] = None,
+        first_token: Optional[float] = None,
+        retries: int = 0,
+        cost_usd: Optional[float] = None,
+    ) -> None:
+        """Store a call's usage. ``started``/``first_token`` are ``time.monotonic()`` stamps."""
+        now = time.monotonic()
+        _last_usage.set({
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cache_read_tokens": cache_read_tokens,
+            "cache_write_tokens": cache_write_tokens,
+            "ttft": round((first_token or now) - started, 3) if started is not None else None,
+            "latency": round(now - started, 3) if started is not None else None,
+            "retries": retries,
+            "cost_usd": cost_usd,
+        })
+
+    @staticmethod
+    def _estimate_cost(
+        price: Optional[tuple[float, float]],
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        cache_read_factor: float = 1.0,
+        cache_write_factor: float = 1.0,
+    ) -> Optional[float]:
+        """USD cost from an (input, output) price per million tokens; None without a price."""
+        if price is None:
+            return None
+        input_price, output_price = price
+        uncached = input_tokens - cache_read_tokens - cache_write_tokens
+        cost = (
+            uncached * input_price
+            + cache_read_tokens * input_price * cache_read_factor
+            + cache_write_tokens * input_price * cache_write_factor
+            + output_tokens * output_price
+        )
+        return round(cost / 1_000_000, 6)
+
+    @staticmethod
+    def flatten_messages(messages: list[dict]) -> list[dict]:
+        """Collapse content block lists into plain strings.
+
+        Agents send the transcript as a list of ``{"type": "text", "text": ...}``
+        blocks so that cache-aware providers can place breakpoints; providers
+        that cache prefixes automatically just need the joined text.
+        """
+        flat = []
+        for msg in messages:
+            content = msg["content"]
+            if isinstance(content, list):
+                content = "".join(block["text"] for block in content)
+            flat.append({"role": msg["role"], "content": content})
+        return flat
+
+    def _loop_client(self, factory: Callable[[], T]) -> T:
+        """The async SDK client for the running event loop, created on first use.
+
+        Async HTTP connection pools belong to the loop that opened them, so a
+        provider shared across ``asyncio.run`` calls keeps one client per loop.
+        """
+        loop = asyncio.get_running_loop()
+        cached = getattr(self, "_async_client_cache", None)
+        if cached is None or cached[0] is not loop:
+            cached = (loop, factory())
+            self._async_client_cache = cached
+        return cached[1]
+
+    @staticmethod
+    def check_credentials(provider: str) -> None:
+        """Cheaply check that ``provider`` could be resolved, without building a client.
+
+        Raises ValueError for an unknown provider, EnvironmentError for a
+        missing API key and ImportError for a missing SDK.
+        """
         name = provider.lower()
-        if name not in providers:
-            raise ValueError(f"Unknown provider '{provider}'. Available: {', '.join(providers.keys())}")
+        if name not in PROVIDERS:
+            raise ValueError(f"Unknown provider '{provider}'. Available: {', '.join(PROVIDERS)}")
+        if name not in API_KEYS:
+            return
+        require_api_key(name)
+        sdk = API_KEYS[name][2]
+        try:
+            # Raises rather than returning None when a parent package (e.g. ``google``) is missing
+            found = importlib.util.find_spec(sdk) is not None
+        except ModuleNotFoundError:
+            found = False
+        if not found:
+            raise ImportError(f"The {name} provider needs the '{sdk}' package")
+
+    @staticmethod
+    def resolve(
+        provider: str,
+        model: Optional[str] = None,
+        cache: Optional[str] = None,
+        fallback: Optional[list[str]] = None,
+        hedge_after: Optional[float] = None,
+    ) -> "LLMProvider":
+        """Factory: resolve provider name to instance.
+
+        Instances are shared process-wide per (provider, model, API key,
+        cache mode), so repeated calls reuse SDK clients and their
+        keep-alive connections.
+
+        ``cache`` ("auto", "record" or "replay") wraps the provider in a
+        ``CachingProvider`` that records and replays responses.
+
+        ``fallback`` lists "provider[:model]" backends to fail over to, in
+        order; ``hedge_after`` sends a request that has not started answering
+        within that many seconds to the next backend as well (the same
+        backend again if there is no fallback). See ``FallbackProvider``.
+        """
+        name = provider.lower()
+        if name not in PROVIDERS:
+            raise ValueError(f"Unknown provider '{provider}'. Available: {', '.join(PROVIDERS)}")
+
+        # "openai" and "openai:<its default model>" are the same backend
+        model = model or default_model(name)
+        key = require_api_key(name) if name in API_KEYS else ""
+        key_hash = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        with _registry_lock:
+            plain_key = (name, model, key_hash, None)
+            if plain_key not in _registry:
+                module_name, class_name = PROVIDERS[name]
+                provider_class = getattr(importlib.import_module(module_name), class_name)
+                _registry[plain_key] = provider_class(model=model)
+            instance = _registry[plain_key]
+            if cache:
+                # The cached wrapper shares the plain instance's client
+                cached_key = (name, model, key_hash, cache)
+                if cached_key not in _registry:
+                    from agora.providers.cache import CachingProvider
+                    _registry[cached_key] = CachingProvider(instance, name, mode=cache)
+                instance = _registry[cached_key]
 
-        return providers[name](model=model)
+        if fallback or hedge_after is not None:
+            from agora.providers.fallback import FallbackProvider
+            backends = [(name, instance)]
+            for spec in fallback or []:
+                backend_name, backend_model = parse_backend(spec)
+                backends.append((backend_name, LLMProvider.resolve(backend_name, model=backend_model, cache=cache)))
+            if len(backends) == 1:
+                backends.append((name, instance))
+            instance = FallbackProvider(backends, hedge_after=hedge_after)
+        return instance
@@ -0,0 +1,153 @@
+"""Response cache and replay layer around any LLM provider."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Iterator, AsyncIterator
+
+from agora.providers.base import LLMProvider
+
+CACHE_DIR = Path(os.environ.get("AGORA_CACHE_DIR", Path.home() / ".cache" / "agora"))
+
+MODES = ("auto", "record", "replay")
+
+
+class CacheMiss(LookupError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+class ResponseStore:
+    """SQLite table of recorded responses with entry-count and age-based eviction."""
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = 5000, max_age_days: float = 30):
+        self.path = Path(path) if path else CACHE_DIR / "responses.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_age = max_age_days * 86400
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, chunks TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[list[str]]:
+        """Recorded chunks for ``key``, or None if missing or expired."""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT chunks FROM responses WHERE key = ? AND created >= ?", (key, now - self.max_age)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def put(self, key: str, chunks: list[str]) -> None:
+        """Record a response and evict expired or least recently used entries."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, chunks, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(chunks), now, now),
+            )
+            self._conn.execute("DELETE FROM responses WHERE created < ?", (now - self.max_age,))
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+
+class CachingProvider(LLMProvider):
+    """Wraps a provider and records or replays its responses.
+
+    Requests are keyed on (provider, model, system, messages, max_tokens).
+    Modes:
+      auto    replay recorded responses, call the provider on a miss and record it
+      record  always call the provider and (re-)record the response
+      replay  only replay; a miss raises ``CacheMiss`` (deterministic tests, offline)
+
+    ``complete`` and ``stream`` share entries: a streamed response replays as
+    the same chunks, a completion replays as a single chunk.
+    """
+
+    def __init__(self, inner: LLMProvider, provider_name: str, mode: str = "auto", store: Optional[ResponseStore] = None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cache mode '{mode}'. Available: {', '.join(MODES)}")
+        self.inner = inner
+        self.provider_name = provider_name
+        self.mode = mode
+        self.store = store or ResponseStore()
+        self.display_name = inner.display_name
+        self._model_id = str(getattr(inner, "model_id", None) or getattr(inner, "model", None) or inner.display_name)
+
+    def complete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
+        key = self._key(system, messages, max_tokens)
+        chunks = self._lookup(key)
+        if chunks is not None:
+            return "".join(chunks)
+        text = self.inner.complete(system, messages, max_tokens)
+        self.store.put(key, [text])
+        return text
+
+    def stream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> Iterator[str]:
+        key = self._key(system, messages, max_tokens)
+        chunks = self._lookup(key)
+        if chunks is not None:
+            yield from chunks
+            return
+        recorded = []
+        for chunk in self.inner.stream(system, messages, max_tokens):
+            recorded.append(chunk)
+            yield chunk
+        self.store.put(key, recorded)
+
+    async def acomplete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
+        key = self._key(system, messages, max_tokens)
+        chunks = self._lookup(key)
+        if chunks is not None:
+            return "".join(chunks)
+        text = await self.inner.acomplete(system, messages, max_tokens)
+        self.store.put(key, [text])
+        return text
+
+    async def astream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> AsyncIterator[str]:
+        key = self._key(system, messages, max_tokens)
+        chunks = self._lookup(key)
+        if chunks is not None:
+            for chunk in chunks:
+                yield chunk
+            return
+        recorded = []
+        async for chunk in self.inner.astream(system, messages, max_tokens):
+            recorded.append(chunk)
+            yield chunk
+        self.store.put(key, recorded)
+
+    def _key(self, system: str, messages: list[dict], max_tokens: int) -> str:
+        payload = json.dumps(
+            [self.provider_name, self._model_id, system, messages, max_tokens],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[list[str]]:
+        if self.mode == "record":
+            return None
+        chunks = self.store.get(key)
+        if chunks is None and self.mode == "replay":
+            raise CacheMiss(f"No recorded response for this request ({self.provider_name}/{self.display_name}).")
+        if chunks is not None:
+            # A replayed turn costs no tokens
+            self._record_usage(cost_usd=0.0)
+        return chunks
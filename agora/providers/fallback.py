@@ -0,0 +1,240 @@
+"""Composite provider that fails over between backends and hedges slow requests."""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional, Iterator, AsyncIterator
+
+from agora.providers.base import LLMProvider, _last_usage
+
+
+class FallbackProvider(LLMProvider):
+    """Sends each request to an ordered list of backends.
+
+    A backend that still fails after its own retries hands the request to the
+    next one. With ``hedge_after`` set, a request that has not produced its
+    first token (for ``complete``: its response) within that many seconds is
+    additionally sent to the next backend, and whichever answers first wins;
+    the other request is abandoned and its tokens are not counted.
+
+    There is no per-request deadline: failover only happens when a backend
+    raises, so a backend that hangs without erroring is bypassed only by
+    ``hedge_after``, and only before its first token. Otherwise the request
+    waits for the backend SDK's own timeout.
+
+    ``last_usage`` reports the winning backend's tokens under ``backend``, with
+    ``ttft`` and ``latency`` measured from the original request.
+    """
+
+    def __init__(self, backends: list[tuple[str, LLMProvider]], hedge_after: Optional[float] = None):
+        if not backends:
+            raise ValueError("FallbackProvider needs at least one backend")
+        self.backends = backends
+        self.hedge_after = hedge_after
+        self.labels = [f"{name}/{backend.display_name}" for name, backend in backends]
+        others = [label for label in dict.fromkeys(self.labels[1:]) if label != self.labels[0]]
+        self.display_name = " → ".join([backends[0][1].display_name] + others)
+
+    def complete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
+        started = time.monotonic()
+        pool = ThreadPoolExecutor(max_workers=len(self.backends))
+        running = {}
+        launched = 0
+        error = None
+
+        def launch() -> None:
+            nonlocal launched
+            running[pool.submit(self._complete_one, launched, system, messages, max_tokens)] = launched
+            launched += 1
+
+        launch()
+        try:
+            while running:
+                done, _ = wait(running, timeout=self._hedge_timeout(launched, started), return_when=FIRST_COMPLETED)
+                if not done:
+                    launch()
+                    continue
+                for future in done:
+                    index = running.pop(future)
+                    try:
+                        text, usage = future.result()
+                    except Exception as e:
+                        error = e
+                        if not running and launched < len(self.backends):
+                            launch()
+                        continue
+                    self._record_winner(index, usage, started)
+                    return text
+            raise error
+        finally:
+            pool.shutdown(wait=False)
+
+    def stream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> Iterator[str]:
+        started = time.monotonic()
+        events: queue.Queue = queue.Queue()
+        cancelled: list[threading.Event] = []
+        running: set[int] = set()
+
+        def pump(index: int, cancel: threading.Event) -> None:
+            try:
+                LLMProvider.reset_usage()
+                for chunk in self.backends[index][1].stream(system, messages, max_tokens):
+                    if cancel.is_set():
+                        return
+                    events.put((index, "chunk", chunk))
+                events.put((index, "done", LLMProvider.last_usage()))
+            except Exception as e:
+                events.put((index, "error", e))
+
+        def launch() -> None:
+            index = len(cancelled)
+            cancelled.append(threading.Event())
+            running.add(index)
+            threading.Thread(target=pump, args=(index, cancelled[index]), daemon=True).start()
+
+        launch()
+        winner, first_token = None, None
+        try:
+            while True:
+                timeout = self._hedge_timeout(len(cancelled), started) if winner is None else None
+                try:
+                    index, kind, payload = events.get(timeout=timeout)
+                except queue.Empty:
+                    launch()
+                    continue
+                if winner is not None and index != winner:
+                    continue
+                if kind == "chunk":
+                    if winner is None:
+                        winner, first_token = index, time.monotonic()
+                        for other in running - {index}:
+                            cancelled[other].set()
+                    yield payload
+                elif kind == "done":
+                    self._record_winner(index, payload, started, first_token)
+                    return
+                else:
+                    running.discard(index)
+                    # Text already shown cannot be taken back, so a broken winner is fatal
+                    if winner == index or (not running and len(cancelled) == len(self.backends)):
+                        raise payload
+                    if not running:
+                        launch()
+        finally:
+            for cancel in cancelled:
+                cancel.set()
+
+    async def acomplete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
+        started = time.monotonic()
+        running: dict[asyncio.Future, int] = {}
+        launched = 0
+        error = None
+
+        def launch() -> None:
+            nonlocal launched
+            running[asyncio.ensure_future(self._acomplete_one(launched, system, messages, max_tokens))] = launched
+            launched += 1
+
+        launch()
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    running, timeout=self._hedge_timeout(launched, started), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    launch()
+                    continue
+                for task in done:
+                    index = running.pop(task)
+                    try:
+                        text, usage = task.result()
+                    except Exception as e:
+                        error = e
+                        if not running and launched < len(self.backends):
+                            launch()
+                        continue
+                    self._record_winner(index, usage, started)
+                    return text
+            raise error
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def astream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> AsyncIterator[str]:
+        started = time.monotonic()
+        events: asyncio.Queue = asyncio.Queue()
+        tasks: list[asyncio.Task] = []
+        running: set[int] = set()
+
+        async def pump(index: int) -> None:
+            try:
+                LLMProvider.reset_usage()
+                async for chunk in self.backends[index][1].astream(system, messages, max_tokens):
+                    await events.put((index, "chunk", chunk))
+                await events.put((index, "done", LLMProvider.last_usage()))
+            except Exception as e:
+                await events.put((index, "error", e))
+
+        def launch() -> None:
+            running.add(len(tasks))
+            tasks.append(asyncio.ensure_future(pump(len(tasks))))
+
+        launch()
+        winner, first_token = None, None
+        try:
+            while True:
+                timeout = self._hedge_timeout(len(tasks), started) if winner is None else None
+                try:
+                    index, kind, payload = await asyncio.wait_for(events.get(), timeout)
+                except asyncio.TimeoutError:
+                    launch()
+                    continue
+                if winner is not None and index != winner:
+                    continue
+                if kind == "chunk":
+                    if winner is None:
+                        winner, first_token = index, time.monotonic()
+                        for other in running - {index}:
+                            tasks[other].cancel()
+                    yield payload
+                elif kind == "done":
+                    self._record_winner(index, payload, started, first_token)
+                    return
+                else:
+                    running.discard(index)
+                    if winner == index or (not running and len(tasks) == len(self.backends)):
+                        raise payload
+                    if not running:
+                        launch()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _complete_one(self, index: int, system: str, messages: list[dict], max_tokens: int) -> tuple[str, Optional[dict]]:
+        LLMProvider.reset_usage()
+        text = self.backends[index][1].complete(system, messages, max_tokens)
+        return text, LLMProvider.last_usage()
+
+    async def _acomplete_one(self, index: int, system: str, messages: list[dict], max_tokens: int) -> tuple[str, Optional[dict]]:
+        LLMProvider.reset_usage()
+        text = await self.backends[index][1].acomplete(system, messages, max_tokens)
+        return text, LLMProvider.last_usage()
+
+    def _hedge_timeout(self, launched: int, started: float) -> Optional[float]:
+        """Seconds until the next hedged request is due, or None if there is none."""
+        if self.hedge_after is None or launched >= len(self.backends):
+            return None
+        return max(0.0, started + self.hedge_after * launched - time.monotonic())
+
+    def _record_winner(self, index: int, usage: Optional[dict], started: float, first_token: Optional[float] = None) -> None:
+        self._record_usage(started=started, first_token=first_token)
+        timing = _last_usage.get()
+        _last_usage.set({
+            **timing,
+            **{key: value for key, value in (usage or {}).items() if key not in ("ttft", "latency")},
+            "backend": self.labels[index],
+        })
@@ -1,11 +1,13 @@
 """Google Gemini provider."""
 
 from __future__ import annotations
-import os
 import time
-from typing import Optional, Iterator
+from typing import Optional, Iterator, AsyncIterator
 
-from agora.providers.base import LLMProvider
+from agora.providers.base import LLMProvider, require_api_key
+from agora.providers.ratelimit import (
+    acall_with_retry, astream_with_retry, call_with_retry, estimate_request_tokens, get_limiter, stream_with_retry,
+)
 
 MODELS = {
     "flash": "gemini-2.0-flash",
@@ -15,51 +17,113 @@ MODELS = {
 
 DEFAULT_MODEL = "flash"
 
+# USD per million (input, output) tokens
+PRICES = {
+    "gemini-2.0-flash": (0.10, 0.40),
+}
+
 
 class GeminiProvider(LLMProvider):
     """Gemini via Google Generative AI API."""
 
     def __init__(self, model: Optional[str] = None):
         import google.generativeai as genai
-        key = os.environ.get("GOOGLE_API_KEY")
-        if not key:
-            raise EnvironmentError("GOOGLE_API_KEY not set. Get one at https://aistudio.google.com/apikey")
-        genai.configure(api_key=key)
+        genai.configure(api_key=require_api_key("gemini"))
         model_name = model or DEFAULT_MODEL
         self.model_id = MODELS.get(model_name.lower(), model_name)
         self.model = genai.GenerativeModel(self.model_id)
+        self.limiter = get_limiter("gemini")
         self.display_name = model_name
 
     def complete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
         prompt = self._build_prompt(system, messages)
-        for attempt in range(3):
-            try:
-                response = self.model.generate_content(
-                    prompt,
-                    generation_config={"max_output_tokens": max_tokens},
-                )
-                return response.text
-            except Exception as e:
-                if attempt < 2 and ("rate" in str(e).lower() or "quota" in str(e).lower()):
-                    time.sleep(2 ** attempt)
-                else:
-                    raise
+        started = time.monotonic()
+
+        def call(attempt: int) -> str:
+            response = self.model.generate_content(
+                prompt,
+                generation_config={"max_output_tokens": max_tokens},
+            )
+            self._record(response.usage_metadata, started, retries=attempt)
+            return response.text
+
+        return call_with_retry(self.limiter, estimate_request_tokens(system, messages), call)
 
     def stream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> Iterator[str]:
         prompt = self._build_prompt(system, messages)
-        response = self.model.generate_content(
-            prompt,
-            generation_config={"max_output_tokens": max_tokens},
-            stream=True,
-        )
-        for chunk in response:
-            if chunk.text:
-                yield chunk.text
+        started = time.monotonic()
+
+        def attempt_stream(attempt: int) -> Iterator[str]:
+            first_token = None
+            response = self.model.generate_content(
+                prompt,
+                generation_config={"max_output_tokens": max_tokens},
+                stream=True,
+            )
+            for chunk in response:
+                if chunk.text:
+                    first_token = first_token or time.monotonic()
+                    yield chunk.text
+            self._record(response.usage_metadata, started, first_token, retries=attempt)
+
+        yield from stream_with_retry(self.limiter, estimate_request_tokens(system, messages), attempt_stream)
+
+    async def acomplete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
+        prompt = self._build_prompt(system, messages)
+        started = time.monotonic()
+
+        async def call(attempt: int) -> str:
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config={"max_output_tokens": max_tokens},
+            )
+            self._record(response.usage_metadata, started, retries=attempt)
+            return response.text
+
+        return await acall_with_retry(self.limiter, estimate_request_tokens(system, messages), call)
+
+    async def astream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> AsyncIterator[str]:
+        prompt = self._build_prompt(system, messages)
+        started = time.monotonic()
+
+        async def attempt_stream(attempt: int) -> AsyncIterator[str]:
+            first_token = None
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config={"max_output_tokens": max_tokens},
+                stream=True,
+            )
+            async for chunk in response:
+                if chunk.text:
+                    first_token = first_token or time.monotonic()
+                    yield chunk.text
+            self._record(response.usage_metadata, started, first_token, retries=attempt)
+
+        async for text in astream_with_retry(self.limiter, estimate_request_tokens(system, messages), attempt_stream):
+            yield text
 
     @staticmethod
     def _build_prompt(system: str, messages: list[dict]) -> str:
         parts = [system, ""]
-        for msg in messages:
+        for msg in LLMProvider.flatten_messages(messages):
             role = msg["role"].upper()
             parts.append(f"{role}: {msg['content']}")
         return "\n\n".join(parts)
+
+    def _record(self, usage, started: float, first_token: Optional[float] = None, retries: int = 0) -> None:
+        # Gemini applies implicit prefix caching on supported models and reports the hits
+        input_tokens = getattr(usage, "prompt_token_count", 0) or 0
+        output_tokens = getattr(usage, "candidates_token_count", 0) or 0
+        cache_read = getattr(usage, "cached_content_token_count", 0) or 0
+        self._record_usage(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cache_read_tokens=cache_read,
+            started=started,
+            first_token=first_token,
+            retries=retries,
+            cost_usd=self._estimate_cost(
+                PRICES.get(self.model_id), input_tokens, output_tokens,
+                cache_read, cache_read_factor=0.25,
+            ),
+        )
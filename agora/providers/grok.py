@@ -1,11 +1,13 @@
 """xAI Grok provider (OpenAI-compatible API)."""
 
 from __future__ import annotations
-import os
 import time
-from typing import Optional, Iterator
+from typing import Optional, Iterator, AsyncIterator
 
-from agora.providers.base import LLMProvider
+from agora.providers.base import LLMProvider, require_api_key
+from agora.providers.ratelimit import (
+    acall_with_retry, astream_with_retry, call_with_retry, estimate_request_tokens, get_limiter, stream_with_retry,
+)
 
 MODELS = {
     "grok": "grok-3",
@@ -14,44 +16,119 @@ MODELS = {
 
 DEFAULT_MODEL = "grok"
 
+# USD per million (input, output) tokens
+PRICES = {
+    "grok-3": (3.00, 15.00),
+    "grok-3-mini": (0.30, 0.50),
+}
+
 
 class GrokProvider(LLMProvider):
     """Grok via xAI API (OpenAI-compatible)."""
 
     def __init__(self, model: Optional[str] = None):
-        from openai import OpenAI
-        key = os.environ.get("XAI_API_KEY")
-        if not key:
-            raise EnvironmentError("XAI_API_KEY not set. Get one at https://console.x.ai/")
-        self.client = OpenAI(api_key=key, base_url="https://api.x.ai/v1")
+        from openai import OpenAI, AsyncOpenAI
+        key = require_api_key("grok")
+        # Retries are handled by agora.providers.ratelimit, shared across all calls
+        self.client = OpenAI(api_key=key, base_url="https://api.x.ai/v1", max_retries=0)
+        self._new_async_client = lambda: AsyncOpenAI(api_key=key, base_url="https://api.x.ai/v1", max_retries=0)
+        self.limiter = get_limiter("grok")
         model_name = model or DEFAULT_MODEL
         self.model = MODELS.get(model_name.lower(), model_name)
         self.display_name = model_name
 
+    @property
+    def async_client(self):
+        return self._loop_client(self._new_async_client)
+
     def complete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
-        oai_messages = [{"role": "system", "content": system}] + messages
-        for attempt in range(3):
-            try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    max_tokens=max_tokens,
-                    messages=oai_messages,
-                )
-                return response.choices[0].message.content
-            except Exception as e:
-                if attempt < 2 and ("rate" in str(e).lower()):
-                    time.sleep(2 ** attempt)
-                else:
-                    raise
+        oai_messages = [{"role": "system", "content": system}] + self.flatten_messages(messages)
+        started = time.monotonic()
+
+        def call(attempt: int) -> str:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=oai_messages,
+            )
+            self._record(response.usage, started, retries=attempt)
+            return response.choices[0].message.content
+
+        return call_with_retry(self.limiter, estimate_request_tokens(system, messages), call)
 
     def stream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> Iterator[str]:
-        oai_messages = [{"role": "system", "content": system}] + messages
-        response = self.client.chat.completions.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            messages=oai_messages,
-            stream=True,
+        oai_messages = [{"role": "system", "content": system}] + self.flatten_messages(messages)
+        started = time.monotonic()
+
+        def attempt_stream(attempt: int) -> Iterator[str]:
+            first_token = None
+            response = self.client.chat.completions.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=oai_messages,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    first_token = first_token or time.monotonic()
+                    yield chunk.choices[0].delta.content
+                if getattr(chunk, "usage", None):
+                    self._record(chunk.usage, started, first_token, retries=attempt)
+
+        yield from stream_with_retry(self.limiter, estimate_request_tokens(system, messages), attempt_stream)
+
+    async def acomplete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
+        oai_messages = [{"role": "system", "content": system}] + self.flatten_messages(messages)
+        started = time.monotonic()
+
+        async def call(attempt: int) -> str:
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=oai_messages,
+            )
+            self._record(response.usage, started, retries=attempt)
+            return response.choices[0].message.content
+
+        return await acall_with_retry(self.limiter, estimate_request_tokens(system, messages), call)
+
+    async def astream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> AsyncIterator[str]:
+        oai_messages = [{"role": "system", "content": system}] + self.flatten_messages(messages)
+        started = time.monotonic()
+
+        async def attempt_stream(attempt: int) -> AsyncIterator[str]:
+            first_token = None
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=oai_messages,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            async for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    first_token = first_token or time.monotonic()
+                    yield chunk.choices[0].delta.content
+                if getattr(chunk, "usage", None):
+                    self._record(chunk.usage, started, first_token, retries=attempt)
+
+        async for text in astream_with_retry(self.limiter, estimate_request_tokens(system, messages), attempt_stream):
+            yield text
+
+    def _record(self, usage, started: float, first_token: Optional[float] = None, retries: int = 0) -> None:
+        # xAI caches repeated prompt prefixes automatically; we only report the hits.
+        details = getattr(usage, "prompt_tokens_details", None)
+        cache_read = getattr(details, "cached_tokens", None) or 0
+        self._record_usage(
+            input_tokens=usage.prompt_tokens,
+            output_tokens=usage.completion_tokens,
+            cache_read_tokens=cache_read,
+            started=started,
+            first_token=first_token,
+            retries=retries,
+            cost_usd=self._estimate_cost(
+                PRICES.get(self.model), usage.prompt_tokens, usage.completion_tokens,
+                cache_read, cache_read_factor=0.25,
+            ),
         )
-        for chunk in response:
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
@@ -0,0 +1,185 @@
+"""Offline provider that generates synthetic text, for benchmarks and load tests."""
+
+from __future__ import annotations
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import time
+from typing import Optional, Iterator, AsyncIterator
+
+from agora.providers.base import LLMProvider
+from agora.providers.ratelimit import (
+    acall_with_retry, astream_with_retry, call_with_retry, estimate_request_tokens, get_limiter, stream_with_retry,
+)
+
+DEFAULT_MODEL = "mock"
+
+# Defaults for MockProvider's settings, each overridable with AGORA_MOCK_<NAME>
+DEFAULTS = {
+    "ttft": 0.0,  # seconds before the first chunk
+    "chunk_rate": 0.0,  # chunks (= tokens) per second after the first; 0 = no delay
+    "tokens": 200,  # output tokens per response, capped at max_tokens
+    "latency": None,  # seconds per complete(); default ttft + tokens / chunk_rate
+    "error_rate": 0.0,  # share of attempts failing with a retryable 503 before any output
+    "stream_error_rate": 0.0,  # share of streams breaking off halfway through
+}
+
+WORDS = (
+    "market", "growth", "risk", "evidence", "policy", "incentive", "cost", "benefit", "long", "term",
+    "adoption", "users", "regulation", "capital", "trade", "off", "scale", "data", "model", "outcome",
+    "because", "therefore", "however", "likely", "unlikely", "clear", "strong", "weak", "case", "argument",
+    "the", "a", "of", "in", "and", "to", "is", "that", "we", "should",
+)
+
+_WORD_RE = re.compile(r"\b[a-zA-Z]{4,}\b")
+
+
+class MockAPIError(Exception):
+    """Injected failure; ``status_code`` makes it look like an HTTP API error."""
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class MockProvider(LLMProvider):
+    """Deterministic synthetic responses with configurable timing and failures.
+
+    The same model, system prompt and messages always produce the same text
+    and the same injected errors. Responses reuse words from the last message,
+    so consensus scores move like in a real debate. No API key or network is
+    needed; ``AGORA_MOCK_RPM``/``_TPM`` apply a rate limit like for real
+    providers.
+    """
+
+    def __init__(self, model: Optional[str] = None, **settings):
+        unknown = set(settings) - set(DEFAULTS)
+        if unknown:
+            raise TypeError(f"Unknown mock settings: {', '.join(sorted(unknown))}")
+        for name, default in DEFAULTS.items():
+            value = settings.get(name)
+            if value is None:
+                value = os.environ.get(f"AGORA_MOCK_{name.upper()}", default)
+            setattr(self, name, None if value is None else float(value))
+        self.tokens = int(self.tokens)
+        self.limiter = get_limiter("mock")
+        self.model = model or DEFAULT_MODEL
+        self.display_name = self.model
+
+    def complete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
+        words, seed = self._response(system, messages, max_tokens)
+        started = time.monotonic()
+
+        def call(attempt: int) -> str:
+            self._maybe_fail(seed, attempt)
+            if self._latency(len(words)):
+                time.sleep(self._latency(len(words)))
+            self._record(system, messages, len(words), started, retries=attempt)
+            return "".join(words)
+
+        return call_with_retry(self.limiter, estimate_request_tokens(system, messages), call)
+
+    def stream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> Iterator[str]:
+        words, seed = self._response(system, messages, max_tokens)
+        started = time.monotonic()
+
+        def attempt_stream(attempt: int) -> Iterator[str]:
+            self._maybe_fail(seed, attempt)
+            break_at = self._break_at(seed, attempt, len(words))
+            if self.ttft:
+                time.sleep(self.ttft)
+            first_token = time.monotonic()
+            for i, word in enumerate(words):
+                if i == break_at:
+                    raise MockAPIError("Injected stream failure", 500)
+                if self.chunk_rate:
+                    time.sleep(max(0.0, self._due(first_token, i) - time.monotonic()))
+                yield word
+            self._record(system, messages, len(words), started, first_token, retries=attempt)
+
+        yield from stream_with_retry(self.limiter, estimate_request_tokens(system, messages), attempt_stream)
+
+    async def acomplete(self, system: str, messages: list[dict], max_tokens: int = 1024) -> str:
+        words, seed = self._response(system, messages, max_tokens)
+        started = time.monotonic()
+
+        async def call(attempt: int) -> str:
+            self._maybe_fail(seed, attempt)
+            if self._latency(len(words)):
+                await asyncio.sleep(self._latency(len(words)))
+            self._record(system, messages, len(words), started, retries=attempt)
+            return "".join(words)
+
+        return await acall_with_retry(self.limiter, estimate_request_tokens(system, messages), call)
+
+    async def astream(self, system: str, messages: list[dict], max_tokens: int = 1024) -> AsyncIterator[str]:
+        words, seed = self._response(system, messages, max_tokens)
+        started = time.monotonic()
+
+        async def attempt_stream(attempt: int) -> AsyncIterator[str]:
+            self._maybe_fail(seed, attempt)
+            break_at = self._break_at(seed, attempt, len(words))
+            if self.ttft:
+                await asyncio.sleep(self.ttft)
+            first_token = time.monotonic()
+            for i, word in enumerate(words):
+                if i == break_at:
+                    raise MockAPIError("Injected stream failure", 500)
+                if self.chunk_rate:
+                    await asyncio.sleep(max(0.0, self._due(first_token, i) - time.monotonic()))
+                yield word
+            self._record(system, messages, len(words), started, first_token, retries=attempt)
+
+        async for text in astream_with_retry(self.limiter, estimate_request_tokens(system, messages), attempt_stream):
+            yield text
+
+    def _response(self, system: str, messages: list[dict], max_tokens: int) -> tuple[list[str], str]:
+        """The response's chunks (one word, i.e. one token, each) and the request's seed."""
+        flat = self.flatten_messages(messages)
+        seed = hashlib.sha256(json.dumps([self.model, system, flat]).encode("utf-8")).hexdigest()
+        rng = random.Random(seed)
+        prompt_words = _WORD_RE.findall(flat[-1]["content"]) if flat else []
+        vocabulary = list(WORDS) + prompt_words[-200:]
+        words = []
+        for i in range(min(self.tokens, max_tokens)):
+            word = rng.choice(vocabulary).lower()
+            if i == 0 or words[-1].endswith(". "):
+                word = word.capitalize()
+            end = ". " if rng.random() < 0.08 or i == min(self.tokens, max_tokens) - 1 else " "
+            words.append(word + end)
+        return words, seed
+
+    def _latency(self, tokens: int) -> float:
+        if self.latency is not None:
+            return self.latency
+        return self.ttft + (tokens / self.chunk_rate if self.chunk_rate else 0.0)
+
+    def _due(self, first_token: float, index: int) -> float:
+        """When chunk ``index`` is due; chunks are paced from the first one so delays do not drift."""
+        return first_token + index / self.chunk_rate
+
+    def _maybe_fail(self, seed: str, attempt: int) -> None:
+        if self.error_rate and random.Random(f"{seed}:error:{attempt}").random() < self.error_rate:
+            raise MockAPIError("Injected error: service overloaded", 503)
+
+    def _break_at(self, seed: str, attempt: int, chunks: int) -> Optional[int]:
+        """Index of the chunk at which this stream fails, or None."""
+        if self.stream_error_rate and random.Random(f"{seed}:stream:{attempt}").random() < self.stream_error_rate:
+            return max(1, chunks // 2)
+        return None
+
+    def _record(
+        self, system: str, messages: list[dict], output_tokens: int, started: float,
+        first_token: Optional[float] = None, retries: int = 0,
+    ) -> None:
+        self._record_usage(
+            input_tokens=estimate_request_tokens(system, messages),
+            output_tokens=output_tokens,
+            started=started,
+            first_token=first_token,
+            retries=retries,
+            cost_usd=0.0,
+        )
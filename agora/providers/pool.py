@@ -0,0 +1,44 @@
+"""Provider instances shared by all participants of a debate."""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+from agora.providers.base import PROVIDERS, LLMProvider, default_model
+
+
+class ProviderPool:
+    """Resolves each (provider, model) once, so agents on the same backend share a client.
+
+    ``default`` serves participants that name no provider of their own.
+    Every other backend is resolved with the same ``options`` (``cache``,
+    ``fallback``, ``hedge_after``, see ``LLMProvider.resolve``).
+    """
+
+    def __init__(self, default: LLMProvider, default_name: str, default_model: Optional[str] = None, **options):
+        self.default = default
+        self.default_name = default_name.lower()
+        self.options = options
+        self._instances: dict[tuple[str, Optional[str]], LLMProvider] = {self._key(default_name, default_model): default}
+        self._lock = threading.Lock()
+
+    def get(self, provider: Optional[str] = None, model: Optional[str] = None) -> LLMProvider:
+        """The shared instance for ``provider``/``model``; the default when both are None."""
+        if provider is None and model is None:
+            return self.default
+        key = self._key(provider or self.default_name, model)
+        with self._lock:
+            if key not in self._instances:
+                self._instances[key] = LLMProvider.resolve(key[0], model=model, **self.options)
+            return self._instances[key]
+
+    @staticmethod
+    def _key(provider: str, model: Optional[str]) -> tuple[str, Optional[str]]:
+        # Naming a provider's default model explicitly must not build a second instance
+        name = provider.lower()
+        return name, model or (default_model(name) if name in PROVIDERS else None)
+
+    def label(self, provider: Optional[str] = None, model: Optional[str] = None) -> str:
+        """"provider/model" as shown in headers and reports."""
+        return f"{(provider or self.default_name).lower()}/{self.get(provider, model).display_name}"
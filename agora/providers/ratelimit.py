@@ -0,0 +1,252 @@
+"""Shared per-provider rate limiting and retries with jittered exponential backoff."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from agora.providers.base import LLMProvider
+
+T = TypeVar("T")
+
+# Proactive limits are opt-in: AGORA_<PROVIDER>_RPM / AGORA_<PROVIDER>_TPM
+# (requests and uncached prompt tokens per minute). Without them we only
+# back off when the API answers 429 or sends Retry-After.
+
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+RETRY_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+class _Bucket:
+    """Token bucket refilled continuously; reservations may drive it negative."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` and return how long the caller must wait for it."""
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        # A single request larger than the bucket would otherwise never fit
+        self.level -= min(amount, self.capacity)
+        return max(0.0, -self.level / self.rate)
+
+    def settle(self, reserved: float, used: float) -> None:
+        """Correct a reservation of ``reserved`` to what was ``used``."""
+        self.level = min(self.capacity, self.level + min(reserved, self.capacity) - min(used, self.capacity))
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute budget shared by all callers.
+
+    ``reserve`` books a request and returns the delay before it may be sent,
+    so waiting works the same from threads (``wait``) and coroutines
+    (``await await_turn``). A rate-limit response ``pause``s every caller.
+    """
+
+    def __init__(self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None):
+        self._requests = _Bucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = _Bucket(tokens_per_minute) if tokens_per_minute else None
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 0) -> float:
+        with self._lock:
+            now = time.monotonic()
+            delay = self._paused_until - now
+            if self._requests:
+                delay = max(delay, self._requests.reserve(1, now))
+            if self._tokens and tokens:
+                delay = max(delay, self._tokens.reserve(tokens, now))
+            return max(0.0, delay)
+
+    def settle(self, reserved: int, used: int) -> None:
+        """Charge the tokens a request actually used instead of the ``reserved`` estimate."""
+        if self._tokens:
+            with self._lock:
+                self._tokens.settle(reserved, used)
+
+    def wait(self, tokens: int = 0) -> None:
+        delay = self.reserve(tokens)
+        if delay:
+            time.sleep(delay)
+
+    async def await_turn(self, tokens: int = 0) -> None:
+        delay = self.reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for ``seconds`` (e.g. after a 429)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(provider_name: str) -> RateLimiter:
+    """The process-wide limiter for ``provider_name``."""
+    with _limiters_lock:
+        if provider_name not in _limiters:
+            prefix = f"AGORA_{provider_name.upper()}"
+            _limiters[provider_name] = RateLimiter(
+                int(os.environ.get(f"{prefix}_RPM", 0)),
+                int(os.environ.get(f"{prefix}_TPM", 0)),
+            )
+        return _limiters[provider_name]
+
+
+def estimate_request_tokens(system: str, messages: list[dict]) -> int:
+    """Rough prompt size (four characters per token) for the tokens-per-minute budget."""
+    chars = len(system)
+    for msg in messages:
+        content = msg["content"]
+        chars += len(content) if isinstance(content, str) else sum(len(b["text"]) for b in content)
+    return chars // 4
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Rate limits, overload, timeouts, dropped connections and 5xx responses."""
+    status = _status(error)
+    if status is not None:
+        return status in RETRY_STATUS
+    name = type(error).__name__
+    if any(part in name for part in ("Timeout", "Connection", "ResourceExhausted", "ServiceUnavailable")):
+        return True
+    message = str(error).lower()
+    return any(part in message for part in ("rate limit", "overloaded", "quota", "temporarily unavailable"))
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the server asked us to wait, from Retry-After(-Ms) headers."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, error: BaseException) -> float:
+    """Full-jitter exponential backoff, but never shorter than Retry-After."""
+    jittered = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+    return max(jittered, retry_after(error) or 0.0)
+
+
+def call_with_retry(limiter: RateLimiter, tokens: int, call: Callable[[int], T]) -> T:
+    """Run ``call(attempt)`` within the rate limit, retrying transient failures."""
+    for attempt in range(MAX_ATTEMPTS):
+        limiter.wait(tokens)
+        before = LLMProvider.last_usage()
+        try:
+            result = call(attempt)
+        except Exception as e:
+            if attempt == MAX_ATTEMPTS - 1 or not is_retryable(e):
+                raise
+            time.sleep(_after_failure(limiter, attempt, e))
+        else:
+            _settle(limiter, tokens, before)
+            return result
+
+
+async def acall_with_retry(limiter: RateLimiter, tokens: int, call: Callable[[int], Awaitable[T]]) -> T:
+    """Async variant of ``call_with_retry``."""
+    for attempt in range(MAX_ATTEMPTS):
+        await limiter.await_turn(tokens)
+        before = LLMProvider.last_usage()
+        try:
+            result = await call(attempt)
+        except Exception as e:
+            if attempt == MAX_ATTEMPTS - 1 or not is_retryable(e):
+                raise
+            await asyncio.sleep(_after_failure(limiter, attempt, e))
+        else:
+            _settle(limiter, tokens, before)
+            return result
+
+
+def stream_with_retry(limiter: RateLimiter, tokens: int, stream: Callable[[int], Iterator[str]]) -> Iterator[str]:
+    """Yield from ``stream(attempt)``, retrying failures that happen before the first chunk.
+
+    Once text has been yielded a retry would repeat it, so later errors propagate.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        limiter.wait(tokens)
+        before = LLMProvider.last_usage()
+        started = False
+        try:
+            for chunk in stream(attempt):
+                started = True
+                yield chunk
+            _settle(limiter, tokens, before)
+            return
+        except Exception as e:
+            if started or attempt == MAX_ATTEMPTS - 1 or not is_retryable(e):
+                raise
+            time.sleep(_after_failure(limiter, attempt, e))
+
+
+async def astream_with_retry(
+    limiter: RateLimiter, tokens: int, stream: Callable[[int], AsyncIterator[str]]
+) -> AsyncIterator[str]:
+    """Async variant of ``stream_with_retry``."""
+    for attempt in range(MAX_ATTEMPTS):
+        await limiter.await_turn(tokens)
+        before = LLMProvider.last_usage()
+        started = False
+        try:
+            async for chunk in stream(attempt):
+                started = True
+                yield chunk
+            _settle(limiter, tokens, before)
+            return
+        except Exception as e:
+            if started or attempt == MAX_ATTEMPTS - 1 or not is_retryable(e):
+                raise
+            await asyncio.sleep(_after_failure(limiter, attempt, e))
+
+
+def _settle(limiter: RateLimiter, reserved: int, before: Optional[dict]) -> None:
+    # Prompt-cache hits don't count against the provider's token limit
+    usage = LLMProvider.last_usage()
+    if usage is not None and usage is not before:
+        limiter.settle(reserved, usage["input_tokens"] - usage["cache_read_tokens"])
+
+
+def _after_failure(limiter: RateLimiter, attempt: int, error: BaseException) -> float:
+    delay = backoff_delay(attempt, error)
+    if _status(error) == 429 or retry_after(error) is not None:
+        # The whole account is throttled, not just this request
+        limiter.pause(delay)
+    return delay
+
+
+def _status(error: BaseException) -> Optional[int]:
+    for attr in ("status_code", "code", "status"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    value = getattr(getattr(error, "response", None), "status_code", None)
+    return value if isinstance(value, int) else None
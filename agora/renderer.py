@@ -1,8 +1,15 @@
-"""Rich terminal output for debates."""
+"""Debate output: Rich terminal rendering plus plain, JSON-lines and silent backends."""
 
 from __future__ import annotations
 
-from rich.console import Console
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional, Union
+
+from rich.console import Console, Group
 from rich.live import Live
 from rich.panel import Panel
 from rich.markdown import Markdown
@@ -42,44 +49,176 @@ def print_agent_response(agent_name: str, text: str, color: str = "white") -> No
     ))
 
 
+class StreamingPanel:
+    """Live panel for a response that is still arriving.
+
+    Chunks are only appended on arrival; the Markdown is rebuilt when Rich
+    refreshes the display (8 times a second), and only if text arrived
+    since the last refresh. Completed blocks before the last blank line
+    (outside code fences) are parsed once and reused, so each refresh only
+    re-parses the trailing block.
+    """
+
+    def __init__(self, title: str, border_style: str):
+        self.title = title
+        self.border_style = border_style
+        self._pending: list[str] = []
+        self._text = ""
+        self._lock = threading.Lock()
+        self._stable_text = ""
+        self._stable_markdown = None
+        self._rendered_len = -1
+        self._panel = self._frame("[dim]thinking...[/dim]")
+
+    def append(self, chunk: str) -> None:
+        with self._lock:
+            self._pending.append(chunk)
+
+    @property
+    def text(self) -> str:
+        with self._lock:
+            if self._pending:
+                self._text += "".join(self._pending)
+                self._pending.clear()
+            return self._text
+
+    def final(self) -> Panel:
+        """The complete response rendered as a single Markdown document."""
+        return self._frame(Markdown(self.text))
+
+    def __rich__(self) -> Panel:
+        text = self.text
+        if len(text) == self._rendered_len:
+            return self._panel
+        self._rendered_len = len(text)
+
+        split = text.rfind("\n\n")
+        while split > 0 and text.count("```", 0, split) % 2:
+            split = text.rfind("\n\n", 0, split)
+        stable, tail = (text[:split], text[split + 2:]) if split > 0 else ("", text)
+
+        if stable != self._stable_text:
+            self._stable_text = stable
+            self._stable_markdown = Markdown(stable)
+        body = Group(self._stable_markdown, "", Markdown(tail)) if stable else Markdown(tail)
+        self._panel = self._frame(body)
+        return self._panel
+
+    def _frame(self, body) -> Panel:
+        return Panel(body, title=f"[bold]{self.title}[/bold]", border_style=self.border_style, padding=(1, 2))
+
+
 def print_agent_response_stream(agent, topic: str, round_num: int, total_rounds: int, history: list[dict]) -> str:
     """Stream an agent's response with live updating panel. Returns full text."""
-    collected = []
+    panel = StreamingPanel(agent.name, agent.color)
 
     try:
-        with Live(
-            Panel("[dim]thinking...[/dim]", title=f"[bold]{agent.name}[/bold]", border_style=agent.color, padding=(1, 2)),
-            console=console,
-            refresh_per_second=8,
-        ) as live:
+        with Live(panel, console=console, refresh_per_second=8) as live:
             for chunk in agent.respond_stream(topic, round_num, total_rounds, history):
-                collected.append(chunk)
-                text_so_far = "".join(collected)
-                live.update(Panel(
-                    Markdown(text_so_far),
-                    title=f"[bold]{agent.name}[/bold]",
-                    border_style=agent.color,
-                    padding=(1, 2),
-                ))
+                panel.append(chunk)
+            live.update(panel.final())
     except KeyboardInterrupt:
         console.print("\n  [dim]Debate interrupted.[/dim]")
         raise SystemExit(0)
     except Exception as e:
-        error_type = type(e).__name__
-        error_str = str(e)
-        if "AuthenticationError" in error_type or "401" in error_str:
-            console.print(f"  [bold red]Error:[/bold red] Invalid API key. Check your ANTHROPIC_API_KEY.")
-            raise SystemExit(1)
-        elif "NotFoundError" in error_type or "could not resolve" in error_str.lower():
-            console.print(f"  [bold yellow]Warning:[/bold yellow] Model not available for streaming, falling back...")
-            text = agent.respond(topic, round_num, total_rounds, history)
-            print_agent_response(agent.name, text, agent.color)
-            return text
+        return _handle_stream_error(e, agent, topic, round_num, total_rounds, history)
+
+    return panel.text
+
+
+def print_round_responses_stream(agents: list, topic: str, round_num: int, total_rounds: int, history: list[dict]) -> list[str]:
+    """Stream every agent's response at once in stacked live panels.
+
+    All agents answer the same ``history`` concurrently. Returns the full
+    texts in the same order as ``agents``.
+    """
+    panels = [StreamingPanel(agent.name, agent.color) for agent in agents]
+
+    stop = threading.Event()
+
+    def consume(index: int, agent) -> str:
+        for chunk in _until_stopped(agent.respond_stream(topic, round_num, total_rounds, history), stop):
+            panels[index].append(chunk)
+        return panels[index].text
+
+    pool = ThreadPoolExecutor(max_workers=len(agents))
+    futures = [pool.submit(consume, i, agent) for i, agent in enumerate(agents)]
+    try:
+        with Live(Group(*panels), console=console, refresh_per_second=8, vertical_overflow="visible") as live:
+            wait(futures)
+            live.update(Group(*(panel.final() for panel in panels)))
+    except KeyboardInterrupt:
+        # Workers are joined at exit; make them drop their requests instead of streaming on
+        stop.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+        console.print("\n  [dim]Debate interrupted.[/dim]")
+        raise SystemExit(0)
+    pool.shutdown()
+
+    texts = []
+    for agent, future in zip(agents, futures):
+        error = future.exception()
+        if error is None:
+            texts.append(future.result())
         else:
-            console.print(f"  [bold red]API Error:[/bold red] {error_type}: {error_str}")
-            raise SystemExit(1)
+            texts.append(_handle_stream_error(error, agent, topic, round_num, total_rounds, history))
+    return texts
+
+
+def _until_stopped(stream, stop: Optional[threading.Event]):
+    """Yield from ``stream`` until ``stop`` is set, then close it so the provider drops the request."""
+    try:
+        for chunk in stream:
+            if stop is not None and stop.is_set():
+                return
+            yield chunk
+    finally:
+        stream.close()
 
-    return "".join(collected)
+
+async def aprint_agent_response_stream(agent, topic: str, round_num: int, total_rounds: int, history: list[dict]) -> str:
+    """Async variant of ``print_agent_response_stream``. Returns full text."""
+    panel = StreamingPanel(agent.name, agent.color)
+
+    try:
+        with Live(panel, console=console, refresh_per_second=8) as live:
+            async for chunk in agent.arespond_stream(topic, round_num, total_rounds, history):
+                panel.append(chunk)
+            live.update(panel.final())
+    except Exception as e:
+        _check_stream_error(e)
+        text = await agent.arespond(topic, round_num, total_rounds, history)
+        print_agent_response(agent.name, text, agent.color)
+        return text
+
+    return panel.text
+
+
+def _handle_stream_error(e: Exception, agent, topic: str, round_num: int, total_rounds: int, history: list[dict]) -> str:
+    """Recover from a failed stream by falling back to a blocking call, or exit."""
+    _check_stream_error(e)
+    text = agent.respond(topic, round_num, total_rounds, history)
+    print_agent_response(agent.name, text, agent.color)
+    return text
+
+
+def _check_stream_error(e: Exception) -> None:
+    """Exit on fatal stream errors; return if a non-streaming retry is worthwhile."""
+    error_type = type(e).__name__
+    error_str = str(e)
+    if "AuthenticationError" in error_type or "401" in error_str:
+        console.print(f"  [bold red]Error:[/bold red] Invalid API key. Check your ANTHROPIC_API_KEY.")
+        raise SystemExit(1)
+    elif _stream_unsupported(e):
+        console.print(f"  [bold yellow]Warning:[/bold yellow] Model not available for streaming, falling back...")
+    else:
+        console.print(f"  [bold red]API Error:[/bold red] {error_type}: {error_str}")
+        raise SystemExit(1)
+
+
+def _stream_unsupported(e: Exception) -> bool:
+    """True if the model cannot stream and a blocking call may still work."""
+    return "NotFoundError" in type(e).__name__ or "could not resolve" in str(e).lower()
 
 
 def print_thinking(agent_name: str) -> None:
@@ -87,9 +226,35 @@ def print_thinking(agent_name: str) -> None:
     console.print(f"  [dim]⏳ {agent_name} is thinking...[/dim]")
 
 
-def print_consensus_meter(score: float, round_num: int) -> None:
-    """Print a consensus meter (0 = total disagreement, 1 = full consensus)."""
-    pct = int(score * 100)
+def print_round_summarized(round_num: int) -> None:
+    """Note that an old round was replaced by its summary in the agents' prompts."""
+    console.print(f"  [dim]📝 Round {round_num} summarized to keep prompts compact.[/dim]")
+
+
+def print_turn_usage(agent_name: str, usage: dict) -> None:
+    """Print a turn's token usage, including prompt-cache hits and misses, and timings."""
+    cached = usage["cache_read_tokens"]
+    uncached = usage["input_tokens"] - cached
+    timing = ""
+    if usage.get("latency") is not None:
+        timing = f" · {usage['ttft']:.2f}s to first token, {usage['latency']:.2f}s total"
+        if usage.get("retries"):
+            timing += f", {usage['retries']} retries"
+    console.print(
+        f"  [dim]{agent_name}: {usage['input_tokens']:,} input tokens "
+        f"({cached:,} cache hit, {uncached:,} miss"
+        + (f", {usage['cache_write_tokens']:,} written to cache" if usage["cache_write_tokens"] else "")
+        + f") · {usage['output_tokens']:,} output{timing}[/dim]"
+    )
+
+
+def print_consensus_meter(score: float, round_num: int, method: str = "keyword") -> None:
+    """Print a consensus meter (0 = total disagreement, 1 = full consensus).
+
+    ``method`` names how the score was computed: "keyword", "semantic" or
+    "semantic (hashing fallback)" when no embedding model could be loaded.
+    """
+    pct = round(score * 100)
 
     if pct < 30:
         color = "red"
@@ -103,11 +268,17 @@ def print_consensus_meter(score: float, round_num: int) -> None:
 
     bar = "█" * (pct // 2) + "░" * (50 - pct // 2)
     console.print()
-    console.print(f"  [bold]Consensus Meter (Round {round_num}):[/bold]")
+    console.print(f"  [bold]Consensus Meter (Round {round_num}, {method}):[/bold]")
     console.print(f"  [{color}]{bar}[/{color}] {pct}% — {label}")
     console.print()
 
 
+def print_early_stop(reason: str) -> None:
+    """Announce that the debate ends before its last round."""
+    console.print(f"  [bold cyan]⏹  Ending debate early:[/bold cyan] {reason}")
+    console.print()
+
+
 def print_moderator_synthesis(text: str) -> None:
     """Print the moderator's final synthesis."""
     console.print()
@@ -126,3 +297,280 @@ def print_saved(path: str) -> None:
     console.print()
     console.print(f"  [bold green]✓[/bold green] Report saved to: [underline]{path}[/underline]")
     console.print()
+
+
+def print_reused(path: str, kind: str) -> None:
+    """Print which earlier identical debate is reused."""
+    console.print()
+    if kind == "report":
+        console.print(f"  [bold green]↺[/bold green] Reusing identical debate: [underline]{path}[/underline]")
+    else:
+        console.print(f"  [bold cyan]↺[/bold cyan] Continuing an identical debate from: [underline]{path}[/underline]")
+    console.print()
+
+
+class Renderer:
+    """Output backend for a debate.
+
+    ``run_debate`` reports progress only through these methods. The base
+    class renders nothing, and its stream drivers simply collect chunks,
+    making it the silent backend; subclasses override the hooks they need.
+    """
+
+    def header(self, topic: str, agent_names: list[str], rounds: int, provider_label: str) -> None:
+        pass
+
+    def round_header(self, round_num: int, total_rounds: int) -> None:
+        pass
+
+    def round_summarized(self, round_num: int) -> None:
+        pass
+
+    def thinking(self, agent_name: str, round_num: int = 0) -> None:
+        """An agent (or the moderator) starts working on a response."""
+
+    def turn_chunk(self, agent_name: str, round_num: int, chunk: str) -> None:
+        pass
+
+    def agent_response(self, agent_name: str, text: str, color: str = "white") -> None:
+        """Show a finished response that was not streamed to the screen."""
+
+    def turn_end(self, agent_name: str, round_num: int, text: str, usage: Optional[dict]) -> None:
+        pass
+
+    def consensus_meter(self, score: float, round_num: int, method: str = "keyword") -> None:
+        pass
+
+    def early_stop(self, reason: str) -> None:
+        pass
+
+    def error(self, error: BaseException, checkpoint: Optional[str] = None) -> None:
+        """The debate failed or was interrupted; ``checkpoint`` (if any) can resume it."""
+
+    def moderator_synthesis(self, text: str) -> None:
+        pass
+
+    def saved(self, path: str) -> None:
+        pass
+
+    def reused(self, path: str, kind: str) -> None:
+        """An identical earlier debate is reused: its ``"report"``, or the ``"checkpoint"`` it continues from."""
+
+    def agent_response_stream(self, agent, topic: str, round_num: int, total_rounds: int, history: list[dict]) -> str:
+        """Drive one agent's stream through the hooks. Returns full text."""
+        return self._drive_stream(agent, topic, round_num, total_rounds, history)
+
+    def round_responses_stream(self, agents: list, topic: str, round_num: int, total_rounds: int, history: list[dict]) -> list[str]:
+        """Stream all agents of a round concurrently. Returns texts in agent order."""
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=len(agents))
+        futures = [
+            pool.submit(self._drive_stream, agent, topic, round_num, total_rounds, history, stop) for agent in agents
+        ]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            # Ctrl-C or a failed turn ends the debate; don't keep paying for the other streams
+            stop.set()
+            raise
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _drive_stream(
+        self, agent, topic: str, round_num: int, total_rounds: int, history: list[dict],
+        stop: Optional[threading.Event] = None,
+    ) -> str:
+        self.thinking(agent.name, round_num)
+        chunks = []
+        try:
+            for chunk in _until_stopped(agent.respond_stream(topic, round_num, total_rounds, history), stop):
+                chunks.append(chunk)
+                self.turn_chunk(agent.name, round_num, chunk)
+            text = "".join(chunks)
+        except Exception as e:
+            if not _stream_unsupported(e):
+                raise
+            text = agent.respond(topic, round_num, total_rounds, history)
+        if stop is not None and stop.is_set():
+            return text  # abandoned; the round is not recorded
+        self.agent_response(agent.name, text, agent.color)
+        return text
+
+    async def aagent_response_stream(self, agent, topic: str, round_num: int, total_rounds: int, history: list[dict]) -> str:
+        """Async variant of ``agent_response_stream``."""
+        self.thinking(agent.name, round_num)
+        chunks = []
+        try:
+            async for chunk in agent.arespond_stream(topic, round_num, total_rounds, history):
+                chunks.append(chunk)
+                self.turn_chunk(agent.name, round_num, chunk)
+            text = "".join(chunks)
+        except Exception as e:
+            if not _stream_unsupported(e):
+                raise
+            text = await agent.arespond(topic, round_num, total_rounds, history)
+        self.agent_response(agent.name, text, agent.color)
+        return text
+
+
+class RichRenderer(Renderer):
+    """The interactive terminal UI (panels, live streaming, consensus meter)."""
+
+    def header(self, topic, agent_names, rounds, provider_label):
+        print_header(topic, agent_names, rounds, provider_label)
+
+    def round_header(self, round_num, total_rounds):
+        print_round_header(round_num, total_rounds)
+
+    def round_summarized(self, round_num):
+        print_round_summarized(round_num)
+
+    def thinking(self, agent_name, round_num=0):
+        print_thinking(agent_name)
+
+    def agent_response(self, agent_name, text, color="white"):
+        print_agent_response(agent_name, text, color)
+
+    def turn_end(self, agent_name, round_num, text, usage):
+        if usage:
+            print_turn_usage(agent_name, usage)
+
+    def consensus_meter(self, score, round_num, method="keyword"):
+        print_consensus_meter(score, round_num, method)
+
+    def early_stop(self, reason):
+        print_early_stop(reason)
+
+    def moderator_synthesis(self, text):
+        print_moderator_synthesis(text)
+
+    def saved(self, path):
+        print_saved(path)
+
+    def reused(self, path, kind):
+        print_reused(path, kind)
+
+    def agent_response_stream(self, agent, topic, round_num, total_rounds, history):
+        return print_agent_response_stream(agent, topic, round_num, total_rounds, history)
+
+    def round_responses_stream(self, agents, topic, round_num, total_rounds, history):
+        return print_round_responses_stream(agents, topic, round_num, total_rounds, history)
+
+    async def aagent_response_stream(self, agent, topic, round_num, total_rounds, history):
+        return await aprint_agent_response_stream(agent, topic, round_num, total_rounds, history)
+
+
+class PlainRenderer(Renderer):
+    """Unstyled text on stdout, one block per finished turn (no live updates)."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def _write(self, text: str) -> None:
+        with self._lock:
+            self.stream.write(text + "\n")
+            self.stream.flush()
+
+    def header(self, topic, agent_names, rounds, provider_label):
+        self._write(f"Topic: {topic}\nAgents: {', '.join(agent_names)}\nRounds: {rounds}\nModel: {provider_label}\n")
+
+    def round_header(self, round_num, total_rounds):
+        self._write(f"=== Round {round_num} of {total_rounds} ===\n")
+
+    def round_summarized(self, round_num):
+        self._write(f"(round {round_num} summarized to keep prompts compact)")
+
+    def agent_response(self, agent_name, text, color="white"):
+        self._write(f"[{agent_name}]\n{text}\n")
+
+    def consensus_meter(self, score, round_num, method="keyword"):
+        self._write(f"Consensus (round {round_num}, {method}): {score:.0%}\n")
+
+    def early_stop(self, reason):
+        self._write(f"Ending debate early: {reason}\n")
+
+    def moderator_synthesis(self, text):
+        self._write(f"=== Moderator Synthesis ===\n\n{text}\n")
+
+    def saved(self, path):
+        self._write(f"Report saved to: {path}")
+
+    def reused(self, path, kind):
+        self._write(f"Reusing identical debate {kind}: {path}")
+
+
+class JsonRenderer(Renderer):
+    """One JSON object per line for every debate event, for machine consumers.
+
+    Events: debate_start, round_start, round_summarized, turn_start,
+    turn_chunk, turn_end, consensus, early_stop, synthesis, saved, reused and,
+    when the debate fails or is interrupted, error. Each carries ``event`` and
+    a unix ``time``.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields) -> None:
+        line = json.dumps({"event": event, "time": round(time.time(), 3), **fields}, ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def header(self, topic, agent_names, rounds, provider_label):
+        self.emit("debate_start", topic=topic, agents=agent_names, rounds=rounds, provider=provider_label)
+
+    def round_header(self, round_num, total_rounds):
+        self.emit("round_start", round=round_num, total_rounds=total_rounds)
+
+    def round_summarized(self, round_num):
+        self.emit("round_summarized", round=round_num)
+
+    def thinking(self, agent_name, round_num=0):
+        self.emit("turn_start", round=round_num, agent=agent_name)
+
+    def turn_chunk(self, agent_name, round_num, chunk):
+        self.emit("turn_chunk", round=round_num, agent=agent_name, text=chunk)
+
+    def turn_end(self, agent_name, round_num, text, usage):
+        self.emit("turn_end", round=round_num, agent=agent_name, text=text, usage=usage)
+
+    def consensus_meter(self, score, round_num, method="keyword"):
+        self.emit("consensus", round=round_num, score=score, method=method)
+
+    def early_stop(self, reason):
+        self.emit("early_stop", reason=reason)
+
+    def moderator_synthesis(self, text):
+        self.emit("synthesis", text=text)
+
+    def saved(self, path):
+        self.emit("saved", path=path)
+
+    def reused(self, path, kind):
+        self.emit("reused", path=path, kind=kind)
+
+    def error(self, error, checkpoint=None):
+        self.emit("error", error=type(error).__name__, message=str(error), checkpoint=checkpoint)
+
+
+RENDERERS = {
+    "rich": RichRenderer,
+    "plain": PlainRenderer,
+    "json": JsonRenderer,
+    "none": Renderer,
+}
+
+
+def get_renderer(name: Union[str, Renderer] = "rich") -> Renderer:
+    """Create the output backend called ``name`` (rich, plain, json or none).
+
+    A ``Renderer`` instance is returned unchanged.
+    """
+    if isinstance(name, Renderer):
+        return name
+    if name not in RENDERERS:
+        raise ValueError(f"Unknown output format '{name}'. Available: {', '.join(RENDERERS)}")
+    return RENDERERS[name]()
@@ -0,0 +1,401 @@
+"""Long-running debate service: a small HTTP API with Server-Sent Events.
+
+Endpoints (JSON unless noted):
+
+    POST   /debates              start a debate; 202 with its id, 503 when the queue is full
+    GET    /debates              all known debates, newest first
+    GET    /debates/{id}         status, consensus scores, report path or error
+    GET    /debates/{id}/events  Server-Sent Events: every event so far, then live
+    GET    /debates/{id}/report  the Markdown report (text/markdown)
+    DELETE /debates/{id}         cancel a queued or running debate
+    GET    /health               queue and worker counts
+
+Events carry the same payloads as ``--format json`` (see
+``agora.renderer.JsonRenderer``) plus a final ``status`` event. Each has a
+numeric id, so a client that reconnects with ``Last-Event-ID`` (or
+``?after=N``) only receives what it missed. A turn's ``turn_chunk`` events
+are dropped once its ``turn_end`` (which has the whole text) is logged, so
+late subscribers get the finished turns without their chunks.
+
+Debates run as ``arun_debate`` coroutines on one event loop, at most
+``workers`` at a time; queued requests wait in a bounded queue. Provider
+instances and their async clients are shared by all debates.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import json
+import re
+import time
+import uuid
+from datetime import datetime
+from http import HTTPStatus
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs
+
+from agora.checkpoint import discard_checkpoint
+from agora.consensus import CONSENSUS_METHODS
+from agora.debate import arun_debate
+from agora.personas import resolve_participants
+from agora.providers.base import LLMProvider, parse_backend
+from agora.renderer import JsonRenderer
+
+MAX_BODY = 64 * 1024
+HEARTBEAT_SECONDS = 15.0
+
+# POST /debates fields: type and the arun_debate argument each one sets
+DEBATE_FIELDS = {
+    "topic": (str, "topic"),
+    "preset": (str, None),
+    "agents": ((str, int), None),
+    "rounds": (int, "rounds"),
+    "provider": (str, "provider_name"),
+    "model": (str, "model"),
+    "moderator": (str, None),
+    "parallel": (bool, "parallel"),
+    "stream": (bool, "stream"),
+    "history_window": (int, "history_window"),
+    "token_budget": (int, "token_budget"),
+    "consensus": (str, "consensus_method"),
+    "stop_at": ((int, float), "stop_threshold"),
+    "stop_epsilon": ((int, float), "stop_epsilon"),
+    "stop_patience": (int, "stop_patience"),
+    "reuse": (bool, "reuse"),
+}
+
+FINISHED = ("done", "failed", "cancelled")
+
+
+class HTTPError(Exception):
+    """Ends a request with ``status`` and a JSON ``{"error": message}`` body."""
+
+    def __init__(self, status: int, message: str, headers: Optional[dict] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class Job:
+    """One submitted debate: its arguments, progress and event log."""
+
+    def __init__(self, params: dict, kwargs: dict):
+        self.id = uuid.uuid4().hex[:12]
+        self.params = params
+        self.kwargs = kwargs
+        self.status = "queued"
+        self.created = datetime.now().isoformat(timespec="seconds")
+        self.started: Optional[str] = None
+        self.finished: Optional[str] = None
+        self.report: Optional[str] = None
+        self.error: Optional[str] = None
+        self.scores: list[float] = []
+        self.turns = 0
+        self.events: list[tuple[int, dict]] = []
+        self._next_id = 0
+        self.task: Optional[asyncio.Task] = None
+        self.cancel_requested = False
+        self._wakeup = asyncio.Event()
+
+    def publish(self, event: dict) -> None:
+        """Append ``event`` to the log and wake every SSE subscriber."""
+        if event["event"] == "consensus":
+            self.scores.append(event["score"])
+        elif event["event"] == "turn_end":
+            self.turns += 1
+            turn = (event["round"], event["agent"])
+            self.events = [
+                (event_id, logged) for event_id, logged in self.events
+                if logged["event"] != "turn_chunk" or (logged["round"], logged["agent"]) != turn
+            ]
+        self.events.append((self._next_id, event))
+        self._next_id += 1
+        self._wakeup.set()
+        self._wakeup = asyncio.Event()
+
+    def since(self, start: int) -> list[tuple[int, dict]]:
+        """Logged ``(id, event)`` pairs with ids from ``start`` on."""
+        return self.events[bisect.bisect_left(self.events, (start,)):]
+
+    def finish(self, status: str, report: Optional[str] = None, error: Optional[str] = None) -> None:
+        self.status = status
+        self.report = report
+        self.error = error
+        self.finished = datetime.now().isoformat(timespec="seconds")
+        self.publish({"event": "status", "time": round(time.time(), 3), **self.summary()})
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "topic": self.params["topic"],
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "turns": self.turns,
+            "consensus": self.scores,
+            "report": self.report,
+            "error": self.error,
+        }
+
+
+class _JobRenderer(JsonRenderer):
+    """Sends the JSON renderer's events to a job instead of stdout."""
+
+    def __init__(self, job: Job):
+        super().__init__()
+        self.job = job
+
+    def emit(self, event: str, **fields) -> None:
+        self.job.publish({"event": event, "time": round(time.time(), 3), **fields})
+
+
+class DebateServer:
+    """Queues debate requests and runs up to ``workers`` of them concurrently.
+
+    ``defaults`` are the ``arun_debate`` arguments requests start from
+    (``provider_name``, ``model``, ``output_dir``, ``cache``, ``fallback``,
+    ``hedge_after``). Finished debates beyond the newest ``keep`` are
+    forgotten; their reports stay on disk.
+    """
+
+    def __init__(self, workers: int = 4, queue_size: int = 100, keep: int = 500, **defaults):
+        self.workers = max(1, workers)
+        self.queue_size = queue_size
+        self.keep = keep
+        self.defaults = {"provider_name": "anthropic", "output_dir": "reports", **defaults}
+        self.jobs: dict[str, Job] = {}
+        self.running = 0
+        self._queue: Optional[asyncio.Queue] = None
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8000, on_ready=None) -> None:
+        """Accept connections until cancelled."""
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        server = await asyncio.start_server(self._handle, host, port)
+        if on_ready:
+            on_ready(server.sockets[0].getsockname())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def submit(self, params: dict) -> Job:
+        """Validate a POST /debates body and queue the debate."""
+        # Loading presets and checking provider SDKs touch the disk
+        job = Job(params, await asyncio.to_thread(self._debate_kwargs, params))
+        # Named by job id: two requests for the same topic must not share a checkpoint
+        job.kwargs["checkpoint"] = str(Path(job.kwargs["output_dir"]) / "checkpoints" / f"debate_{job.id}.json")
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise HTTPError(503, f"Queue full ({self.queue_size} debates waiting); try again later", {"Retry-After": "30"})
+        self.jobs[job.id] = job
+        job.publish({"event": "status", "time": round(time.time(), 3), **job.summary()})
+        return job
+
+    def cancel(self, job: Job) -> None:
+        if job.status in FINISHED:
+            raise HTTPError(409, f"Debate {job.id} already {job.status}")
+        job.cancel_requested = True
+        if job.task is not None:
+            job.task.cancel()
+        else:
+            job.finish("cancelled")
+
+    def health(self) -> dict:
+        return {
+            "status": "ok",
+            "queued": sum(1 for job in self.jobs.values() if job.status == "queued"),
+            "running": self.running,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+        }
+
+    def _debate_kwargs(self, params: dict) -> dict:
+        """``arun_debate`` arguments for a request body; raises HTTPError(400) on bad input."""
+        if not isinstance(params, dict):
+            raise HTTPError(400, "Request body must be a JSON object")
+        unknown = set(params) - set(DEBATE_FIELDS)
+        if unknown:
+            raise HTTPError(400, f"Unknown fields: {', '.join(sorted(unknown))}. Allowed: {', '.join(DEBATE_FIELDS)}")
+        for name, (kind, _) in DEBATE_FIELDS.items():
+            value = params.get(name)
+            # bool is an int subclass; only accept it where a bool is expected
+            if value is not None and (not isinstance(value, kind) or (isinstance(value, bool) and kind is not bool)):
+                raise HTTPError(400, f"'{name}' has the wrong type")
+        if not (params.get("topic") or "").strip():
+            raise HTTPError(400, "'topic' is required")
+        for name, minimum in (("rounds", 1), ("stop_patience", 1), ("token_budget", 1), ("history_window", 0)):
+            if params.get(name) is not None and params[name] < minimum:
+                raise HTTPError(400, f"'{name}' must be at least {minimum}")
+        if params.get("stop_at") is not None and not 0 <= params["stop_at"] <= 1:
+            raise HTTPError(400, "'stop_at' must be between 0 and 1")
+        if params.get("stop_epsilon") is not None and params["stop_epsilon"] < 0:
+            raise HTTPError(400, "'stop_epsilon' must be at least 0")
+        if params.get("consensus") not in (None, *CONSENSUS_METHODS):
+            raise HTTPError(400, f"'consensus' must be one of: {', '.join(CONSENSUS_METHODS)}")
+
+        kwargs = {**self.defaults, "display": "json", "stream": True}
+        for name, (_, argument) in DEBATE_FIELDS.items():
+            if argument and params.get(name) is not None:
+                kwargs[argument] = params[name]
+        try:
+            agent_configs, moderator_config = resolve_participants(params.get("preset"), str(params.get("agents") or 3))
+            if params.get("moderator"):
+                moderator_config = dict(zip(("provider", "model"), parse_backend(params["moderator"])))
+            participants = list(agent_configs) + [moderator_config or {}]
+            providers = [kwargs["provider_name"]] + [parse_backend(spec)[0] for spec in kwargs.get("fallback") or []]
+            for name in dict.fromkeys(providers + [cfg["provider"] for cfg in participants if cfg.get("provider")]):
+                LLMProvider.check_credentials(name)
+        except (FileNotFoundError, ValueError, EnvironmentError, ImportError) as e:
+            raise HTTPError(400, str(e))
+        kwargs["agent_configs"] = agent_configs
+        kwargs["moderator_config"] = moderator_config
+        return kwargs
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            if job.status != "queued":
+                continue
+            job.status = "running"
+            job.started = datetime.now().isoformat(timespec="seconds")
+            self.running += 1
+            job.task = asyncio.create_task(arun_debate(**{**job.kwargs, "display": _JobRenderer(job)}))
+            try:
+                report = await job.task
+            except asyncio.CancelledError:
+                if not job.cancel_requested:
+                    raise  # the server is shutting down; the checkpoint lets the debate be resumed
+                await asyncio.to_thread(discard_checkpoint, job.kwargs["checkpoint"])
+                job.finish("cancelled")
+            except Exception as e:
+                # Kept so the failed debate can be resumed
+                job.finish("failed", error=f"{type(e).__name__}: {e}")
+            else:
+                await asyncio.to_thread(discard_checkpoint, job.kwargs["checkpoint"])
+                job.finish("done", report=report)
+            finally:
+                self.running -= 1
+                self._forget_old()
+
+    def _forget_old(self) -> None:
+        finished = [job for job in self.jobs.values() if job.status in FINISHED]
+        for job in finished[:max(0, len(finished) - self.keep)]:
+            del self.jobs[job.id]
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            try:
+                method, path, query, headers, body = await asyncio.wait_for(_read_request(reader), 30)
+                await self._route(method, path, query, headers, body, writer)
+            except HTTPError as e:
+                await _send_json(writer, e.status, {"error": str(e)}, e.headers)
+            except (ValueError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+                await _send_json(writer, 400, {"error": "Malformed request"})
+        except ConnectionError:
+            pass  # the client went away
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, query: dict, headers: dict, body: bytes, writer) -> None:
+        path = path.rstrip("/") or "/"
+        if path == "/health" and method == "GET":
+            return await _send_json(writer, 200, self.health())
+        if path == "/debates":
+            if method == "POST":
+                try:
+                    params = json.loads(body or b"{}")
+                except json.JSONDecodeError as e:
+                    raise HTTPError(400, f"Invalid JSON: {e}")
+                job = await self.submit(params)
+                return await _send_json(writer, 202, job.summary(), {"Location": f"/debates/{job.id}"})
+            if method == "GET":
+                return await _send_json(writer, 200, [job.summary() for job in reversed(self.jobs.values())])
+            raise HTTPError(405, f"{method} not allowed on {path}")
+
+        match = re.fullmatch(r"/debates/([0-9a-f]+)(/events|/report)?", path)
+        if not match:
+            raise HTTPError(404, f"No such endpoint: {path}")
+        job = self.jobs.get(match.group(1))
+        if job is None:
+            raise HTTPError(404, f"No debate with id {match.group(1)}")
+        resource = match.group(2)
+        if method == "DELETE" and resource is None:
+            self.cancel(job)
+            return await _send_json(writer, 202, job.summary())
+        if method != "GET":
+            raise HTTPError(405, f"{method} not allowed on {path}")
+        if resource is None:
+            return await _send_json(writer, 200, job.summary())
+        if resource == "/report":
+            if not job.report:
+                raise HTTPError(409, f"Debate {job.id} is {job.status}; no report yet")
+            text = await asyncio.to_thread(Path(job.report).read_text, encoding="utf-8")
+            return await _send(writer, 200, text.encode("utf-8"), "text/markdown; charset=utf-8")
+        after = headers.get("last-event-id") or (query.get("after") or [None])[0]
+        await self._stream_events(job, int(after) + 1 if after is not None else 0, writer)
+
+    async def _stream_events(self, job: Job, start: int, writer: asyncio.StreamWriter) -> None:
+        writer.write(_head(200, "text/event-stream", {"Cache-Control": "no-cache"}))
+        next_id = start
+        while True:
+            wakeup = job._wakeup
+            for event_id, event in job.since(next_id):
+                data = json.dumps(event, ensure_ascii=False)
+                writer.write(f"id: {event_id}\nevent: {event['event']}\ndata: {data}\n\n".encode("utf-8"))
+                next_id = event_id + 1
+            await writer.drain()
+            if job.status in FINISHED and next_id >= job._next_id:
+                return
+            try:
+                await asyncio.wait_for(wakeup.wait(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                writer.write(b": keep-alive\n\n")
+
+
+def serve(host: str = "127.0.0.1", port: int = 8000, workers: int = 4, queue_size: int = 100, on_ready=None, **defaults) -> None:
+    """Run a ``DebateServer`` until interrupted."""
+    server = DebateServer(workers=workers, queue_size=queue_size, **defaults)
+    asyncio.run(server.serve(host, port, on_ready=on_ready))
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, dict, dict, bytes]:
+    method, target, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length") or 0)
+    if length > MAX_BODY:
+        raise HTTPError(413, f"Request body larger than {MAX_BODY} bytes")
+    body = await reader.readexactly(length) if length else b""
+    path, _, query = target.partition("?")
+    return method.upper(), path, parse_qs(query), headers, body
+
+
+def _head(status: int, content_type: str, headers: Optional[dict] = None, length: Optional[int] = None) -> bytes:
+    lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}", f"Content-Type: {content_type}", "Connection: close"]
+    if length is not None:
+        lines.append(f"Content-Length: {length}")
+    lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def _send(writer: asyncio.StreamWriter, status: int, body: bytes, content_type: str, headers: Optional[dict] = None) -> None:
+    writer.write(_head(status, content_type, headers, len(body)) + body)
+    await writer.drain()
+
+
+async def _send_json(writer: asyncio.StreamWriter, status: int, data, headers: Optional[dict] = None) -> None:
+    body = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    await _send(writer, status, body, "application/json", headers)
@@ -0,0 +1,236 @@
+"""Searchable archive of finished debates (SQLite with FTS5 full-text search)."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+DEFAULT_PATH = Path(os.environ.get("AGORA_DB", Path.home() / ".local" / "share" / "agora" / "debates.sqlite"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS debates (
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL,
+    created TEXT NOT NULL,
+    rounds INTEGER NOT NULL,
+    provider TEXT NOT NULL,
+    agents TEXT NOT NULL,
+    agent_configs TEXT NOT NULL,
+    scores TEXT NOT NULL,
+    final_consensus REAL,
+    stop_reason TEXT,
+    synthesis TEXT NOT NULL,
+    report TEXT,
+    metrics TEXT,
+    fingerprint TEXT
+);
+CREATE INDEX IF NOT EXISTS debates_created ON debates (created);
+CREATE INDEX IF NOT EXISTS debates_consensus ON debates (final_consensus);
+CREATE TABLE IF NOT EXISTS turns (
+    debate_id INTEGER NOT NULL REFERENCES debates (id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    agent TEXT NOT NULL,
+    text TEXT NOT NULL,
+    usage TEXT,
+    PRIMARY KEY (debate_id, seq)
+);
+CREATE INDEX IF NOT EXISTS turns_agent ON turns (agent COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    path TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    created TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS checkpoints_fingerprint ON checkpoints (fingerprint);
+CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5 (
+    debate_id UNINDEXED, kind UNINDEXED, agent, text, tokenize = 'porter unicode61'
+);
+"""
+
+
+class DebateStore:
+    """Debates with their turns, per-round consensus scores and synthesis.
+
+    The topic, every turn and the synthesis are full-text indexed, so
+    ``search`` finds debates by anything that was said in them. Safe to
+    share between threads.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(SCHEMA)
+            # Archives created before debates were fingerprinted
+            if "fingerprint" not in {row["name"] for row in self._conn.execute("PRAGMA table_info(debates)")}:
+                self._conn.execute("ALTER TABLE debates ADD COLUMN fingerprint TEXT")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS debates_fingerprint ON debates (fingerprint)")
+
+    def add(
+        self,
+        topic: str,
+        agent_configs: list[dict],
+        rounds: int,
+        provider_label: str,
+        history: Iterable[dict],
+        synthesis: str,
+        scores: list[float],
+        stop_reason: Optional[str] = None,
+        metrics: Optional[dict] = None,
+        report: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+    ) -> int:
+        """Archive a finished debate and return its id.
+
+        ``fingerprint`` (see ``agora.debate.debate_fingerprint``) lets
+        ``find_report`` return this debate's report for identical requests.
+        """
+        turns = list(history)
+        agents = list(dict.fromkeys(cfg["name"] for cfg in agent_configs))
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO debates (topic, created, rounds, provider, agents, agent_configs, scores, "
+                "final_consensus, stop_reason, synthesis, report, metrics, fingerprint) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    topic, datetime.now().isoformat(timespec="seconds"), rounds, provider_label,
+                    json.dumps(agents), json.dumps(agent_configs), json.dumps(scores),
+                    scores[-1] if scores else None, stop_reason, synthesis, report,
+                    json.dumps(metrics) if metrics else None, fingerprint,
+                ),
+            )
+            debate_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT INTO turns (debate_id, seq, round, agent, text, usage) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (debate_id, seq, t["round"], t["agent"], t["text"], json.dumps(t["usage"]) if t.get("usage") else None)
+                    for seq, t in enumerate(turns)
+                ],
+            )
+            self._conn.executemany(
+                "INSERT INTO search (debate_id, kind, agent, text) VALUES (?, ?, ?, ?)",
+                [(debate_id, "topic", None, topic)]
+                + [(debate_id, "turn", t["agent"], t["text"]) for t in turns]
+                + [(debate_id, "synthesis", "Moderator", synthesis)],
+            )
+        return debate_id
+
+    def get(self, debate_id: int) -> Optional[dict]:
+        """A debate with its ``turns``, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM debates WHERE id = ?", (debate_id,)).fetchone()
+            if row is None:
+                return None
+            turns = self._conn.execute(
+                "SELECT round, agent, text, usage FROM turns WHERE debate_id = ? ORDER BY seq", (debate_id,)
+            ).fetchall()
+        debate = _debate(row)
+        debate["turns"] = [
+            {"round": t["round"], "agent": t["agent"], "text": t["text"], "usage": json.loads(t["usage"]) if t["usage"] else None}
+            for t in turns
+        ]
+        return debate
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        agent: Optional[str] = None,
+        min_consensus: Optional[float] = None,
+        max_consensus: Optional[float] = None,
+        since: Optional[str] = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        """Debates matching all given filters, best full-text match (else newest) first.
+
+        ``query`` uses FTS5 syntax (words, "phrases", AND/OR/NOT, prefix*);
+        text that is not valid syntax is searched as plain words. ``agent``
+        matches a participant's name case-insensitively; ``since`` is an ISO
+        date. Each result carries a ``snippet`` of the best-matching text.
+        """
+        filters, params = [], []
+        if agent:
+            filters.append("EXISTS (SELECT 1 FROM turns t WHERE t.debate_id = d.id AND t.agent = ? COLLATE NOCASE)")
+            params.append(agent)
+        if min_consensus is not None:
+            filters.append("d.final_consensus >= ?")
+            params.append(min_consensus)
+        if max_consensus is not None:
+            filters.append("d.final_consensus <= ?")
+            params.append(max_consensus)
+        if since:
+            filters.append("d.created >= ?")
+            params.append(since)
+        where = " AND ".join(filters) or "1"
+
+        if not query:
+            sql = f"SELECT d.*, NULL AS snippet FROM debates d WHERE {where} ORDER BY d.created DESC, d.id DESC LIMIT ?"
+            with self._lock:
+                return [_debate(row) for row in self._conn.execute(sql, params + [limit])]
+
+        # The window function keeps SQLite from flattening the FTS query into
+        # the join, where rank and snippet() are not available
+        sql = (
+            "WITH hits AS (SELECT debate_id, rank, snippet(search, 3, '**', '**', '…', 10) AS snippet "
+            "FROM search WHERE search MATCH ?), "
+            "best AS (SELECT *, ROW_NUMBER() OVER (PARTITION BY debate_id ORDER BY rank) AS n FROM hits) "
+            f"SELECT d.*, b.snippet FROM best b JOIN debates d ON d.id = b.debate_id "
+            f"WHERE b.n = 1 AND {where} ORDER BY b.rank LIMIT ?"
+        )
+        with self._lock:
+            try:
+                rows = self._conn.execute(sql, [query] + params + [limit]).fetchall()
+            except sqlite3.OperationalError:
+                rows = self._conn.execute(sql, [_plain_query(query)] + params + [limit]).fetchall()
+        return [_debate(row) for row in rows]
+
+    def add_checkpoint(self, path: str, fingerprint: str) -> None:
+        """Remember that the checkpoint file at ``path`` holds a run of the debate ``fingerprint``."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (path, fingerprint, created) VALUES (?, ?, ?)",
+                (str(Path(path).resolve()), fingerprint, datetime.now().isoformat(timespec="seconds")),
+            )
+
+    def find_report(self, fingerprint: str) -> Optional[str]:
+        """The newest archived report of the debate ``fingerprint`` whose file still exists."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT report FROM debates WHERE fingerprint = ? AND report IS NOT NULL ORDER BY id DESC",
+                (fingerprint,),
+            ).fetchall()
+        return next((row["report"] for row in rows if Path(row["report"]).exists()), None)
+
+    def find_checkpoints(self, fingerprint: str) -> list[str]:
+        """Checkpoint files of runs of the debate ``fingerprint`` that still exist, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path FROM checkpoints WHERE fingerprint = ? ORDER BY created DESC, rowid DESC", (fingerprint,)
+            ).fetchall()
+        return [row["path"] for row in rows if Path(row["path"]).exists()]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _debate(row: sqlite3.Row) -> dict:
+    debate = dict(row)
+    for field in ("agents", "agent_configs", "scores", "metrics"):
+        if debate.get(field) is not None:
+            debate[field] = json.loads(debate[field])
+    return debate
+
+
+def _plain_query(query: str) -> str:
+    """Quote every word so FTS5 operators and punctuation are matched literally."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
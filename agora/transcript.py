@@ -0,0 +1,105 @@
+"""Incrementally built debate transcript shared by agents and the moderator."""
+
+from __future__ import annotations
+
+import threading
+from typing import Iterable, Iterator, Union
+
+
+def format_turn(entry: dict) -> str:
+    """Format one history entry the way it appears in prompts."""
+    return f"[Round {entry['round']}] {entry['agent']}:\n{entry['text']}\n\n"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English)."""
+    return len(text) // 4
+
+
+class Transcript:
+    """Append-only debate history that formats every turn exactly once.
+
+    Behaves like the plain ``list[dict]`` history it replaces (iteration,
+    ``len``, indexing, ``append``) while keeping each turn's formatted
+    segment and the accumulated transcript text, so building a prompt no
+    longer re-formats the whole debate.
+
+    Older rounds can be replaced by a summary with ``summarize``; prompts
+    then use ``prompt_segments``/``prompt_text`` while ``entries`` keeps
+    every turn for the report.
+    """
+
+    def __init__(self, entries: Iterable[dict] = ()):
+        self.entries: list[dict] = []
+        self.segments: list[str] = []
+        self.summaries: dict[int, str] = {}
+        self._by_round: dict[int, list[dict]] = {}
+        self._segments_by_round: dict[int, list[str]] = {}
+        self._summary_segments: dict[int, str] = {}
+        self._text = ""
+        self._joined = 0
+        self._lock = threading.Lock()
+        for entry in entries:
+            self.append(entry)
+
+    @classmethod
+    def of(cls, history: Union["Transcript", list[dict]]) -> "Transcript":
+        """Return ``history`` itself if it already is a Transcript, else wrap it."""
+        return history if isinstance(history, cls) else cls(history)
+
+    def append(self, entry: dict) -> None:
+        """Add a turn ({round, agent, text})."""
+        segment = format_turn(entry)
+        self.entries.append(entry)
+        self.segments.append(segment)
+        self._by_round.setdefault(entry["round"], []).append(entry)
+        self._segments_by_round.setdefault(entry["round"], []).append(segment)
+
+    def summarize(self, round_num: int, summary: str) -> None:
+        """Stand in ``summary`` for all turns of ``round_num`` in prompts."""
+        self.summaries[round_num] = summary
+        self._summary_segments[round_num] = f"[Round {round_num} summary]\n{summary}\n\n"
+
+    @property
+    def text(self) -> str:
+        """The full formatted transcript. Only newly appended turns are joined."""
+        with self._lock:
+            if self._joined < len(self.segments):
+                self._text += "".join(self.segments[self._joined:])
+                self._joined = len(self.segments)
+            return self._text
+
+    def prompt_segments(self) -> list[str]:
+        """Segments to show the agents: summaries for compacted rounds, turns otherwise."""
+        if not self.summaries:
+            return self.segments
+        segments = []
+        for round_num, round_segments in self._segments_by_round.items():
+            if round_num in self._summary_segments:
+                segments.append(self._summary_segments[round_num])
+            else:
+                segments.extend(round_segments)
+        return segments
+
+    def prompt_text(self) -> str:
+        """Joined ``prompt_segments``; the cached full text while nothing is summarized."""
+        if not self.summaries:
+            return self.text
+        return "".join(self.prompt_segments())
+
+    def rounds(self) -> list[int]:
+        """Round numbers with at least one turn, in order."""
+        return list(self._by_round)
+
+    def round(self, round_num: int) -> list[dict]:
+        """All entries of one round, in speaking order."""
+        return self._by_round.get(round_num, [])
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, index):
+        return self.entries[index]
@@ -34,7 +34,9 @@ setup(
         "openai": ["openai>=1.0.0"],
         "gemini": ["google-generativeai>=0.3.0"],
         "grok": ["openai>=1.0.0"],
-        "all": ["openai>=1.0.0", "google-generativeai>=0.3.0"],
+        "fast": ["numpy>=1.21"],
+        "semantic": ["numpy>=1.21", "sentence-transformers>=2.2"],
+        "all": ["openai>=1.0.0", "google-generativeai>=0.3.0", "numpy>=1.21"],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,109 @@
+"""Tests for recording and replaying provider responses, against the mock provider."""
+
+import asyncio
+
+import pytest
+from click.testing import CliRunner
+
+from agora.cli import cli
+from agora.debate import run_debate
+from agora.personas import make_neutral_agents
+from agora.providers import base, cache
+from agora.providers.base import LLMProvider
+from agora.providers.cache import CacheMiss, CachingProvider, ResponseStore
+from agora.providers.mock import MockProvider
+
+SYSTEM = "You are a debater."
+MESSAGES = [{"role": "user", "content": "Should cities ban cars from their centers?"}]
+
+
+class Counting(MockProvider):
+    """A backend that counts the calls made to it."""
+
+    def __init__(self, model=None, **settings):
+        super().__init__(model, tokens=20, **settings)
+        self.calls = 0
+
+    def _response(self, *args):
+        self.calls += 1
+        return super()._response(*args)
+
+
+@pytest.fixture
+def responses(tmp_path):
+    return ResponseStore(tmp_path / "responses.sqlite")
+
+
+def cached(mode: str, responses: ResponseStore, inner=None) -> CachingProvider:
+    return CachingProvider(inner or Counting(), "mock", mode, store=responses)
+
+
+def test_replay_gives_the_recorded_output(responses):
+    recorder = cached("record", responses)
+    streamed = list(recorder.stream(SYSTEM, MESSAGES))
+    replayer = cached("replay", responses)
+    assert list(replayer.stream(SYSTEM, MESSAGES)) == streamed
+    assert replayer.complete(SYSTEM, MESSAGES) == "".join(streamed)
+    assert replayer.inner.calls == 0
+    assert LLMProvider.last_usage()["cost_usd"] == 0.0
+
+
+def test_async_replay_gives_the_recorded_output(responses):
+    text = cached("record", responses).complete(SYSTEM, MESSAGES)
+    replayer = cached("replay", responses)
+
+    async def run():
+        return "".join([chunk async for chunk in replayer.astream(SYSTEM, MESSAGES)])
+
+    assert asyncio.run(run()) == text
+    assert asyncio.run(replayer.acomplete(SYSTEM, MESSAGES)) == text
+    assert replayer.inner.calls == 0
+
+
+def test_replay_miss_raises(responses):
+    cached("record", responses).complete(SYSTEM, MESSAGES)
+    # Another model's answers are not replayed for this one
+    with pytest.raises(CacheMiss):
+        cached("replay", responses, Counting("other")).complete(SYSTEM, MESSAGES)
+    with pytest.raises(CacheMiss):
+        list(cached("replay", responses).stream(SYSTEM, MESSAGES + [{"role": "user", "content": "And suburbs?"}]))
+
+
+def test_auto_records_misses_and_replays_hits(responses):
+    provider = cached("auto", responses)
+    first = provider.complete(SYSTEM, MESSAGES)
+    assert provider.complete(SYSTEM, MESSAGES) == first
+    assert provider.inner.calls == 1
+
+
+def test_record_always_calls_the_provider(responses):
+    provider = cached("record", responses)
+    provider.complete(SYSTEM, MESSAGES)
+    provider.complete(SYSTEM, MESSAGES)
+    assert provider.inner.calls == 2
+
+
+def test_replayed_debate_matches_the_recorded_one(tmp_path, responses):
+    def debate(mode: str) -> list[str]:
+        report = run_debate(
+            "Should cities ban cars from their centers?", make_neutral_agents(3), rounds=2, provider_name="mock",
+            output_dir=str(tmp_path / mode), provider=cached(mode, responses), display="none", archive=False,
+        )
+        with open(report, encoding="utf-8") as f:
+            body = f.read().split("# Metrics")[0]
+        # Without the date and timings
+        return [line for line in body.splitlines() if not line.startswith("**Date:**")]
+
+    assert debate("record") == debate("replay")
+
+
+def test_cli_replay_miss_is_one_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(base, "_registry", {})
+    result = CliRunner().invoke(cli, [
+        "run", "--topic", "Should cities ban cars?", "--provider", "mock", "--rounds", "1", "--cache", "replay",
+        "--no-archive", "--format", "plain", "--output", str(tmp_path / "reports"),
+    ])
+    assert result.exit_code == 1
+    assert "No recorded response for this request (mock/mock). Re-record the debate with --cache auto." in result.output
+    assert "agora resume" not in result.output
@@ -0,0 +1,69 @@
+"""Tests that an interrupted debate resumes from its checkpoint, against the mock provider."""
+
+import pytest
+
+from agora.checkpoint import load_checkpoint
+from agora.debate import resume_debate, run_debate
+from agora.personas import make_neutral_agents
+from agora.providers.mock import MockProvider
+
+
+class Interrupted(MockProvider):
+    """A backend that is interrupted (like by Ctrl-C) on its ``at``-th call."""
+
+    def __init__(self, at: int, **settings):
+        super().__init__(tokens=20, **settings)
+        self.at = at
+        self.calls = 0
+
+    def _response(self, *args):
+        self.calls += 1
+        if self.calls == self.at:
+            raise KeyboardInterrupt
+        return super()._response(*args)
+
+
+def debate(output_dir, provider, **options) -> str:
+    return run_debate(
+        "Should cities ban cars from their centers?", make_neutral_agents(3), rounds=3,
+        provider_name="mock", output_dir=str(output_dir), provider=provider, display="none",
+        archive=False, **options,
+    )
+
+
+def transcript(checkpoint) -> list[tuple]:
+    return [(turn["round"], turn["agent"], turn["text"]) for turn in load_checkpoint(str(checkpoint))["history"]]
+
+
+def report_body(path: str) -> list[str]:
+    """The report without its date and timings."""
+    with open(path, encoding="utf-8") as f:
+        body = f.read().split("# Metrics")[0]
+    return [line for line in body.splitlines() if not line.startswith("**Date:**")]
+
+
+@pytest.mark.parametrize("stream", [True, False])
+def test_resume_after_interruption_gives_the_same_debate(tmp_path, stream):
+    expected = debate(tmp_path / "full", MockProvider(tokens=20), stream=stream, checkpoint=str(tmp_path / "full.json"))
+
+    checkpoint = tmp_path / "cut.json"
+    with pytest.raises(KeyboardInterrupt):
+        debate(tmp_path / "cut", Interrupted(at=5), stream=stream, checkpoint=str(checkpoint))
+    state = load_checkpoint(str(checkpoint))
+    assert state["status"] == "running"
+    assert len(state["history"]) == 4
+
+    resumed = Interrupted(at=0)
+    report = resume_debate(str(checkpoint), provider=resumed)
+    # Only the five turns left and the synthesis are asked for
+    assert resumed.calls == 6
+    assert transcript(checkpoint) == transcript(tmp_path / "full.json")
+    assert report_body(report) == report_body(expected)
+
+
+def test_resuming_a_finished_debate_returns_its_report(tmp_path):
+    checkpoint = str(tmp_path / "debate.json")
+    report = debate(tmp_path, MockProvider(tokens=20), checkpoint=checkpoint)
+    provider = Interrupted(at=0)
+    assert resume_debate(checkpoint, provider=provider) == report
+    assert provider.calls == 0
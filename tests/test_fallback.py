@@ -0,0 +1,124 @@
+"""Tests for failover and hedging in FallbackProvider, against the mock provider."""
+
+import asyncio
+import time
+
+import pytest
+
+from agora.providers import ratelimit
+from agora.providers.base import LLMProvider
+from agora.providers.fallback import FallbackProvider
+from agora.providers.mock import MockAPIError, MockProvider
+
+SYSTEM = "You are a debater."
+MESSAGES = [{"role": "user", "content": "Should cities ban cars from their centers?"}]
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    # Two attempts, 0.2s apart, so failures are quick and their timing is predictable
+    monkeypatch.setattr(ratelimit, "MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(ratelimit, "BACKOFF_BASE", 0.2)
+    monkeypatch.setattr(ratelimit.random, "uniform", lambda low, high: high)
+
+
+def fallback(*backends: MockProvider, hedge_after=None) -> FallbackProvider:
+    return FallbackProvider([("mock", backend) for backend in backends], hedge_after=hedge_after)
+
+
+def expected(model: str, **settings) -> str:
+    return MockProvider(model, **settings).complete(SYSTEM, MESSAGES)
+
+
+def test_fails_over_on_retryable_error():
+    provider = fallback(MockProvider("down", error_rate=1), MockProvider("up", tokens=20))
+    text = provider.complete(SYSTEM, MESSAGES)
+    assert LLMProvider.last_usage()["backend"] == "mock/up"
+    assert text == expected("up", tokens=20)
+
+
+def test_stream_fails_over_on_retryable_error():
+    provider = fallback(MockProvider("down", error_rate=1), MockProvider("up", tokens=20))
+    text = "".join(provider.stream(SYSTEM, MESSAGES))
+    assert LLMProvider.last_usage()["backend"] == "mock/up"
+    assert text == expected("up", tokens=20)
+
+
+def test_async_fails_over_on_retryable_error():
+    provider = fallback(MockProvider("down", error_rate=1), MockProvider("up", tokens=20))
+
+    async def run():
+        return "".join([chunk async for chunk in provider.astream(SYSTEM, MESSAGES)])
+
+    assert asyncio.run(run()) == expected("up", tokens=20)
+    assert asyncio.run(provider.acomplete(SYSTEM, MESSAGES)) == expected("up", tokens=20)
+
+
+def test_raises_last_error_when_every_backend_fails():
+    provider = fallback(MockProvider("a", error_rate=1), MockProvider("b", error_rate=1))
+    with pytest.raises(MockAPIError):
+        provider.complete(SYSTEM, MESSAGES)
+
+
+def test_hedge_picks_the_first_backend_to_answer():
+    provider = fallback(MockProvider("slow", ttft=2, tokens=20), MockProvider("fast", tokens=20), hedge_after=0.05)
+    started = time.monotonic()
+    text = "".join(provider.stream(SYSTEM, MESSAGES))
+    assert time.monotonic() - started < 1
+    usage = LLMProvider.last_usage()
+    assert usage["backend"] == "mock/fast"
+    assert usage["ttft"] >= 0.05
+    assert text == expected("fast", tokens=20)
+
+
+def test_hedge_complete_picks_the_first_backend_to_answer():
+    provider = fallback(MockProvider("slow", latency=2, tokens=20), MockProvider("fast", tokens=20), hedge_after=0.05)
+    started = time.monotonic()
+    text = provider.complete(SYSTEM, MESSAGES)
+    assert time.monotonic() - started < 1
+    assert LLMProvider.last_usage()["backend"] == "mock/fast"
+    assert text == expected("fast", tokens=20)
+
+
+def test_loser_error_after_winner_is_chosen_is_ignored():
+    # "flaky" fails for good 0.2s in, while "steady" (hedged in at 0.05s) is mid-stream
+    provider = fallback(
+        MockProvider("flaky", error_rate=1), MockProvider("steady", tokens=30, chunk_rate=100), hedge_after=0.05
+    )
+    text = "".join(provider.stream(SYSTEM, MESSAGES))
+    assert LLMProvider.last_usage()["backend"] == "mock/steady"
+    assert text == expected("steady", tokens=30)
+
+
+def test_async_loser_error_after_winner_is_chosen_is_ignored():
+    provider = fallback(
+        MockProvider("flaky", error_rate=1), MockProvider("steady", tokens=30, chunk_rate=100), hedge_after=0.05
+    )
+
+    async def run():
+        return "".join([chunk async for chunk in provider.astream(SYSTEM, MESSAGES)])
+
+    assert asyncio.run(run()) == expected("steady", tokens=30)
+
+
+def test_winner_breaking_mid_stream_is_fatal():
+    provider = fallback(MockProvider("broken", tokens=10, stream_error_rate=1), MockProvider("spare", tokens=10))
+    chunks = []
+    with pytest.raises(MockAPIError):
+        for chunk in provider.stream(SYSTEM, MESSAGES):
+            chunks.append(chunk)
+    # Text already shown cannot be replaced by another backend's answer
+    assert len(chunks) == 5
+
+
+def test_async_winner_breaking_mid_stream_is_fatal():
+    provider = fallback(MockProvider("broken", tokens=10, stream_error_rate=1), MockProvider("spare", tokens=10))
+    chunks = []
+
+    async def run():
+        async for chunk in provider.astream(SYSTEM, MESSAGES):
+            chunks.append(chunk)
+
+    with pytest.raises(MockAPIError):
+        asyncio.run(run())
+    assert len(chunks) == 5
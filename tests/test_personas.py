@@ -0,0 +1,39 @@
+"""Tests for loading persona presets."""
+
+import pytest
+
+from agora.personas import load_preset, resolve_participants
+
+PRESET = """\
+name: "Local panel"
+agents:
+  - name: "Optimist"
+    role: "Sees the upside."
+  - name: "Pessimist"
+    role: "Sees the downside."
+"""
+
+
+@pytest.fixture
+def preset_file(tmp_path):
+    path = tmp_path / "panel.yaml"
+    path.write_text(PRESET, encoding="utf-8")
+    return str(path)
+
+
+def test_paths_are_loaded_only_when_allowed(preset_file):
+    assert load_preset(preset_file, allow_paths=True)["name"] == "Local panel"
+    with pytest.raises(FileNotFoundError):
+        load_preset(preset_file)
+
+
+def test_resolve_participants_rejects_paths_by_default(preset_file):
+    agents, _ = resolve_participants(preset_file, "3", allow_paths=True)
+    assert [agent["name"] for agent in agents] == ["Optimist", "Pessimist"]
+    for name in (preset_file, "../../" + preset_file):
+        with pytest.raises(FileNotFoundError):
+            resolve_participants(name, "3")
+
+
+def test_registry_names_still_load():
+    assert load_preset("neutral")["agents"]
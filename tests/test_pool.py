@@ -0,0 +1,21 @@
+"""Tests for sharing provider instances between debate participants."""
+
+from agora.providers.base import LLMProvider
+from agora.providers.mock import DEFAULT_MODEL
+from agora.providers.pool import ProviderPool
+
+
+def test_default_model_shares_the_default_instance():
+    default = LLMProvider.resolve("mock")
+    pool = ProviderPool(default, "mock")
+    assert pool.get("mock") is default
+    assert pool.get("MOCK", DEFAULT_MODEL) is default
+    assert pool.get(model=DEFAULT_MODEL) is default
+
+
+def test_other_models_get_their_own_instance():
+    pool = ProviderPool(LLMProvider.resolve("mock"), "mock")
+    other = pool.get("mock", "mock-large")
+    assert other is not pool.default
+    assert pool.get("mock", "mock-large") is other
+    assert pool.label("mock", "mock-large") == "mock/mock-large"
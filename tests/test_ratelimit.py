@@ -0,0 +1,170 @@
+"""Tests for the shared rate limiter and retry helpers."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from agora.providers import ratelimit
+from agora.providers.base import LLMProvider
+from agora.providers.ratelimit import (
+    RateLimiter, _Bucket, is_retryable, retry_after, stream_with_retry,
+)
+
+
+class APIError(Exception):
+    def __init__(self, message: str = "boom", status_code=None, headers=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    slept = []
+    monkeypatch.setattr(ratelimit.time, "sleep", slept.append)
+    monkeypatch.setattr(ratelimit.random, "uniform", lambda low, high: 0.0)
+    return slept
+
+
+def test_bucket_starts_full_and_waits_for_refill():
+    bucket = _Bucket(60)
+    assert bucket.reserve(60, bucket.updated) == 0.0
+    assert bucket.reserve(1, bucket.updated) == pytest.approx(1.0)
+    # Refilled at one per second
+    assert bucket.reserve(1, bucket.updated + 2) == pytest.approx(0.0)
+
+
+def test_bucket_caps_oversized_requests():
+    bucket = _Bucket(60)
+    assert bucket.reserve(1000, bucket.updated) == 0.0
+    assert bucket.reserve(30, bucket.updated) == pytest.approx(30.0)
+
+
+def test_bucket_settle_refunds_unused_reservation():
+    bucket = _Bucket(60)
+    bucket.reserve(60, bucket.updated)
+    bucket.settle(60, 10)
+    assert bucket.reserve(50, bucket.updated) == 0.0
+
+
+def test_limits_are_opt_in(monkeypatch):
+    monkeypatch.setattr(ratelimit, "_limiters", {})
+    monkeypatch.delenv("AGORA_ANTHROPIC_RPM", raising=False)
+    monkeypatch.delenv("AGORA_ANTHROPIC_TPM", raising=False)
+    limiter = ratelimit.get_limiter("anthropic")
+    assert all(limiter.reserve(1_000_000) == 0.0 for _ in range(1000))
+
+
+def test_limits_from_environment(monkeypatch):
+    monkeypatch.setattr(ratelimit, "_limiters", {})
+    monkeypatch.setenv("AGORA_OPENAI_RPM", "60")
+    limiter = ratelimit.get_limiter("openai")
+    for _ in range(60):
+        limiter.reserve()
+    assert limiter.reserve() == pytest.approx(1.0, abs=0.05)
+
+
+@pytest.mark.parametrize("error, expected", [
+    (APIError(status_code=429), True),
+    (APIError(status_code=529), True),
+    (APIError(status_code=503), True),
+    (APIError(status_code=400), False),
+    (APIError(status_code=401), False),
+    (type("ReadTimeout", (Exception,), {})(), True),
+    (type("APIConnectionError", (Exception,), {})(), True),
+    (Exception("Rate limit exceeded"), True),
+    (Exception("Model is overloaded"), True),
+    (ValueError("bad prompt"), False),
+])
+def test_is_retryable(error, expected):
+    assert is_retryable(error) is expected
+
+
+def test_retry_after_headers():
+    assert retry_after(APIError(headers={"retry-after": "7"})) == 7.0
+    assert retry_after(APIError(headers={"retry-after-ms": "1500", "retry-after": "7"})) == 1.5
+    assert retry_after(APIError(headers={"retry-after": "soon"})) is None
+    assert retry_after(APIError()) is None
+    assert retry_after(Exception()) is None
+
+
+def test_retry_after_http_date_in_the_past():
+    assert retry_after(APIError(headers={"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+
+
+def test_stream_retries_before_first_chunk(no_sleep):
+    attempts = []
+
+    def stream(attempt):
+        attempts.append(attempt)
+        if attempt < 2:
+            raise APIError(status_code=503)
+        yield from ["a", "b"]
+
+    assert list(stream_with_retry(RateLimiter(), 0, stream)) == ["a", "b"]
+    assert attempts == [0, 1, 2]
+    assert len(no_sleep) == 2
+
+
+def test_stream_does_not_retry_after_output():
+    attempts = []
+
+    def stream(attempt):
+        attempts.append(attempt)
+        yield "a"
+        raise APIError(status_code=503)
+
+    chunks = []
+    with pytest.raises(APIError):
+        for chunk in stream_with_retry(RateLimiter(), 0, stream):
+            chunks.append(chunk)
+    assert chunks == ["a"] and attempts == [0]
+
+
+def test_stream_does_not_retry_client_errors():
+    def stream(attempt):
+        raise APIError(status_code=400)
+        yield
+
+    with pytest.raises(APIError):
+        list(stream_with_retry(RateLimiter(), 0, stream))
+
+
+def test_stream_gives_up_after_max_attempts():
+    attempts = []
+
+    def stream(attempt):
+        attempts.append(attempt)
+        raise APIError(status_code=503)
+        yield
+
+    with pytest.raises(APIError):
+        list(stream_with_retry(RateLimiter(), 0, stream))
+    assert len(attempts) == ratelimit.MAX_ATTEMPTS
+
+
+def test_stream_rate_limit_pauses_limiter(no_sleep):
+    limiter = RateLimiter()
+
+    def stream(attempt):
+        if attempt == 0:
+            raise APIError(status_code=429, headers={"retry-after": "30"})
+        yield "a"
+
+    # The retry itself waits out the pause
+    assert list(stream_with_retry(limiter, 0, stream)) == ["a"]
+    assert no_sleep[0] == 30.0
+    assert limiter.reserve() > 0
+
+
+def test_stream_charges_only_uncached_tokens():
+    limiter = RateLimiter(tokens_per_minute=1000)
+
+    def stream(attempt):
+        yield "a"
+        LLMProvider._record_usage(input_tokens=1000, cache_read_tokens=900)
+
+    list(stream_with_retry(limiter, 1000, stream))
+    # 900 of the 1000 reserved tokens came from the cache
+    assert limiter.reserve(900) == 0.0
+    assert limiter.reserve(100) > 0
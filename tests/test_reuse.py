@@ -0,0 +1,79 @@
+"""Tests that ``reuse`` answers repeated debates from the archive, against the mock provider."""
+
+import pytest
+
+from agora import store
+from agora.debate import run_debate
+from agora.personas import make_neutral_agents
+from agora.providers.mock import MockProvider
+
+TOPIC = "Should cities ban cars from their centers?"
+
+
+class Counting(MockProvider):
+    """A backend that counts the calls made to it."""
+
+    def __init__(self, **settings):
+        super().__init__(tokens=20, **settings)
+        self.calls = 0
+
+    def _response(self, *args):
+        self.calls += 1
+        return super()._response(*args)
+
+
+class Interrupted(Counting):
+    """A backend that is interrupted (like by Ctrl-C) on its ``at``-th call."""
+
+    def __init__(self, at: int, **settings):
+        super().__init__(**settings)
+        self.at = at
+
+    def _response(self, *args):
+        if self.calls + 1 == self.at:
+            raise KeyboardInterrupt
+        return super()._response(*args)
+
+
+@pytest.fixture(autouse=True)
+def archive(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "DEFAULT_PATH", tmp_path / "debates.sqlite")
+
+
+def debate(output_dir, provider, topic=TOPIC, **options) -> str:
+    return run_debate(
+        topic, make_neutral_agents(3), rounds=2, provider_name="mock", output_dir=str(output_dir),
+        provider=provider, display="none", **options,
+    )
+
+
+def test_reuse_returns_the_earlier_report_without_calls(tmp_path):
+    report = debate(tmp_path / "first", Counting())
+    provider = Counting()
+    # Topics are compared after normalizing case, whitespace and punctuation
+    assert debate(tmp_path / "second", provider, topic="should cities  ban cars from their centers", reuse=True) == report
+    assert provider.calls == 0
+    assert not (tmp_path / "second").exists()
+
+
+def test_reuse_runs_a_debate_that_differs(tmp_path):
+    report = debate(tmp_path / "first", Counting())
+    provider = Counting()
+    assert debate(tmp_path / "second", provider, reuse=True, history_window=1) != report
+    assert provider.calls == 7
+
+
+def test_without_reuse_the_debate_runs_again(tmp_path):
+    report = debate(tmp_path / "first", Counting())
+    provider = Counting()
+    assert debate(tmp_path / "second", provider) != report
+    assert provider.calls == 7
+
+
+def test_reuse_continues_an_unfinished_run(tmp_path):
+    with pytest.raises(KeyboardInterrupt):
+        debate(tmp_path / "first", Interrupted(at=4), checkpoint=str(tmp_path / "first.json"))
+    provider = Counting()
+    debate(tmp_path / "second", provider, reuse=True, checkpoint=str(tmp_path / "second.json"))
+    # Only the three turns the first run did not finish and the synthesis are asked for
+    assert provider.calls == 4
@@ -0,0 +1,97 @@
+"""Tests for the debate archive and its search filters, against the mock provider."""
+
+import json
+from contextlib import closing
+
+import pytest
+from click.testing import CliRunner
+
+from agora import store
+from agora.cli import cli
+from agora.debate import run_debate
+from agora.personas import make_neutral_agents
+from agora.providers.mock import MockProvider
+from agora.store import DebateStore
+
+
+def agents(*names: str) -> list[dict]:
+    return [{"name": name, "persona": f"You are {name}."} for name in names]
+
+
+def turns(*speakers: tuple[str, str]) -> list[dict]:
+    return [{"round": 1, "agent": agent, "text": text} for agent, text in speakers]
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    path = tmp_path / "debates.sqlite"
+    monkeypatch.setattr(store, "DEFAULT_PATH", path)
+    with closing(DebateStore(path)) as db:
+        db.add(
+            "Should cities ban cars?", agents("Urbanist", "Driver"), 1, "mock/mock",
+            turns(("Urbanist", "Bike lanes make streets safer."), ("Driver", "Deliveries need roads.")),
+            "They agree on delivery zones.", [0.8],
+        )
+        db.add(
+            "Is nuclear power green?", agents("Physicist", "Activist"), 1, "mock/mock",
+            turns(("Physicist", "Reactors emit almost no carbon."), ("Activist", "Waste lasts for millennia.")),
+            "They disagree on waste.", [0.2],
+        )
+    return path
+
+
+def topics(results: list[dict]) -> list[str]:
+    return [debate["topic"] for debate in results]
+
+
+def test_search_filters(archive):
+    with closing(DebateStore(archive)) as db:
+        assert topics(db.search()) == ["Is nuclear power green?", "Should cities ban cars?"]
+        assert topics(db.search("bike")) == ["Should cities ban cars?"]
+        assert topics(db.search('"almost no carbon"')) == ["Is nuclear power green?"]
+        assert topics(db.search(agent="activist")) == ["Is nuclear power green?"]
+        assert topics(db.search(min_consensus=0.5)) == ["Should cities ban cars?"]
+        assert topics(db.search(max_consensus=0.5)) == ["Is nuclear power green?"]
+        assert topics(db.search("waste", agent="Driver")) == []
+        assert len(db.search(since="2000-01-01")) == 2
+        assert db.search(since="2999-01-01") == []
+        assert db.search(limit=1)[0]["topic"] == "Is nuclear power green?"
+
+
+def test_search_treats_invalid_syntax_as_words(archive):
+    with closing(DebateStore(archive)) as db:
+        assert topics(db.search('lanes "make')) == ["Should cities ban cars?"]
+
+
+def test_search_snippet_marks_the_match(archive):
+    with closing(DebateStore(archive)) as db:
+        assert "**Reactors**" in db.search("reactors")[0]["snippet"]
+
+
+def test_finished_debates_are_archived(archive, tmp_path):
+    run_debate(
+        "Should schools ban phones?", make_neutral_agents(3), rounds=2, provider_name="mock",
+        output_dir=str(tmp_path), provider=MockProvider(tokens=20), display="none",
+    )
+    with closing(DebateStore(archive)) as db:
+        (found,) = db.search("phones")
+        debate = db.get(found["id"])
+    assert debate["topic"] == "Should schools ban phones?"
+    assert [turn["agent"] for turn in debate["turns"]] == ["Agent 1", "Agent 2", "Agent 3"] * 2
+    assert debate["final_consensus"] == debate["scores"][-1]
+
+
+def test_cli_search_and_show(archive):
+    runner = CliRunner()
+    result = runner.invoke(cli, ["search", "--agent", "urbanist", "--format", "json", "--db", str(archive)])
+    assert result.exit_code == 0
+    (found,) = json.loads(result.output)
+    assert found["topic"] == "Should cities ban cars?"
+
+    result = runner.invoke(cli, ["show", str(found["id"]), "--format", "markdown", "--db", str(archive)])
+    assert result.exit_code == 0
+    assert "Bike lanes make streets safer." in result.output
+    assert "They agree on delivery zones." in result.output
+
+    result = runner.invoke(cli, ["show", "99", "--db", str(archive)])
+    assert result.exit_code == 1
@@ -0,0 +1,64 @@
+"""Tests that per-turn usage and metrics only count what each call reported."""
+
+import asyncio
+import json
+
+import pytest
+
+from agora.agent import Agent
+from agora.debate import arun_debate, run_debate
+from agora.personas import make_neutral_agents
+from agora.providers.base import LLMProvider
+from agora.providers.mock import MockProvider
+
+
+class FirstCallOnly(MockProvider):
+    """A backend that reports usage for its first call and nothing afterwards."""
+
+    def __init__(self, **settings):
+        super().__init__(tokens=20, **settings)
+        self.calls = 0
+
+    def _record(self, *args, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            super()._record(*args, **kwargs)
+
+
+def metrics(report: str) -> dict:
+    with open(report.replace(".md", ".metrics.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("stream", [True, False])
+def test_calls_without_usage_count_no_tokens(tmp_path, stream):
+    provider = FirstCallOnly()
+    report = run_debate(
+        "Usage test", make_neutral_agents(3), rounds=2, output_dir=str(tmp_path), stream=stream,
+        provider=provider, display="none", archive=False,
+    )
+    turns = metrics(report)["turns"]
+    assert provider.calls == 7
+    assert [bool(turn["input_tokens"]) for turn in turns] == [True] + [False] * 5
+    assert metrics(report)["totals"]["input_tokens"] == turns[0]["input_tokens"]
+
+
+def test_async_calls_without_usage_count_no_tokens(tmp_path):
+    provider = FirstCallOnly()
+    report = asyncio.run(arun_debate(
+        "Usage test", make_neutral_agents(3), rounds=2, output_dir=str(tmp_path), parallel=True,
+        provider=provider, display="none", archive=False,
+    ))
+    totals = metrics(report)["totals"]
+    assert totals["calls"] == 7
+    assert totals["input_tokens"] == max(turn["input_tokens"] for turn in metrics(report)["turns"])
+
+
+def test_usage_does_not_leak_between_calls_in_a_thread():
+    MockProvider(tokens=5).complete("system", [{"role": "user", "content": "hello"}])
+    assert LLMProvider.last_usage() is not None
+    agent_provider = FirstCallOnly()
+    agent_provider.calls = 1
+    agent = Agent("Skeptic", "Doubts everything.", provider=agent_provider)
+    agent.respond("Topic", 1, 1, [])
+    assert agent.last_usage is None